@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+ForceWeaver Replay Benchmark
+Replays a cassette recorded with FORCEWEAVER_RECORD through the client, so
+changes to response handling can be measured against real traffic offline.
+
+Two passes are run over the recorded calls:
+
+* trace: each call starts at its recorded offset (scaled by --speed) and is
+  answered after its recorded time, reproducing the original concurrency
+* instant: calls run back to back with no replayed delay, so the time per
+  call is the client's own overhead - decoding, processing and formatting
+
+    FORCEWEAVER_RECORD=calls.jsonl.gz forceweaver-mcp   # record a session
+    python benchmarks/replay_benchmark.py calls.jsonl.gz --speed 10
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.cassette import ReplayTransport
+from forceweaver_mcp_server.exceptions import ForceWeaverError
+
+API_PREFIX = "/api/v1.0/"
+
+
+async def replay(entry: Dict[str, Any], client: ForceWeaverMCPClient) -> bool:
+    """Repeat one recorded call through the client; False if it raised"""
+    path, _, query = entry["target"].partition("?")
+    endpoint = path[len(API_PREFIX) :]
+    params = dict(entry.get("request") or {}, forceweaver_api_key="fk_replay")
+    call = client.call_mcp_api if "format=mcp" in query else client.call_mcp_api_json
+    try:
+        await call(endpoint, method=entry["method"], **params)
+    except ForceWeaverError:
+        # Recorded failures replay as failures; they're still timed
+        return False
+    return True
+
+
+async def run(
+    name: str, path: str, speed: float, entries: List[Dict[str, Any]], trace: bool
+) -> Dict[str, Any]:
+    """Replay every entry, at recorded offsets if trace, else back to back"""
+    client = ForceWeaverMCPClient(transport=ReplayTransport(path, speed=speed))
+    latencies: List[float] = []
+    failures = 0
+
+    async def timed(entry: Dict[str, Any]) -> None:
+        nonlocal failures
+        if trace and speed > 0:
+            await asyncio.sleep(entry["offset"] / speed)
+        started = time.perf_counter()
+        failures += not await replay(entry, client)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    try:
+        if trace:
+            await asyncio.gather(*(timed(entry) for entry in entries))
+        else:
+            for entry in entries:
+                await timed(entry)
+    finally:
+        await client.close()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "pass": name,
+        "calls": len(entries),
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p95_ms": round(latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000, 3),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("cassette", help="Cassette file (.jsonl or .jsonl.gz)")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    entries = ReplayTransport(args.cassette).entries
+    if not entries:
+        parser.error("the cassette has no recorded calls")
+
+    print(json.dumps(await run("trace", args.cassette, args.speed, entries, True)))
+    print(
+        json.dumps(await run("instant", args.cassette, 0, entries * args.repeat, False))
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
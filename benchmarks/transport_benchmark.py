@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+ForceWeaver Transport Benchmark
+Compares the aiohttp (HTTP/1.1) and httpx (HTTP/2) transports by running
+concurrent health checks against a local stand-in for the ForceWeaver API.
+
+The stand-in is served by hypercorn, which speaks HTTP/1.1 and cleartext
+HTTP/2 on the same port, and answers each check after a fixed delay to
+mimic backend latency. Cleartext keeps the setup self-contained; against
+the real API each extra connection also pays a TLS handshake.
+
+    pip install 'forceweaver-mcp-server[bench]'
+    python benchmarks/transport_benchmark.py --calls 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Set
+
+import aiohttp
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.server import USER_AGENT
+from forceweaver_mcp_server.transport import (
+    AiohttpTransport,
+    HttpxTransport,
+    Transport,
+)
+
+
+class StandIn:
+    """ASGI app answering health checks and counting client connections"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections: Set[Any] = set()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        self.connections.add(tuple(scope["client"]))
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+
+        await asyncio.sleep(self.latency)
+        org_id = json.loads(body or b"{}").get("org_id", "unknown")
+        payload = json.dumps(
+            {"success": True, "formatted_output": f"Report for {org_id}"}
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+async def run(
+    name: str, transport: Transport, url: str, app: StandIn, calls: int
+) -> Dict[str, Any]:
+    """Run calls concurrent health checks through one transport"""
+    client = ForceWeaverMCPClient(api_base_url=url, transport=transport)
+    app.connections.clear()
+    latencies: List[float] = []
+
+    async def check(i: int) -> None:
+        started = time.perf_counter()
+        await client.call_mcp_api(
+            "health/check", forceweaver_api_key="fk_bench", org_id=f"00D{i:012d}"
+        )
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(check(i) for i in range(calls)))
+    finally:
+        await client.close()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "transport": name,
+        "calls": calls,
+        "seconds": round(elapsed, 3),
+        "calls_per_second": round(calls / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        "connections": len(app.connections),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--connections", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    app = StandIn(args.latency)
+    config = Config()
+    config.bind = [f"127.0.0.1:{args.port}"]
+    config.loglevel = "WARNING"
+    shutdown = asyncio.Event()
+    server = asyncio.create_task(
+        serve(app, config, shutdown_trigger=shutdown.wait)  # type: ignore[arg-type]
+    )
+    await asyncio.sleep(0.5)
+    url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        transports = {
+            "aiohttp (HTTP/1.1)": AiohttpTransport(
+                aiohttp.ClientTimeout(total=120), USER_AGENT, limit=args.connections
+            ),
+            # Prior knowledge, since cleartext servers can't negotiate via ALPN
+            "httpx (HTTP/2)": HttpxTransport(
+                120, USER_AGENT, limit=args.connections, http1=False
+            ),
+        }
+        for name, transport in transports.items():
+            print(json.dumps(await run(name, transport, url, app, args.calls)))
+    finally:
+        shutdown.set()
+        await server
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -15,12 +15,24 @@ __author__ = "ForceWeaver Team"
 __email__ = "support@forceweaver.com"
 __license__ = "MIT"
 
-from .exceptions import AuthenticationError, ConnectionError, ForceWeaverError
+from .exceptions import (
+    AuthenticationError,
+    ConnectionError,
+    ForceWeaverError,
+    ValidationError,
+)
+from .models import HealthCheckReport
+from .sdk import AsyncForceWeaver, BulkResult, ForceWeaver
 from .server import ForceWeaverMCPClient
 
 __all__ = [
     "ForceWeaverMCPClient",
+    "ForceWeaver",
+    "AsyncForceWeaver",
+    "BulkResult",
+    "HealthCheckReport",
     "ForceWeaverError",
     "AuthenticationError",
     "ConnectionError",
+    "ValidationError",
 ]
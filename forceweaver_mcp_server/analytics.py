@@ -0,0 +1,170 @@
+"""
+ForceWeaver MCP Client Score Analytics
+Compact per-org, per-check score history with rolling averages, deltas and
+regression detection over the health checks this client has run.
+"""
+
+import hashlib
+import math
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .models import HealthCheckReport
+
+# Pseudo check type under which the overall score is tracked
+OVERALL = "overall"
+
+
+def tenant_key(api_key: str) -> str:
+    """Stable, non-reversible key that keeps each API key's history separate"""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _parse_timestamp(value: Optional[str]) -> float:
+    if value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    return time.time()
+
+
+class ScoreSeries:
+    """Time-ordered scores for one org and check, stored as two double arrays"""
+
+    __slots__ = ("timestamps", "scores", "max_points")
+
+    def __init__(self, max_points: int = 1000):
+        self.timestamps = array("d")
+        self.scores = array("d")
+        self.max_points = max_points
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def append(self, timestamp: float, score: float) -> None:
+        """Add a point, trimming the oldest once well over capacity"""
+        self.timestamps.append(timestamp)
+        self.scores.append(score)
+        # Trim in batches so appends stay amortized O(1)
+        excess = len(self.scores) - self.max_points
+        if excess > self.max_points // 4:
+            del self.timestamps[:excess]
+            del self.scores[:excess]
+
+    def window(self, points: int) -> array:
+        """The last points scores, capped to the retained history"""
+        return self.scores[-min(points, self.max_points) :]
+
+    def summary(
+        self, window: int, z_threshold: float, drop_threshold: float
+    ) -> Dict[str, Any]:
+        """Latest score against the baseline of the window before it"""
+        scores = self.window(window + 1)
+        latest = scores[-1]
+        baseline = scores[:-1]
+        result: Dict[str, Any] = {
+            "latest": latest,
+            "points": len(self),
+            "last_run": datetime.fromtimestamp(
+                self.timestamps[-1], timezone.utc
+            ).isoformat(),
+        }
+        if not baseline:
+            result.update(delta=None, rolling_average=latest, anomaly=False)
+            return result
+
+        n = len(baseline)
+        total = math.fsum(baseline)
+        mean = total / n
+        variance = max(0.0, math.fsum(s * s for s in baseline) / n - mean * mean)
+        std = math.sqrt(variance)
+        delta = latest - baseline[-1]
+        drop = mean - latest
+        zscore = drop / std if std else (math.inf if drop > 0 else 0.0)
+
+        result.update(
+            delta=delta,
+            rolling_average=round(mean, 2),
+            anomaly=drop >= drop_threshold or (drop > 0 and zscore >= z_threshold),
+        )
+        return result
+
+
+class TrendStore:
+    """Score series per tenant, org and check type, fed from health check results"""
+
+    def __init__(
+        self,
+        max_points: int = 1000,
+        z_threshold: float = 2.0,
+        drop_threshold: float = 10.0,
+    ):
+        self.max_points = max_points
+        self.z_threshold = z_threshold
+        self.drop_threshold = drop_threshold
+        # tenant -> (org_id, check_type) -> series
+        self._series: Dict[str, Dict[Tuple[str, str], ScoreSeries]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in self._series.values())
+
+    def record(
+        self,
+        tenant: str,
+        report: HealthCheckReport,
+        org_id: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Append a report's overall and per-check scores"""
+        org_id = report.org_id or org_id
+        if not org_id:
+            return
+        when = _parse_timestamp(report.timestamp) if timestamp is None else timestamp
+
+        # Overall score is only meaningful when the response had a summary
+        points = []
+        if report.checks_performed is not None:
+            points.append((OVERALL, report.overall_score))
+        points.extend((check.check_type, check.score) for check in report.checks)
+        tenant_series = self._series.setdefault(tenant, {})
+        for check_type, score in points:
+            series = tenant_series.get((org_id, check_type))
+            if series is None:
+                series = tenant_series[org_id, check_type] = ScoreSeries(
+                    self.max_points
+                )
+            series.append(when, float(score))
+
+    def series(
+        self,
+        tenant: str,
+        org_id: Optional[str] = None,
+        check_type: Optional[str] = None,
+    ) -> Iterator[Tuple[str, str, ScoreSeries]]:
+        """Series for a tenant, optionally narrowed to an org and check type"""
+        for (org, check), series in self._series.get(tenant, {}).items():
+            if org_id and org != org_id:
+                continue
+            if check_type and check != check_type:
+                continue
+            yield org, check, series
+
+    def trends(
+        self,
+        tenant: str,
+        org_id: Optional[str] = None,
+        check_type: Optional[str] = None,
+        window: int = 5,
+        regressions_only: bool = False,
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Latest score, delta, rolling average and anomaly flag per series"""
+        trends: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for org, check, series in self.series(tenant, org_id, check_type):
+            summary = series.summary(window, self.z_threshold, self.drop_threshold)
+            if regressions_only and not summary["anomaly"]:
+                continue
+            trends.setdefault(org, {})[check] = summary
+        return trends
@@ -0,0 +1,289 @@
+"""
+ForceWeaver MCP Client Cost Guard
+Local per-API-key spend tracking and budget enforcement, so calls that would
+exceed a budget or hit a known rate limit are stopped before they go out.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
+
+from .analytics import tenant_key
+from .exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600.0
+DAY = 86400.0
+
+# Keys usage/summary may report spend under, per budget window
+USAGE_KEYS = {
+    HOUR: ("cost_cents_last_hour", "hourly_cost_cents"),
+    DAY: ("cost_cents_today", "daily_cost_cents"),
+}
+
+# Reservation of the backend call running in the current task
+_reservation: ContextVar[Optional["Reservation"]] = ContextVar(
+    "forceweaver_reservation", default=None
+)
+
+
+class Reservation:
+    """Estimated cost held against a budget while a call is in flight"""
+
+    __slots__ = ("tenant", "estimate", "actual")
+
+    def __init__(self, tenant: str, estimate: float):
+        self.tenant = tenant
+        self.estimate = estimate
+        self.actual: Optional[float] = None
+
+
+class SpendLedger:
+    """Timestamped charges for one API key over the last day"""
+
+    __slots__ = ("charges", "reserved", "blocked_until", "synced_at", "waiters")
+
+    def __init__(self) -> None:
+        self.charges: Deque[Tuple[float, float]] = deque()
+        self.reserved = 0.0
+        self.blocked_until = 0.0
+        self.synced_at = 0.0
+        # Queued calls waiting for in-flight reservations to settle
+        self.waiters: Set[asyncio.Future] = set()
+
+    def add(self, cents: float, now: float) -> None:
+        if cents:
+            self.charges.append((now, cents))
+
+    def prune(self, now: float) -> None:
+        while self.charges and self.charges[0][0] <= now - DAY:
+            self.charges.popleft()
+
+    def spent(self, window: float, now: float) -> float:
+        """Charges within the trailing window"""
+        start = now - window
+        return sum(cents for ts, cents in self.charges if ts > start)
+
+    def wait_for(
+        self, window: float, budget: float, needed: float, now: float
+    ) -> Optional[float]:
+        """Seconds until needed cents fit in the window's budget
+
+        Infinite when the call only fits once in-flight reservations settle,
+        and None when it exceeds the budget on its own.
+        """
+        if needed > budget:
+            return None
+        excess = self.spent(window, now) + self.reserved + needed - budget
+        if excess <= 0:
+            return 0.0
+        start = now - window
+        for ts, cents in self.charges:
+            if ts <= start:
+                continue
+            excess -= cents
+            if excess <= 0:
+                return ts + window - now
+        return math.inf
+
+    def wake(self) -> None:
+        """Let queued calls recheck the budget"""
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class CostGuard:
+    """Enforces hourly/daily spend budgets and 429 cooldowns per API key
+
+    Health checks reserve an estimated cost before they are sent and are
+    charged the response's summary.cost_cents when it arrives. Over budget,
+    calls are rejected with RateLimitError, or in "queue" mode held until
+    enough spend ages out of the window or in-flight calls settle (at most
+    max_wait seconds).
+    """
+
+    def __init__(
+        self,
+        hourly_cents: Optional[float] = None,
+        daily_cents: Optional[float] = None,
+        mode: str = "reject",
+        max_wait: float = 60.0,
+        fetch_usage: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None,
+        sync_interval: float = 300.0,
+    ):
+        self.budgets = {
+            window: budget
+            for window, budget in ((HOUR, hourly_cents), (DAY, daily_cents))
+            if budget is not None
+        }
+        self.mode = mode
+        self.max_wait = max_wait
+        self.fetch_usage = fetch_usage
+        self.sync_interval = sync_interval
+        self._ledgers: Dict[str, SpendLedger] = {}
+        self._syncs: Dict[str, "asyncio.Task[None]"] = {}
+
+    def ledger(self, api_key: str) -> SpendLedger:
+        """Spend ledger for an API key"""
+        tenant = tenant_key(api_key)
+        ledger = self._ledgers.get(tenant)
+        if ledger is None:
+            ledger = self._ledgers[tenant] = SpendLedger()
+        return ledger
+
+    def spent(self, api_key: str, window: float = DAY) -> float:
+        """Cents charged to an API key within the trailing window"""
+        return self.ledger(api_key).spent(window, time.time())
+
+    async def reserve(
+        self, api_key: str, estimate: float, max_wait: Optional[float] = None
+    ) -> Reservation:
+        """Hold an estimated cost, waiting or raising if it would not fit"""
+        ledger = self.ledger(api_key)
+        self._maybe_sync(api_key, ledger)
+        limit = self.max_wait if max_wait is None else min(self.max_wait, max_wait)
+
+        while True:
+            now = time.time()
+            ledger.prune(now)
+            wait: Optional[float] = max(0.0, ledger.blocked_until - now)
+            if wait:
+                reason = "the backend rate limit"
+            else:
+                reason = "your ForceWeaver budget"
+                waits = [
+                    ledger.wait_for(window, budget, estimate, now)
+                    for window, budget in self.budgets.items()
+                ]
+                known = [needed for needed in waits if needed is not None]
+                wait = max(known, default=0.0) if len(known) == len(waits) else None
+
+            if wait == 0:
+                break
+            if (
+                wait is None
+                or self.mode != "queue"
+                or limit <= 0
+                or (wait > limit and not math.isinf(wait))
+            ):
+                raise self._rejection(reason, wait)
+
+            if math.isinf(wait):
+                logger.info("Queueing health check until in-flight calls settle")
+            else:
+                logger.info(
+                    f"Queueing health check {wait:.1f}s to stay within {reason}"
+                )
+            started = time.monotonic()
+            waiter = asyncio.get_running_loop().create_future()
+            ledger.waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter, min(wait, limit))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                ledger.waiters.discard(waiter)
+            limit -= time.monotonic() - started
+
+        ledger.reserved += estimate
+        reservation = Reservation(tenant_key(api_key), estimate)
+        _reservation.set(reservation)
+        return reservation
+
+    def observe(
+        self, endpoint: str, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> None:
+        """Result listener recording call costs and reported usage"""
+        api_key = params.get("forceweaver_api_key")
+        if endpoint == "usage/summary" and api_key:
+            self.apply_usage(api_key, result)
+            return
+        reservation = _reservation.get()
+        cost = (result.get("summary") or {}).get("cost_cents")
+        if reservation is not None and cost is not None:
+            reservation.actual = float(cost)
+
+    def settle(self, reservation: Reservation, charged: bool) -> None:
+        """Release a reservation, charging its actual or estimated cost"""
+        ledger = self._ledgers[reservation.tenant]
+        ledger.reserved = max(0.0, ledger.reserved - reservation.estimate)
+        if charged:
+            actual = reservation.actual
+            ledger.add(reservation.estimate if actual is None else actual, time.time())
+        _reservation.set(None)
+        ledger.wake()
+
+    def block(self, api_key: str, retry_after: Optional[float]) -> None:
+        """Reject calls for an API key locally until a 429 cooldown passes"""
+        ledger = self.ledger(api_key)
+        ledger.blocked_until = max(
+            ledger.blocked_until, time.time() + (retry_after or 60.0)
+        )
+
+    def apply_usage(self, api_key: str, usage: Dict[str, Any]) -> None:
+        """Reconcile the local ledger with spend reported by usage/summary"""
+        nested = usage.get("usage")
+        if isinstance(nested, dict):
+            usage = nested
+        ledger = self.ledger(api_key)
+        now = time.time()
+        for window, keys in USAGE_KEYS.items():
+            reported = next((usage[key] for key in keys if key in usage), None)
+            if reported is None:
+                continue
+            missing = float(reported) - ledger.spent(window, now)
+            # Spend from other clients sharing the key is charged now
+            if missing > 0:
+                ledger.add(missing, now)
+        ledger.synced_at = now
+
+    async def close(self) -> None:
+        """Cancel any background usage syncs"""
+        tasks = list(self._syncs.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _maybe_sync(self, api_key: str, ledger: SpendLedger) -> None:
+        tenant = tenant_key(api_key)
+        if (
+            self.fetch_usage is None
+            or not self.budgets
+            or tenant in self._syncs
+            or time.time() - ledger.synced_at < self.sync_interval
+        ):
+            return
+        task = asyncio.create_task(self._sync(api_key))
+        self._syncs[tenant] = task
+        task.add_done_callback(lambda _: self._syncs.pop(tenant, None))
+
+    async def _sync(self, api_key: str) -> None:
+        assert self.fetch_usage is not None
+        try:
+            self.apply_usage(api_key, await self.fetch_usage(api_key))
+        except Exception as e:
+            logger.warning(f"Could not sync usage from usage/summary: {e}")
+            # Don't retry on every call while the endpoint is failing
+            self.ledger(api_key).synced_at = time.time()
+
+    def _rejection(self, reason: str, wait: Optional[float]) -> RateLimitError:
+        if wait is None:
+            retry = "Raise your budget."
+        elif math.isinf(wait):
+            retry = "Try again once in-flight health checks finish."
+            wait = None
+        else:
+            retry = f"Try again in {int(wait) + 1}s."
+        return RateLimitError(
+            "❌ Budget Exceeded\n\n"
+            f"This health check would exceed {reason}. {retry}\n"
+            "Check your usage at: https://mcp.forceweaver.com/dashboard/usage",
+            retry_after=wait,
+        )
@@ -0,0 +1,45 @@
+"""
+ForceWeaver MCP Client Result Cache
+Latest health check output per org, shared by scheduled sweeps and
+interactive tool calls.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+# (tenant, org_id, check_types, api_version)
+CacheKey = Tuple[str, str, Tuple[str, ...], str]
+
+
+def cache_key(
+    tenant: str, org_id: str, check_types: Iterable[str], api_version: str
+) -> CacheKey:
+    """Key for a health check, independent of check type order"""
+    return (tenant, org_id, tuple(sorted(check_types)), api_version)
+
+
+class ResultCache:
+    """Bounded LRU of the most recent health check output per key"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, key: CacheKey, output: str) -> None:
+        """Store the latest output for a key, evicting the least recently used"""
+        self._entries[key] = (time.time(), output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: CacheKey, max_age: float) -> Optional[Tuple[float, str]]:
+        """Return (stored_at, output) if the entry is at most max_age seconds old"""
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[0] > max_age:
+            return None
+        self._entries.move_to_end(key)
+        return entry
@@ -0,0 +1,267 @@
+"""
+ForceWeaver MCP Client Cassettes
+Record redacted backend traffic with timings to a cassette file, and replay
+it through a transport at original or accelerated speed.
+"""
+
+import asyncio
+import gzip
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    cast,
+)
+from urllib.parse import urlsplit
+
+from multidict import CIMultiDict
+
+from .transport import Transport, TransportError, TransportResponse
+
+# Field names are split into words (snake_case, camelCase, kebab-case), and
+# fields are never recorded if any word is one of these...
+SENSITIVE_WORDS = frozenset(
+    {
+        "authorization",
+        "cookie",
+        "credential",
+        "credentials",
+        "passwd",
+        "password",
+        "secret",
+        "session",
+        "token",
+    }
+)
+# ...or two adjacent words, or the whole name, spell one of these
+SENSITIVE_NAMES = frozenset(
+    {"access_key", "api_key", "private_key", "secret_key", "session_id"}
+)
+REDACTED = "[REDACTED]"
+
+# Response headers kept in cassettes; the client reads no others
+RECORDED_HEADERS = ("content-type", "retry-after")
+
+_ACRONYM_BOUNDARY = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+# Sensitive names written as one word, e.g. apikey or sessionid
+_COMPACT_NAMES = frozenset(name.replace("_", "") for name in SENSITIVE_NAMES)
+
+
+def _words(key: Any) -> List[str]:
+    """Lower-case words of a field name, e.g. apiKey -> [api, key]"""
+    name = _ACRONYM_BOUNDARY.sub(r"\1_\2", str(key))
+    name = _CAMEL_BOUNDARY.sub(r"\1_\2", name)
+    return [word for word in _SEPARATORS.split(name.lower()) if word]
+
+
+def is_sensitive(key: Any) -> bool:
+    """Whether a field name looks like it holds a credential
+
+    Whole words are matched, so keys, key_findings and tokens_used keep
+    their values (and the payload its shape) while api_key does not.
+    """
+    words = _words(key)
+    if SENSITIVE_WORDS.intersection(words):
+        return True
+    pairs = {f"{first}_{second}" for first, second in zip(words, words[1:])}
+    compact = "".join(words)
+    return bool(SENSITIVE_NAMES & pairs) or compact in _COMPACT_NAMES
+
+
+def redact(value: Any) -> Any:
+    """Copy of a JSON value with sensitive keys' values replaced"""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if is_sensitive(key) else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def _redact_body(body: str) -> str:
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return body
+    return json.dumps(redact(payload), separators=(",", ":"))
+
+
+def _target(url: str) -> str:
+    # Path and query only, so cassettes replay against any base URL
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def _request_key(method: str, url: str, body: Optional[Dict[str, Any]]) -> Tuple:
+    return (method, _target(url), json.dumps(redact(body), sort_keys=True))
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+class BufferedResponse:
+    """A fully read response, as recorded or replayed"""
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: str):
+        self.status = status
+        # Header lookups are case-insensitive, as on live responses
+        self.headers = CIMultiDict(headers)
+        self.body = body
+
+    async def json(self) -> Any:
+        return json.loads(self.body)
+
+    async def text(self) -> str:
+        return self.body
+
+
+def load_cassette(path: str) -> List[Dict[str, Any]]:
+    """Entries of a cassette in recording order"""
+    with _open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class RecordingTransport(Transport):
+    """Wraps a transport, appending each exchange to a cassette file
+
+    Each entry holds the method, path, redacted request and response bodies,
+    status, the headers the client reads, the offset from the first recorded
+    request and the time taken. Paths ending in .gz are gzip-compressed.
+    """
+
+    name = "record"
+
+    def __init__(self, inner: Transport, path: str):
+        self.inner = inner
+        self.path = path
+        self._started: Optional[float] = None
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[TransportResponse]:
+        started = time.monotonic()
+        if self._started is None:
+            self._started = started
+        async with self.inner.request(method, url, headers, json, timeout) as response:
+            body = await response.text()
+            elapsed = time.monotonic() - started
+            buffered = BufferedResponse(
+                response.status,
+                {
+                    name: response.headers[name]
+                    for name in RECORDED_HEADERS
+                    if name in response.headers
+                },
+                body,
+            )
+        self._write(
+            {
+                "method": method,
+                "target": _target(url),
+                "request": redact(json),
+                "status": buffered.status,
+                "headers": dict(buffered.headers),
+                "body": _redact_body(body),
+                "offset": round(started - self._started, 6),
+                "elapsed": round(elapsed, 6),
+            }
+        )
+        yield buffered
+
+    async def close(self) -> None:
+        await self.inner.close()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = _open(self.path, "a")
+            self._file.write(line)
+            self._file.flush()
+
+
+class ReplayTransport(Transport):
+    """Serves recorded responses instead of calling the backend
+
+    Requests are matched on method, path and redacted body, falling back to
+    method and path; repeated requests get their recordings in order, and
+    the last one is reused once they run out. Each response is delayed by
+    its recorded time divided by speed; a speed of 0 replays instantly.
+    """
+
+    name = "replay"
+
+    def __init__(self, path: str, speed: float = 1.0):
+        self.path = path
+        self.speed = speed
+        self.entries = load_cassette(path)
+        self._exact: Dict[Tuple, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._loose: Dict[Tuple, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for entry in self.entries:
+            key = (entry["method"], entry["target"])
+            self._loose[key].append(entry)
+            request = json.dumps(entry.get("request"), sort_keys=True)
+            self._exact[key + (request,)].append(entry)
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[TransportResponse]:
+        key = _request_key(method, url, json)
+        entry = self._next(self._exact.get(key)) or self._next(self._loose.get(key[:2]))
+        if entry is None:
+            raise TransportError(f"No recorded response for {method} {key[1]}")
+
+        delay = entry["elapsed"] / self.speed if self.speed > 0 else 0.0
+        if timeout is not None and delay > timeout:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+        await asyncio.sleep(delay)
+        yield BufferedResponse(entry["status"], entry["headers"], entry["body"])
+
+    async def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _next(entries: Optional[Deque[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        if not entries:
+            return None
+        return entries.popleft() if len(entries) > 1 else entries[0]
@@ -0,0 +1,222 @@
+"""
+ForceWeaver Bulk Check CLI
+`forceweaver-mcp check` runs health checks across many orgs concurrently and
+streams one result per org as it completes, resuming from earlier output.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import IO, Any, Dict, Iterable, List, Optional, Set
+
+import aiohttp
+
+from .exceptions import ForceWeaverError
+from .sdk import DEFAULT_CONCURRENCY, AsyncForceWeaver, BulkResult
+from .server import TRANSPORT, USER_AGENT, VERSION, ForceWeaverMCPClient
+from .transport import create_transport
+
+FORMATS = ("ndjson", "text")
+
+
+def read_orgs(lines: Iterable[str]) -> List[str]:
+    """Org references, one per line, skipping blanks, comments and repeats"""
+    orgs: Dict[str, None] = {}
+    for line in lines:
+        org = line.split("#", 1)[0].strip()
+        if org:
+            orgs.setdefault(org, None)
+    return list(orgs)
+
+
+def completed_orgs(lines: Iterable[str]) -> Set[str]:
+    """Orgs already checked successfully according to earlier NDJSON output
+
+    Lines that don't parse, such as one cut short by an interrupted run,
+    are ignored so those orgs are checked again.
+    """
+    done = set()
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and record.get("ok") and record.get("org"):
+            done.add(record["org"])
+    return done
+
+
+def to_record(result: BulkResult) -> Dict[str, Any]:
+    """JSON-compatible record of one org's outcome"""
+    record: Dict[str, Any] = {
+        "org": result.org,
+        "org_id": result.org_id,
+        "ok": result.ok,
+    }
+    if result.report is not None:
+        record["report"] = result.report.to_dict()
+    if result.error is not None:
+        record["error_type"] = type(result.error).__name__
+        record["error"] = str(result.error)
+    return record
+
+
+def to_text(result: BulkResult) -> str:
+    """One-line human-readable summary of one org's outcome"""
+    if result.report is not None:
+        report = result.report
+        return (
+            f"✅ {result.org_id}: {report.overall_score}/100 ({report.grade}) "
+            f"{report.org_name or ''}".rstrip()
+        )
+    first_line = str(result.error).strip().splitlines()[0] if result.error else ""
+    return f"❌ {result.org}: {first_line}"
+
+
+def _terminate_last_line(path: str) -> None:
+    # An interrupted run may have left half a line; start on a fresh one
+    with open(path, "rb+") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser for the check subcommand"""
+    parser = argparse.ArgumentParser(
+        prog="forceweaver-mcp check",
+        description="Run ForceWeaver health checks across many Salesforce orgs",
+    )
+    parser.add_argument("orgs", nargs="*", help="Org IDs, names or aliases to check")
+    parser.add_argument(
+        "--orgs",
+        dest="orgs_file",
+        metavar="FILE",
+        help="File with one org per line ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Checks to run at once (default {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--format", choices=FORMATS, default="ndjson", help="Output format"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Append results to FILE instead of writing to stdout",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip orgs already checked successfully in the --output file "
+        "(NDJSON only)",
+    )
+    parser.add_argument(
+        "--check-types", help="Comma-separated check types (default: all)"
+    )
+    parser.add_argument("--api-version", help="Salesforce API version")
+    parser.add_argument(
+        "--timeout", type=float, help="Time limit in seconds for each check"
+    )
+    parser.add_argument(
+        "--api-key", help="ForceWeaver API key (default: FORCEWEAVER_API_KEY)"
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Log progress to stderr"
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {VERSION}")
+    return parser
+
+
+async def run_checks(args: argparse.Namespace, orgs: List[str], out: IO[str]) -> int:
+    """Check orgs, writing each result as it completes; return the failures"""
+    client = ForceWeaverMCPClient(
+        transport=create_transport(
+            TRANSPORT,
+            aiohttp.ClientTimeout(total=120),
+            USER_AGENT,
+            # Enough connections for every check running at once
+            limit=args.parallel,
+        )
+    )
+    check_types = args.check_types.split(",") if args.check_types else None
+    failed = 0
+    try:
+        async with AsyncForceWeaver(
+            args.api_key, client=client, concurrency=args.parallel
+        ) as sdk:
+            async for result in sdk.health_check_many(
+                orgs, check_types, args.api_version, args.timeout
+            ):
+                failed += not result.ok
+                line = (
+                    json.dumps(to_record(result))
+                    if args.format == "ndjson"
+                    else to_text(result)
+                )
+                out.write(line + "\n")
+                # Flush per result so output can be piped and resumed
+                out.flush()
+    finally:
+        await client.close()
+    return failed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for `forceweaver-mcp check`; returns the exit status"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    if args.resume and not args.output:
+        parser.error("--resume requires --output")
+    if args.resume and args.format != "ndjson":
+        # Only NDJSON output records which orgs succeeded
+        parser.error("--resume requires --format ndjson")
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    orgs = list(args.orgs)
+    if args.orgs_file == "-":
+        orgs += read_orgs(sys.stdin)
+    elif args.orgs_file:
+        with open(args.orgs_file, encoding="utf-8") as f:
+            orgs += read_orgs(f)
+    orgs = read_orgs(orgs)
+    if not orgs:
+        parser.error("no orgs to check - pass org IDs or --orgs FILE")
+
+    if args.resume and os.path.exists(args.output):
+        with open(args.output, encoding="utf-8") as f:
+            done = completed_orgs(f)
+        remaining = [org for org in orgs if org not in done]
+        print(
+            f"Resuming: skipping {len(orgs) - len(remaining)} org(s) already checked",
+            file=sys.stderr,
+        )
+        orgs = remaining
+        _terminate_last_line(args.output)
+
+    out = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    try:
+        failed = asyncio.run(run_checks(args, orgs, out))
+    except KeyboardInterrupt:
+        return 130
+    except ForceWeaverError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if failed:
+        print(f"{failed} of {len(orgs)} org(s) failed", file=sys.stderr)
+    return 1 if failed else 0
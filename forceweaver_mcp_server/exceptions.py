@@ -3,6 +3,8 @@ ForceWeaver MCP Client Exceptions
 Custom exception classes for the ForceWeaver MCP client.
 """
 
+from typing import Optional
+
 
 class ForceWeaverError(Exception):
     """Base exception for ForceWeaver client errors"""
@@ -31,7 +33,10 @@ class ValidationError(ForceWeaverError):
 class RateLimitError(ForceWeaverError):
     """Raised when rate limits are exceeded"""
 
-    pass
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds until the call may succeed, when known
+        self.retry_after = retry_after
 
 
 class ServiceUnavailableError(ForceWeaverError):
@@ -0,0 +1,159 @@
+"""
+ForceWeaver MCP Client Background Jobs
+Bounded in-memory job table for health checks that outlive a tool call.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Coroutine, Dict, Optional
+
+from .exceptions import RateLimitError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Job states
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class Job:
+    """A background health check and its eventual outcome"""
+
+    __slots__ = (
+        "job_id",
+        "org_id",
+        "task",
+        "created_at",
+        "finished_at",
+        "result",
+        "error",
+    )
+
+    def __init__(self, job_id: str, org_id: Optional[str], task: "asyncio.Task[str]"):
+        self.job_id = job_id
+        self.org_id = org_id
+        self.task = task
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def status(self) -> str:
+        """Current job state"""
+        if not self.task.done():
+            return RUNNING
+        if self.task.cancelled():
+            return CANCELLED
+        if self.error is not None:
+            return FAILED
+        return SUCCEEDED
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished, successfully or not"""
+        return self.task.done()
+
+    def describe(self) -> Dict[str, Any]:
+        """Summarise the job for status reporting"""
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "org_id": self.org_id,
+            "status": self.status,
+            "elapsed_ms": int((end - self.created_at) * 1000),
+        }
+
+
+class JobManager:
+    """Runs coroutines as background tasks behind a bounded, expiring job table"""
+
+    def __init__(self, max_jobs: int = 100, ttl: float = 3600):
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def start(
+        self, coro: Coroutine[Any, Any, str], org_id: Optional[str] = None
+    ) -> Job:
+        """Schedule a coroutine and return its job handle"""
+        self._evict()
+        if len(self._jobs) >= self.max_jobs:
+            # Close the coroutine so it doesn't warn about never being awaited
+            coro.close()
+            raise RateLimitError(
+                "❌ Too Many Jobs\n\n"
+                f"{self.max_jobs} health check jobs are already running.\n"
+                "Wait for one to finish or cancel it before starting another."
+            )
+
+        job_id = uuid.uuid4().hex
+        task = asyncio.create_task(coro)
+        job = Job(job_id, org_id, task)
+        task.add_done_callback(lambda _: self._finish(job))
+        self._jobs[job_id] = job
+        logger.info(f"Started health check job {job_id} for org: {org_id}")
+        return job
+
+    def get(self, job_id: str) -> Job:
+        """Look up a job, raising ValidationError if it is unknown or expired"""
+        self._evict()
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ValidationError(
+                f"Health check job '{job_id}' was not found. It may have expired "
+                "or never existed - start a new one with start_health_check."
+            )
+        return job
+
+    def cancel(self, job_id: str) -> Job:
+        """Cancel a running job; finished jobs are returned unchanged"""
+        job = self.get(job_id)
+        if not job.done:
+            job.task.cancel()
+            logger.info(f"Cancelled health check job {job_id}")
+        return job
+
+    async def shutdown(self) -> None:
+        """Cancel every running job and wait for them to unwind"""
+        running = [job.task for job in self._jobs.values() if not job.done]
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        self._jobs.clear()
+
+    def _finish(self, job: Job) -> None:
+        """Record the outcome of a completed task"""
+        job.finished_at = time.time()
+        if job.task.cancelled():
+            return
+        error = job.task.exception()
+        if error is not None:
+            job.error = error
+            logger.error(f"Health check job {job.job_id} failed: {error}")
+        else:
+            job.result = job.task.result()
+
+    def _evict(self) -> None:
+        """Drop expired jobs, then the oldest finished ones if the table is full"""
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at is not None and now - job.finished_at > self.ttl:
+                del self._jobs[job_id]
+
+        if len(self._jobs) < self.max_jobs:
+            return
+        for job_id, job in list(self._jobs.items()):
+            if job.done:
+                del self._jobs[job_id]
+                if len(self._jobs) < self.max_jobs:
+                    return
@@ -0,0 +1,143 @@
+"""
+ForceWeaver MCP Client Result Models
+Compact typed model of health check responses for structured tool output.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from .exceptions import ValidationError
+
+# Top-level fields a structured report can be projected to
+REPORT_FIELDS = (
+    "org_id",
+    "org_name",
+    "timestamp",
+    "overall_score",
+    "grade",
+    "execution_time_ms",
+    "cost_cents",
+    "checks_performed",
+    "checks",
+)
+
+
+def validate_report_fields(fields: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Fields to project a report to, rejecting unknown ones"""
+    selected = REPORT_FIELDS if fields is None else tuple(fields)
+    unknown = [field for field in selected if field not in REPORT_FIELDS]
+    if unknown:
+        raise ValidationError(
+            "❌ Invalid Report Fields\n\n"
+            f"Unknown field(s): {', '.join(unknown)}.\n"
+            f"Available fields: {', '.join(REPORT_FIELDS)}"
+        )
+    return selected
+
+
+def grade_for_score(score: Union[int, float]) -> str:
+    """Convert numeric score to letter grade"""
+    if score >= 90:
+        return "A+"
+    elif score >= 80:
+        return "A"
+    elif score >= 70:
+        return "B"
+    elif score >= 60:
+        return "C"
+    elif score >= 50:
+        return "D"
+    else:
+        return "F"
+
+
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    """Outcome of a single health check"""
+
+    check_type: str
+    status: str
+    score: Union[int, float]
+    details: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_response(cls, check_type: str, result: Dict[str, Any]) -> "CheckResult":
+        """Build a check result from one entry of the backend's results"""
+        return cls(
+            check_type=check_type,
+            status=str(result.get("status", "unknown")),
+            score=result.get("score", 0),
+            details=tuple(str(detail) for detail in result.get("details", ())),
+        )
+
+    def to_dict(self, summary_only: bool = False) -> Dict[str, Any]:
+        """Render as JSON-compatible data, dropping details for summaries"""
+        data: Dict[str, Any] = {"status": self.status, "score": self.score}
+        if self.details and not summary_only:
+            data["details"] = list(self.details)
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class HealthCheckReport:
+    """Scores, statuses and findings of a health check run"""
+
+    org_id: Optional[str]
+    org_name: Optional[str]
+    timestamp: Optional[str]
+    overall_score: Union[int, float]
+    execution_time_ms: Optional[int]
+    cost_cents: Optional[Union[int, float]]
+    checks_performed: Optional[int]
+    checks: Tuple[CheckResult, ...]
+
+    @property
+    def grade(self) -> str:
+        """Letter grade for the overall score"""
+        return grade_for_score(self.overall_score)
+
+    @classmethod
+    def from_response(cls, result: Dict[str, Any]) -> "HealthCheckReport":
+        """Build a report from a raw health/check response"""
+        summary = result.get("summary") or {}
+        results = result.get("results") or {}
+        # The backend nests per-check results under results.results
+        if isinstance(results.get("results"), dict):
+            results = results["results"]
+
+        return cls(
+            org_id=result.get("org_id"),
+            org_name=result.get("org_name"),
+            timestamp=result.get("timestamp"),
+            overall_score=summary.get("overall_score", 0),
+            execution_time_ms=summary.get("execution_time_ms"),
+            cost_cents=summary.get("cost_cents"),
+            checks_performed=summary.get("checks_performed"),
+            checks=tuple(
+                CheckResult.from_response(check_type, check_result)
+                for check_type, check_result in results.items()
+                if isinstance(check_result, dict)
+            ),
+        )
+
+    def to_dict(
+        self, fields: Optional[Iterable[str]] = None, summary_only: bool = False
+    ) -> Dict[str, Any]:
+        """Render as JSON-compatible data, optionally projected to some fields
+
+        Unset values are omitted to keep payloads small. summary_only keeps
+        per-check statuses and scores but drops their details.
+        """
+        selected = validate_report_fields(fields)
+        data: Dict[str, Any] = {}
+        for field in selected:
+            if field == "checks":
+                data["checks"] = {
+                    check.check_type: check.to_dict(summary_only)
+                    for check in self.checks
+                }
+                continue
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        return data
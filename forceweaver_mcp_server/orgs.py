@@ -0,0 +1,267 @@
+"""
+ForceWeaver MCP Client Org Index
+In-memory index of connected Salesforce orgs built from orgs/list, used to
+resolve org names and partial IDs and to reject unknown orgs without a
+backend round trip.
+"""
+
+import asyncio
+import bisect
+import logging
+import re
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+from .exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Salesforce org IDs are 15 (case-sensitive) or 18 (case-safe) characters
+ORG_ID_PATTERN = re.compile(r"^00D[a-zA-Z0-9]{12}(?:[a-zA-Z0-9]{3})?$")
+
+# Most candidates listed in an ambiguous-match error
+MAX_CANDIDATES = 5
+
+
+def looks_like_org_id(value: str) -> bool:
+    """Whether a value has the shape of a Salesforce org ID"""
+    return bool(ORG_ID_PATTERN.match(value))
+
+
+class OrgEntry:
+    """A connected Salesforce org as reported by orgs/list"""
+
+    __slots__ = ("org_id", "name", "aliases")
+
+    def __init__(self, org_id: str, name: Optional[str], aliases: Iterable[str] = ()):
+        self.org_id = org_id
+        self.name = name
+        self.aliases = tuple(aliases)
+
+    def __repr__(self) -> str:
+        return f"OrgEntry({self.org_id!r}, {self.name!r})"
+
+    @classmethod
+    def from_payload(cls, org: Dict[str, Any]) -> Optional["OrgEntry"]:
+        """Build an entry from one orgs/list record, or None if it has no ID"""
+        org_id = org.get("org_id") or org.get("id")
+        if not org_id:
+            return None
+
+        aliases = org.get("aliases") or []
+        if isinstance(aliases, str):
+            aliases = [aliases]
+        if org.get("alias"):
+            aliases = [*aliases, org["alias"]]
+
+        return cls(str(org_id), org.get("org_name") or org.get("name"), aliases)
+
+
+def parse_orgs(payload: Dict[str, Any]) -> List[OrgEntry]:
+    """Extract org entries from an orgs/list response"""
+    records = payload.get("orgs") or payload.get("organizations") or []
+    entries = [OrgEntry.from_payload(org) for org in records if isinstance(org, dict)]
+    return [entry for entry in entries if entry is not None]
+
+
+class OrgIndex:
+    """Exact and prefix lookups over one account's orgs"""
+
+    def __init__(self, orgs: Iterable[OrgEntry], loaded_at: Optional[float] = None):
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        self._orgs: Dict[str, OrgEntry] = {}
+        self._by_id: Dict[str, str] = {}
+        self._by_label: Dict[str, Set[str]] = {}
+
+        for org in orgs:
+            self._orgs[org.org_id] = org
+            self._by_id[org.org_id] = org.org_id
+            if len(org.org_id) == 18:
+                # 18-char IDs are case-insensitive and extend the 15-char form
+                self._by_id[org.org_id.lower()] = org.org_id
+                self._by_id[org.org_id[:15]] = org.org_id
+            for label in (org.name, *org.aliases):
+                if label:
+                    self._by_label.setdefault(label.casefold(), set()).add(org.org_id)
+
+        # Sorted (key, org_id) pairs for bisect-based prefix search
+        self._prefixes = sorted(
+            {(org_id.casefold(), org_id) for org_id in self._orgs}
+            | {
+                (label, org_id)
+                for label, org_ids in self._by_label.items()
+                for org_id in org_ids
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self._orgs)
+
+    def __iter__(self) -> Iterator[OrgEntry]:
+        return iter(self._orgs.values())
+
+    def __contains__(self, org_id: str) -> bool:
+        return org_id in self._by_id or org_id.lower() in self._by_id
+
+    def age(self) -> float:
+        """Seconds since the index was loaded"""
+        return time.time() - self.loaded_at
+
+    def get(self, org_id: str) -> Optional[OrgEntry]:
+        """Look up an org by its 15- or 18-character ID"""
+        canonical = self._by_id.get(org_id) or self._by_id.get(org_id.lower())
+        return self._orgs.get(canonical) if canonical else None
+
+    def resolve(self, query: str) -> OrgEntry:
+        """Resolve an org ID, name, alias or unique prefix of any of them"""
+        query = query.strip()
+        org = self.get(query)
+        if org is not None:
+            return org
+
+        key = query.casefold()
+        matches = self._by_label.get(key) or self._prefix_matches(key)
+        if len(matches) == 1:
+            return self._orgs[next(iter(matches))]
+
+        if matches:
+            candidates = ", ".join(
+                self._describe(org_id) for org_id in sorted(matches)[:MAX_CANDIDATES]
+            )
+            raise ValidationError(
+                "❌ Ambiguous Salesforce Org\n\n"
+                f"'{query}' matches {len(matches)} connected orgs: {candidates}.\n"
+                "Please use a longer name or the full org ID."
+            )
+
+        raise ValidationError(
+            "❌ Salesforce Org Not Found\n\n"
+            f"'{query}' does not match any org connected to your account.\n"
+            "Add it at: https://mcp.forceweaver.com/dashboard/orgs"
+        )
+
+    def _prefix_matches(self, prefix: str) -> Set[str]:
+        """Org IDs whose ID, name or alias starts with the prefix"""
+        matches = set()
+        start = bisect.bisect_left(self._prefixes, (prefix, ""))
+        for key, org_id in self._prefixes[start:]:
+            if not key.startswith(prefix):
+                break
+            matches.add(org_id)
+        return matches
+
+    def _describe(self, org_id: str) -> str:
+        name = self._orgs[org_id].name
+        return f"{name} ({org_id})" if name else org_id
+
+
+class OrgDirectory:
+    """Per-API-key org indexes refreshed from orgs/list when they go stale"""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[Dict[str, Any]]],
+        refresh_interval: float = 300,
+    ):
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self._indexes: Dict[str, OrgIndex] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._refreshing: Dict[str, "asyncio.Task[Optional[OrgIndex]]"] = {}
+
+    def index(self, api_key: str) -> Optional[OrgIndex]:
+        """The cached index for an API key, fresh or not"""
+        return self._indexes.get(api_key)
+
+    def is_fresh(self, api_key: str) -> bool:
+        """Whether the cached index can be trusted to reject unknown orgs"""
+        index = self._indexes.get(api_key)
+        return index is not None and index.age() < self.refresh_interval
+
+    def invalidate(self, api_key: Optional[str] = None) -> None:
+        """Drop the cached index for one API key, or all of them"""
+        if api_key is None:
+            self._indexes.clear()
+            self._failed_at.clear()
+        else:
+            self._indexes.pop(api_key, None)
+            self._failed_at.pop(api_key, None)
+
+    async def refresh(self, api_key: str) -> Optional[OrgIndex]:
+        """Reload the index, returning None if orgs/list could not be fetched"""
+        return await asyncio.shield(self._start_refresh(api_key))
+
+    async def resolve(self, api_key: str, query: str) -> str:
+        """Resolve a user-supplied org reference to a canonical org ID
+
+        Well-formed org IDs never wait on orgs/list: they are validated
+        against a fresh index when one is cached and passed through
+        otherwise, with a refresh started in the background. Names and
+        partial IDs load the index first. If orgs/list is unavailable the
+        query is passed through and the backend stays the source of truth.
+        """
+        if self.is_fresh(api_key):
+            return self._indexes[api_key].resolve(query).org_id
+
+        stale = self._indexes.get(api_key)
+        if looks_like_org_id(query):
+            if not self._backing_off(api_key):
+                self._start_refresh(api_key)
+        else:
+            index = await self.refresh(api_key)
+            if index is not None:
+                return index.resolve(query).org_id
+
+        # Without a fresh index only positive matches are trusted
+        try:
+            return stale.resolve(query).org_id if stale else query
+        except ValidationError:
+            return query
+
+    async def close(self) -> None:
+        """Cancel any background refreshes"""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start_refresh(self, api_key: str) -> "asyncio.Task[Optional[OrgIndex]]":
+        """Start an orgs/list load, sharing one in-flight call between callers"""
+        task = self._refreshing.get(api_key)
+        if task is None:
+            task = asyncio.create_task(self._load(api_key))
+            self._refreshing[api_key] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(api_key, None))
+        return task
+
+    def _backing_off(self, api_key: str) -> bool:
+        failed_at = self._failed_at.get(api_key)
+        return failed_at is not None and time.time() - failed_at < self.refresh_interval
+
+    async def _load(self, api_key: str) -> Optional[OrgIndex]:
+        if self._backing_off(api_key):
+            return None
+
+        try:
+            payload = await self.fetch(api_key)
+        except Exception as e:
+            logger.warning(f"Could not refresh org index from orgs/list: {e}")
+            self._failed_at[api_key] = time.time()
+            return None
+
+        index = OrgIndex(parse_orgs(payload))
+        self._indexes[api_key] = index
+        self._failed_at.pop(api_key, None)
+        logger.info(f"Org index refreshed with {len(index)} org(s)")
+        return index
@@ -0,0 +1,313 @@
+"""
+ForceWeaver MCP Client Profiling
+Opt-in per-phase timings of backend calls, the slowest calls kept for
+diagnostics, and cProfile or pyinstrument captures of sampled calls.
+"""
+
+import cProfile
+import heapq
+import io
+import itertools
+import pstats
+import random
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import aiohttp
+
+from .exceptions import ForceWeaverError, ValidationError
+
+# Phases in the order a call goes through them. They can overlap: ttfb runs
+# from sending the request to its response headers, so it includes queue,
+# dns, connect and tls; aiohttp reports TLS as part of connect.
+PHASES = (
+    "budget",
+    "queue",
+    "dns",
+    "connect",
+    "tls",
+    "ttfb",
+    "download",
+    "decode",
+    "format",
+)
+PROFILERS = ("cprofile", "pyinstrument")
+
+# Functions listed in a cProfile capture
+CAPTURE_LINES = 25
+
+# httpcore trace events timed for the HTTP/2 transport
+HTTPX_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+}
+
+# Profile of the backend call running in the current context
+_current: ContextVar[Optional["CallProfile"]] = ContextVar(
+    "forceweaver_call_profile", default=None
+)
+
+
+class CallProfile:
+    """Timings of one backend call"""
+
+    __slots__ = (
+        "endpoint",
+        "method",
+        "started_at",
+        "phases",
+        "total",
+        "status",
+        "error",
+        "capture",
+        "_marks",
+    )
+
+    def __init__(self, endpoint: str, method: str):
+        self.endpoint = endpoint
+        self.method = method
+        self.started_at = time.time()
+        self.phases: Dict[str, float] = {}
+        self.total = 0.0
+        self.status: Optional[int] = None
+        self.error: Optional[str] = None
+        self.capture: Optional[str] = None
+        self._marks: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase; phases entered repeatedly accumulate"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible summary, times in milliseconds"""
+        data: Dict[str, Any] = {
+            "endpoint": self.endpoint,
+            "method": self.method,
+            "started_at": time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started_at)
+            ),
+            "total_ms": _ms(self.total),
+            "status": self.status,
+            "error": self.error,
+            "phases_ms": {
+                phase: _ms(self.phases[phase])
+                for phase in PHASES
+                if phase in self.phases
+            },
+        }
+        if self.capture is not None:
+            data["capture"] = self.capture
+        return data
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def current_profile() -> Optional[CallProfile]:
+    """Profile of the backend call in progress, if it is being profiled"""
+    return _current.get()
+
+
+def mark(name: str, started: float) -> None:
+    """Record the time since a perf_counter() reading as a phase, if profiled"""
+    profile = _current.get()
+    if profile is not None:
+        profile.add(name, time.perf_counter() - started)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time the block as a phase of the current call, if profiled"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(name, time.perf_counter() - started)
+
+
+def _on_start(mark: str) -> Any:
+    async def callback(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        if _current.get() is not None:
+            setattr(ctx, mark, time.perf_counter())
+
+    return callback
+
+
+def _on_end(mark: str, name: str) -> Any:
+    async def callback(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        profile = _current.get()
+        started = getattr(ctx, mark, None)
+        if profile is not None and started is not None:
+            profile.add(name, time.perf_counter() - started)
+
+    return callback
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """aiohttp trace config timing pool queueing, DNS and connects
+
+    Callbacks run in the task making the request, so they only record when
+    that call is being profiled.
+    """
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(_on_start("queued"))
+    config.on_connection_queued_end.append(_on_end("queued", "queue"))
+    config.on_dns_resolvehost_start.append(_on_start("resolving"))
+    config.on_dns_resolvehost_end.append(_on_end("resolving", "dns"))
+    config.on_connection_create_start.append(_on_start("connecting"))
+    config.on_connection_create_end.append(_on_end("connecting", "connect"))
+    return config
+
+
+async def httpx_trace(event: str, info: Dict[str, Any]) -> None:
+    """httpcore trace extension timing connects and TLS handshakes"""
+    profile = _current.get()
+    if profile is None:
+        return
+    name, _, stage = event.rpartition(".")
+    phase_name = HTTPX_PHASES.get(name)
+    if phase_name is None:
+        return
+    if stage == "started":
+        profile._marks[name] = time.perf_counter()
+    elif name in profile._marks:
+        profile.add(phase_name, time.perf_counter() - profile._marks.pop(name))
+
+
+class Profiler:
+    """Profiles backend calls, keeping the slowest ones for diagnostics
+
+    A sample_rate fraction of calls is also run under cProfile or
+    pyinstrument, one at a time. Both profile the whole event loop thread,
+    so a capture includes whatever else ran while the call was awaiting.
+    """
+
+    def __init__(
+        self,
+        slowest: int = 20,
+        sample_rate: float = 0.0,
+        profiler: str = "cprofile",
+    ):
+        if profiler not in PROFILERS:
+            raise ValidationError(
+                f"❌ Unknown profiler {profiler!r}\n\n"
+                f"Supported profilers: {', '.join(PROFILERS)}"
+            )
+        if not 0 <= sample_rate <= 1:
+            raise ValidationError(
+                "❌ Invalid Sample Rate\n\nsample_rate must be between 0 and 1."
+            )
+        if profiler == "pyinstrument" and sample_rate > 0:
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError:
+                raise ForceWeaverError(
+                    "pyinstrument captures require pyinstrument: "
+                    "pip install 'forceweaver-mcp-server[profile]'"
+                )
+        self.slowest = slowest
+        self.sample_rate = sample_rate
+        self.profiler = profiler
+        self.calls = 0
+        self.captures = 0
+        self._totals: Dict[str, float] = {}
+        # Min-heap of (total, sequence, profile): the fastest kept call is
+        # evicted first, so it always holds the slowest calls seen
+        self._slowest: List[Tuple[float, int, CallProfile]] = []
+        self._sequence = itertools.count()
+        self._capturing = False
+
+    @asynccontextmanager
+    async def profile(self, endpoint: str, method: str) -> AsyncIterator[CallProfile]:
+        """Profile the backend call made inside the block"""
+        profile = CallProfile(endpoint, method)
+        token = _current.set(profile)
+        capture = self._start_capture()
+        started = time.perf_counter()
+        try:
+            yield profile
+        except BaseException as e:
+            profile.error = type(e).__name__
+            raise
+        finally:
+            profile.total = time.perf_counter() - started
+            if capture is not None:
+                profile.capture = self._stop_capture(capture)
+            _current.reset(token)
+            self._record(profile)
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Call count, mean phase timings and the slowest calls, slowest first"""
+        return {
+            "calls": self.calls,
+            "sample_rate": self.sample_rate,
+            "profiler": self.profiler,
+            "captures": self.captures,
+            "mean_phases_ms": {
+                phase: _ms(self._totals[phase] / self.calls)
+                for phase in ("total",) + PHASES
+                if phase in self._totals
+            },
+            "slowest": [
+                profile.to_dict()
+                for _, _, profile in sorted(self._slowest, reverse=True)
+            ],
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded calls"""
+        self.calls = 0
+        self.captures = 0
+        self._totals.clear()
+        self._slowest.clear()
+
+    def _record(self, profile: CallProfile) -> None:
+        self.calls += 1
+        self._totals["total"] = self._totals.get("total", 0.0) + profile.total
+        for name, seconds in profile.phases.items():
+            self._totals[name] = self._totals.get(name, 0.0) + seconds
+        if self.slowest <= 0:
+            return
+        entry = (profile.total, next(self._sequence), profile)
+        if len(self._slowest) < self.slowest:
+            heapq.heappush(self._slowest, entry)
+        elif entry[0] > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def _start_capture(self) -> Any:
+        if self._capturing or random.random() >= self.sample_rate:
+            return None
+        if self.profiler == "pyinstrument":
+            import pyinstrument
+
+            capture: Any = pyinstrument.Profiler(async_mode="enabled")
+            capture.start()
+        else:
+            capture = cProfile.Profile()
+            try:
+                capture.enable()
+            except ValueError:
+                # Another profiler is already active in this process
+                return None
+        self._capturing = True
+        return capture
+
+    def _stop_capture(self, capture: Any) -> str:
+        self._capturing = False
+        self.captures += 1
+        if self.profiler == "pyinstrument":
+            capture.stop()
+            return str(capture.output_text())
+        capture.disable()
+        out = io.StringIO()
+        stats = pstats.Stats(capture, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(CAPTURE_LINES)
+        return out.getvalue()
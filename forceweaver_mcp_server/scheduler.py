@@ -0,0 +1,129 @@
+"""
+ForceWeaver MCP Client Scheduler
+Periodic background health check sweeps across a set of orgs, with jittered
+start times, bounded concurrency and a per-sweep cost budget.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SweepStats:
+    """Outcome counts of one sweep"""
+
+    __slots__ = ("succeeded", "failed", "skipped", "cost_cents")
+
+    def __init__(self) -> None:
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.cost_cents = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"SweepStats(succeeded={self.succeeded}, failed={self.failed}, "
+            f"skipped={self.skipped}, cost_cents={self.cost_cents})"
+        )
+
+
+class SweepScheduler:
+    """Runs a health check for every org once per interval in the background
+
+    Each org starts at a random offset within the first jitter fraction of
+    the interval so sweeps don't hit the backend all at once. At most
+    concurrency checks run at a time, and once a sweep has spent (or would
+    spend, based on each org's last cost) budget_cents no more checks start
+    until the next sweep.
+    """
+
+    def __init__(
+        self,
+        run_check: Callable[[str], Awaitable[float]],
+        list_orgs: Callable[[], Awaitable[List[str]]],
+        interval: float,
+        jitter: float = 0.25,
+        concurrency: int = 4,
+        budget_cents: Optional[float] = None,
+        default_cost_cents: float = 0.0,
+    ):
+        self.run_check = run_check
+        self.list_orgs = list_orgs
+        self.interval = interval
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.budget_cents = budget_cents
+        self.default_cost_cents = default_cost_cents
+        self.last_stats: Optional[SweepStats] = None
+        self._last_cost: Dict[str, float] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the sweep loop is active"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sweeping in the background"""
+        if not self.running:
+            logger.info(f"Starting scheduled health checks every {self.interval}s")
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the sweep loop and any checks it is running"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def sweep(self) -> SweepStats:
+        """Run one jittered, budgeted pass over all orgs"""
+        stats = SweepStats()
+        orgs = await self.list_orgs()
+        if not orgs:
+            logger.warning("Scheduled sweep found no orgs to check")
+            return stats
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        spread = self.interval * self.jitter
+
+        async def check(org_id: str) -> None:
+            await asyncio.sleep(random.uniform(0, spread))
+            async with semaphore:
+                estimate = self._last_cost.get(org_id, self.default_cost_cents)
+                if (
+                    self.budget_cents is not None
+                    and stats.cost_cents + estimate > self.budget_cents
+                ):
+                    stats.skipped += 1
+                    return
+                # Reserve the estimate so concurrent checks see it
+                stats.cost_cents += estimate
+                try:
+                    cost = await self.run_check(org_id)
+                except Exception as e:
+                    stats.cost_cents -= estimate
+                    stats.failed += 1
+                    logger.warning(f"Scheduled health check for {org_id} failed: {e}")
+                    return
+                stats.cost_cents += cost - estimate
+                self._last_cost[org_id] = cost
+                stats.succeeded += 1
+
+        await asyncio.gather(*(check(org_id) for org_id in orgs))
+        self.last_stats = stats
+        logger.info(f"Scheduled sweep finished: {stats}")
+        return stats
+
+    async def _loop(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Scheduled sweep failed: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
@@ -0,0 +1,356 @@
+"""
+ForceWeaver Python SDK
+Async and blocking facades over ForceWeaverMCPClient for batch jobs, scripts
+and notebooks that call ForceWeaver without running an MCP server.
+"""
+
+import asyncio
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+import aiohttp
+
+from .exceptions import AuthenticationError, ConnectionError, ForceWeaverError
+from .models import HealthCheckReport
+from .orgs import OrgDirectory, OrgEntry, parse_orgs
+from .server import (
+    API_BASE_URL,
+    ORG_INDEX_TTL,
+    TRANSPORT,
+    USER_AGENT,
+    ForceWeaverMCPClient,
+    _deadline,
+    catalog,
+)
+from .transport import create_transport
+from .validation import (
+    DEFAULT_API_VERSION,
+    DEFAULT_CHECK_TYPES,
+    validate_org_reference,
+)
+
+T = TypeVar("T")
+
+# Health checks run at once by the bulk methods
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass(frozen=True, slots=True)
+class BulkResult:
+    """Outcome of one org's health check in a bulk run"""
+
+    org: str
+    report: Optional[HealthCheckReport] = None
+    error: Optional[ForceWeaverError] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the health check succeeded"""
+        return self.error is None
+
+    @property
+    def org_id(self) -> str:
+        """Canonical org ID when known, else the org reference as given"""
+        if self.report is not None and self.report.org_id:
+            return self.report.org_id
+        return self.org
+
+
+class AsyncForceWeaver:
+    """Async SDK returning typed results
+
+    Org references may be IDs, names, aliases or unique prefixes. Each
+    instance owns a ForceWeaverMCPClient unless one is passed in; by default
+    instances share open connections, so creating many of them is cheap.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_base_url: str = API_BASE_URL,
+        client: Optional[ForceWeaverMCPClient] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        api_key = api_key or os.environ.get("FORCEWEAVER_API_KEY")
+        if not api_key:
+            raise AuthenticationError(
+                "ForceWeaver API key is required - pass api_key or set "
+                "FORCEWEAVER_API_KEY"
+            )
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self.client = client or ForceWeaverMCPClient(
+            api_base_url,
+            transport=create_transport(
+                TRANSPORT,
+                aiohttp.ClientTimeout(total=120),
+                USER_AGENT,
+                shared_connector=True,
+            ),
+        )
+        self._owns_client = client is None
+        self._orgs = OrgDirectory(self._fetch_orgs, refresh_interval=ORG_INDEX_TTL)
+
+    async def __aenter__(self) -> "AsyncForceWeaver":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop background org refreshes and close the client if owned"""
+        await self._orgs.close()
+        if self._owns_client:
+            await self.client.close()
+
+    async def health_check(
+        self,
+        org: str,
+        check_types: Optional[Iterable[str]] = None,
+        api_version: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> HealthCheckReport:
+        """Run a health check and return its typed report"""
+        with ForceWeaverMCPClient.deadline(timeout):
+            params = await self._params(org, check_types, api_version)
+            result = await self.client.call_mcp_api_json(
+                "health/check", "POST", **params
+            )
+        return HealthCheckReport.from_response(result)
+
+    async def health_check_text(
+        self,
+        org: str,
+        check_types: Optional[Iterable[str]] = None,
+        api_version: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Run a health check and return the formatted report text"""
+        with ForceWeaverMCPClient.deadline(timeout):
+            params = await self._params(org, check_types, api_version)
+            output: str = await self.client.call_mcp_api(
+                "health/check", method="POST", **params
+            )
+        return output
+
+    async def health_check_many(
+        self,
+        orgs: Iterable[str],
+        check_types: Optional[Iterable[str]] = None,
+        api_version: Optional[str] = None,
+        timeout: Optional[float] = None,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BulkResult]:
+        """Run health checks concurrently, yielding results as they complete
+
+        Failures are yielded as results with an error rather than raised.
+        timeout applies to each check; leaving the loop early cancels the
+        checks still running.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+        check_types = list(check_types) if check_types is not None else None
+
+        async def check(org: str) -> BulkResult:
+            async with semaphore:
+                try:
+                    report = await self.health_check(
+                        org, check_types, api_version, timeout
+                    )
+                except ForceWeaverError as e:
+                    return BulkResult(org, error=e)
+                return BulkResult(org, report=report)
+
+        tasks = [asyncio.create_task(check(org)) for org in orgs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def list_orgs(self) -> List[OrgEntry]:
+        """Connected Salesforce orgs"""
+        return parse_orgs(await self._fetch_orgs(self.api_key))
+
+    async def usage(self) -> Dict[str, Any]:
+        """Raw usage/summary payload for the API key"""
+        return await self.client.call_mcp_api_json(
+            "usage/summary", method="GET", forceweaver_api_key=self.api_key
+        )
+
+    async def _fetch_orgs(self, api_key: str) -> Dict[str, Any]:
+        # Shared by every check waiting on the refresh, so no caller's deadline
+        token = _deadline.set(None)
+        try:
+            return await self.client.call_mcp_api_json(
+                "orgs/list", method="GET", forceweaver_api_key=api_key
+            )
+        finally:
+            _deadline.reset(token)
+
+    async def _resolve(self, org: str) -> str:
+        """Resolve an org reference, waiting on orgs/list only until the deadline"""
+        try:
+            return await asyncio.wait_for(
+                self._orgs.resolve(self.api_key, validate_org_reference(org)),
+                ForceWeaverMCPClient.remaining_time(),
+            )
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                "Request timeout - the org list took too long to load"
+            )
+
+    async def _params(
+        self,
+        org: str,
+        check_types: Optional[Iterable[str]],
+        api_version: Optional[str],
+    ) -> Dict[str, Any]:
+        return {
+            "forceweaver_api_key": self.api_key,
+            "org_id": await self._resolve(org),
+            "check_types": (
+                catalog.normalize_check_types(check_types)
+                if check_types
+                else list(DEFAULT_CHECK_TYPES)
+            ),
+            "api_version": catalog.normalize_api_version(
+                api_version or DEFAULT_API_VERSION
+            ),
+        }
+
+
+class ForceWeaver:
+    """Blocking SDK running AsyncForceWeaver on a background event loop thread
+
+    The loop lives as long as the instance, so repeated calls reuse pooled
+    connections. Use as a context manager or call close() when done.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, **kwargs: Any):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="forceweaver-sdk", daemon=True
+        )
+        self._thread.start()
+        try:
+            self.sdk = self._run(self._create(api_key, kwargs))
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    def __enter__(self) -> "ForceWeaver":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the client and stop the background loop"""
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.sdk.close())
+        finally:
+            self._stop_loop()
+
+    def health_check(
+        self,
+        org: str,
+        check_types: Optional[Iterable[str]] = None,
+        api_version: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> HealthCheckReport:
+        """Run a health check and return its typed report"""
+        return self._run(self.sdk.health_check(org, check_types, api_version, timeout))
+
+    def health_check_text(
+        self,
+        org: str,
+        check_types: Optional[Iterable[str]] = None,
+        api_version: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Run a health check and return the formatted report text"""
+        return self._run(
+            self.sdk.health_check_text(org, check_types, api_version, timeout)
+        )
+
+    def health_check_many(
+        self,
+        orgs: Iterable[str],
+        check_types: Optional[Iterable[str]] = None,
+        api_version: Optional[str] = None,
+        timeout: Optional[float] = None,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[BulkResult]:
+        """Run health checks concurrently, yielding results as they complete"""
+        results: "queue.Queue[Any]" = queue.Queue()
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async for result in self.sdk.health_check_many(
+                    orgs, check_types, api_version, timeout, concurrency
+                ):
+                    results.put(result)
+            except BaseException as e:
+                results.put(e)
+                raise
+            finally:
+                results.put(done)
+
+        future = asyncio.run_coroutine_threadsafe(produce(), self._loop)
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Stopping early cancels the checks still running
+            future.cancel()
+
+    def list_orgs(self) -> List[OrgEntry]:
+        """Connected Salesforce orgs"""
+        return self._run(self.sdk.list_orgs())
+
+    def usage(self) -> Dict[str, Any]:
+        """Raw usage/summary payload for the API key"""
+        return self._run(self.sdk.usage())
+
+    @staticmethod
+    async def _create(
+        api_key: Optional[str], kwargs: Dict[str, Any]
+    ) -> AsyncForceWeaver:
+        # Built on the loop thread so loop-bound state is created there
+        return AsyncForceWeaver(api_key, **kwargs)
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
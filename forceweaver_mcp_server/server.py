@@ -8,16 +8,105 @@ import logging
 import os
 import sys
 import time
-from typing import List, Optional, Union
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 import aiohttp
 from mcp.server.fastmcp import FastMCP
 
-from .exceptions import AuthenticationError, ConnectionError, ForceWeaverError
+from .analytics import OVERALL, TrendStore, tenant_key
+from .budget import CostGuard
+from .cache import ResultCache, cache_key
+from .cassette import RecordingTransport, ReplayTransport
+from .exceptions import (
+    AuthenticationError,
+    ConnectionError,
+    ForceWeaverError,
+    RateLimitError,
+    ServiceUnavailableError,
+    ValidationError,
+)
+from .jobs import FAILED, RUNNING, JobManager
+from .models import HealthCheckReport, grade_for_score, validate_report_fields
+from .orgs import OrgDirectory
+from .profiling import Profiler, current_profile, mark, phase, trace_config
+from .scheduler import SweepScheduler
+from .transport import (
+    AiohttpTransport,
+    Transport,
+    TransportError,
+    TransportResponse,
+    create_transport,
+)
+from .validation import (
+    CHECK_TYPES,
+    DEFAULT_API_VERSION,
+    DEFAULT_CHECK_TYPES,
+    ValidationCatalog,
+    validate_org_reference,
+)
 
 # Version info
 VERSION = "1.1.0"
+USER_AGENT = f"ForceWeaver-MCP-Client/{VERSION}"
 API_BASE_URL = os.environ.get("FORCEWEAVER_API_URL", "https://mcp.forceweaver.com")
+SHUTDOWN_TIMEOUT = float(os.environ.get("FORCEWEAVER_SHUTDOWN_TIMEOUT", "30"))
+MAX_JOBS = int(os.environ.get("FORCEWEAVER_MAX_JOBS", "100"))
+JOB_TTL = float(os.environ.get("FORCEWEAVER_JOB_TTL", "3600"))
+ORG_INDEX_TTL = float(os.environ.get("FORCEWEAVER_ORG_INDEX_TTL", "300"))
+TREND_MAX_POINTS = int(os.environ.get("FORCEWEAVER_TREND_MAX_POINTS", "1000"))
+RESULT_CACHE_SIZE = int(os.environ.get("FORCEWEAVER_RESULT_CACHE_SIZE", "1000"))
+# Scheduled sweeps (HTTP transport only); an interval of 0 disables them
+SCHEDULE_INTERVAL = float(os.environ.get("FORCEWEAVER_SCHEDULE_INTERVAL", "0"))
+SCHEDULE_ORGS = os.environ.get("FORCEWEAVER_SCHEDULE_ORGS", "")
+SCHEDULE_CONCURRENCY = int(os.environ.get("FORCEWEAVER_SCHEDULE_CONCURRENCY", "4"))
+SCHEDULE_JITTER = float(os.environ.get("FORCEWEAVER_SCHEDULE_JITTER", "0.25"))
+SCHEDULE_BUDGET_CENTS = os.environ.get("FORCEWEAVER_SCHEDULE_BUDGET_CENTS")
+# Comma-separated overrides for the locally validated check types/API versions
+CHECK_TYPES_OVERRIDE = os.environ.get("FORCEWEAVER_CHECK_TYPES")
+API_VERSIONS_OVERRIDE = os.environ.get("FORCEWEAVER_API_VERSIONS")
+# Per-API-key spend budgets enforced before health checks are sent
+BUDGET_HOURLY_CENTS = os.environ.get("FORCEWEAVER_BUDGET_HOURLY_CENTS")
+BUDGET_DAILY_CENTS = os.environ.get("FORCEWEAVER_BUDGET_DAILY_CENTS")
+BUDGET_MODE = os.environ.get("FORCEWEAVER_BUDGET_MODE", "reject")
+BUDGET_MAX_WAIT = float(os.environ.get("FORCEWEAVER_BUDGET_MAX_WAIT", "60"))
+USAGE_SYNC_INTERVAL = float(os.environ.get("FORCEWEAVER_USAGE_SYNC_INTERVAL", "300"))
+# Backend HTTP transport: "aiohttp" (HTTP/1.1) or "http2" (requires httpx[http2])
+TRANSPORT = os.environ.get("FORCEWEAVER_TRANSPORT", "aiohttp")
+# Share one aiohttp connector (and its open connections) across clients
+SHARED_CONNECTOR = bool(int(os.environ.get("FORCEWEAVER_SHARED_CONNECTOR", "0")))
+# Record backend traffic to, or replay it from, a cassette file
+RECORD_PATH = os.environ.get("FORCEWEAVER_RECORD")
+REPLAY_PATH = os.environ.get("FORCEWEAVER_REPLAY")
+REPLAY_SPEED = float(os.environ.get("FORCEWEAVER_REPLAY_SPEED", "1"))
+# Per-phase timings of backend calls, reported by get_client_diagnostics
+PROFILE = bool(int(os.environ.get("FORCEWEAVER_PROFILE", "0")))
+PROFILE_SLOWEST = int(os.environ.get("FORCEWEAVER_PROFILE_SLOWEST", "20"))
+PROFILE_SAMPLE_RATE = float(os.environ.get("FORCEWEAVER_PROFILE_SAMPLE_RATE", "0"))
+PROFILER = os.environ.get("FORCEWEAVER_PROFILER", "cprofile")
+
+# Header telling the backend how many milliseconds the caller will still wait
+DEADLINE_HEADER = "X-ForceWeaver-Timeout-Ms"
+
+# Absolute time.monotonic() deadline for backend calls in the current context
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    "forceweaver_deadline", default=None
+)
+
+# Called with (endpoint, request params, decoded JSON) for each successful call
+ResultListener = Callable[[str, Dict[str, Any], Dict[str, Any]], None]
 
 # Configure logging to stderr (MCP best practice)
 logging.basicConfig(
@@ -27,42 +116,165 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize FastMCP server
-mcp = FastMCP("ForceWeaver MCP Client")
-
 
 class ForceWeaverMCPClient:
     """Enhanced client for ForceWeaver cloud services with proper error handling"""
 
-    def __init__(self, api_base_url: str = API_BASE_URL):
+    def __init__(
+        self,
+        api_base_url: str = API_BASE_URL,
+        cost_guard: Optional[CostGuard] = None,
+        transport: Optional[Transport] = None,
+        profiler: Optional[Profiler] = None,
+    ):
         self.api_base_url = api_base_url.rstrip("/")
-        self.session: Optional[aiohttp.ClientSession] = None
         self.timeout = aiohttp.ClientTimeout(total=120)
+        self.transport = transport or AiohttpTransport(self.timeout, USER_AGENT)
+        self.accepting = True
+        # Without budgets the guard still honours 429 cooldowns locally
+        self.cost_guard = cost_guard or CostGuard()
+        # Opt-in per-call timings; None skips profiling entirely
+        self.profiler = profiler
+        self._inflight: Set[asyncio.Future] = set()
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+        self._result_listeners: List[ResultListener] = [self._observe_cost]
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """The aiohttp session of the default transport, if open"""
+        if isinstance(self.transport, AiohttpTransport):
+            return self.transport.session
+        return None
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session with proper SSL handling"""
-        if self.session is None or self.session.closed:
-            import ssl
+        """Get or create the aiohttp session of the default transport"""
+        if not isinstance(self.transport, AiohttpTransport):
+            raise ForceWeaverError(
+                f"The {self.transport.name} transport has no aiohttp session"
+            )
+        return await self.transport.get_session()
+
+    @staticmethod
+    @contextmanager
+    def deadline(timeout: Optional[float]) -> Iterator[None]:
+        """Bound backend calls made inside the block to timeout seconds
+
+        Nested deadlines can only shorten the budget. None leaves it unchanged.
+        """
+        if timeout is None:
+            yield
+            return
+        if timeout <= 0:
+            raise ValidationError(
+                "❌ Invalid Timeout\n\ntimeout_seconds must be greater than zero."
+            )
 
-            import certifi
+        current = _deadline.get()
+        new = time.monotonic() + timeout
+        token = _deadline.set(new if current is None else min(current, new))
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
 
-            # Proper SSL context as per security best practices
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context, limit=10, ttl_dns_cache=300, use_dns_cache=True
-            )
+    @staticmethod
+    def remaining_time() -> Optional[float]:
+        """Seconds left before the current deadline, or None if unbounded"""
+        deadline = _deadline.get()
+        return None if deadline is None else deadline - time.monotonic()
 
-            self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=self.timeout,
-                headers={"User-Agent": f"ForceWeaver-MCP-Client/{VERSION}"},
+    async def call_mcp_api(self, endpoint: str, method: str = "POST", **params) -> str:
+        """Call ForceWeaver API and return the AI-friendly formatted output"""
+        output: str = await self._call_tracked(
+            endpoint, method, params, raw=False, mcp_format=True
+        )
+        return output
+
+    async def call_mcp_api_json(
+        self, endpoint: str, method: str = "GET", mcp_format: bool = False, **params
+    ) -> Dict[str, Any]:
+        """Call ForceWeaver API and return the raw JSON payload
+
+        With mcp_format the payload is the one call_mcp_api displays, so
+        format_output() gives the same text.
+        """
+        result: Dict[str, Any] = await self._call_tracked(
+            endpoint, method, params, raw=True, mcp_format=mcp_format
+        )
+        return result
+
+    async def _call_tracked(
+        self,
+        endpoint: str,
+        method: str,
+        params: Dict[str, Any],
+        raw: bool,
+        mcp_format: bool,
+    ) -> Any:
+        """Call ForceWeaver API, tracking the call so shutdown can drain it"""
+        if not self.accepting:
+            raise ServiceUnavailableError(
+                "ForceWeaver MCP Client is shutting down - please retry shortly"
             )
-        return self.session
 
-    async def call_mcp_api(self, endpoint: str, method: str = "POST", **params) -> str:
+        done = asyncio.get_running_loop().create_future()
+        self._inflight.add(done)
+        try:
+            if self.profiler is None:
+                return await self._call_budgeted(
+                    endpoint, method, params, raw, mcp_format
+                )
+            async with self.profiler.profile(endpoint, method.upper()):
+                return await self._call_budgeted(
+                    endpoint, method, params, raw, mcp_format
+                )
+        finally:
+            self._inflight.discard(done)
+            done.set_result(None)
+
+    async def _call_budgeted(
+        self,
+        endpoint: str,
+        method: str,
+        params: Dict[str, Any],
+        raw: bool,
+        mcp_format: bool,
+    ) -> Any:
+        """Call ForceWeaver API, reserving health check costs against budgets"""
+        api_key = params.get("forceweaver_api_key")
+        reservation = None
+        succeeded = False
+        try:
+            if endpoint == "health/check" and api_key:
+                with phase("budget"):
+                    reservation = await self.cost_guard.reserve(
+                        api_key, self._estimate_cost(params), self.remaining_time()
+                    )
+            result = await self._call_mcp_api(endpoint, method, params, raw, mcp_format)
+            succeeded = True
+            return result
+        except RateLimitError as e:
+            if reservation is not None and api_key:
+                self.cost_guard.block(api_key, e.retry_after)
+            raise
+        finally:
+            if reservation is not None:
+                self.cost_guard.settle(reservation, charged=succeeded)
+
+    @staticmethod
+    def _estimate_cost(params: Dict[str, Any]) -> float:
+        """Expected cost in cents of a health check: 1 cent per check type"""
+        return float(len(params.get("check_types") or DEFAULT_CHECK_TYPES))
+
+    async def _call_mcp_api(
+        self,
+        endpoint: str,
+        method: str,
+        params: Dict[str, Any],
+        raw: bool = False,
+        mcp_format: bool = True,
+    ) -> Any:
         """Call ForceWeaver API with comprehensive error handling"""
-        session = await self._get_session()
-
         # Extract API key for authorization
         api_key = params.get("forceweaver_api_key")
         if not api_key:
@@ -72,23 +284,34 @@ class ForceWeaverMCPClient:
         # Remove API key from params (it goes in header)
         request_params = {k: v for k, v in params.items() if k != "forceweaver_api_key"}
 
+        process = self._process_json_response if raw else self._process_response
+
         try:
             # Add MCP format parameter for AI-friendly responses
-            url = f"{self.api_base_url}/api/v1.0/{endpoint}?format=mcp"
+            url = f"{self.api_base_url}/api/v1.0/{endpoint}"
+            if mcp_format:
+                url += "?format=mcp"
             headers = {"Authorization": f"Bearer {api_key}"}
+            timeout = self._request_timeout(headers)
 
             logger.info(f"Calling ForceWeaver API: {endpoint}")
             start_time = time.time()
 
-            # Call appropriate HTTP method
-            if method.upper() == "GET":
-                async with session.get(url, headers=headers) as response:
-                    return await self._process_response(response, start_time, endpoint)
-            else:
-                async with session.post(
-                    url, json=request_params, headers=headers
-                ) as response:
-                    return await self._process_response(response, start_time, endpoint)
+            # Only non-GET requests carry a JSON body
+            method = method.upper()
+            body = None if method == "GET" else request_params
+            sent = time.perf_counter()
+            async with self.transport.request(
+                method, url, headers, json=body, timeout=timeout
+            ) as response:
+                mark("ttfb", sent)
+                return await process(response, start_time, endpoint, params)
+
+        except asyncio.CancelledError:
+            # The MCP request was cancelled; leaving the request context above
+            # has already released the connection
+            logger.info(f"Call to {endpoint} cancelled by the caller")
+            raise
 
         except asyncio.TimeoutError:
             logger.error(f"Timeout calling {endpoint}")
@@ -96,7 +319,7 @@ class ForceWeaverMCPClient:
                 "Request timeout - the health check took too long to complete"
             )
 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, TransportError) as e:
             logger.error(f"Connection error calling {endpoint}: {e}")
             raise ConnectionError(f"Connection error: {str(e)}")
 
@@ -108,39 +331,95 @@ class ForceWeaverMCPClient:
             logger.error(f"Unexpected error calling {endpoint}: {e}")
             raise ForceWeaverError(f"Unexpected error: {str(e)}")
 
+    def _request_timeout(self, headers: Dict[str, str]) -> Optional[float]:
+        """Derive the attempt timeout from the deadline and advertise the budget"""
+        remaining = self.remaining_time()
+        if remaining is None:
+            return self.timeout.total
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+
+        headers[DEADLINE_HEADER] = str(int(remaining * 1000))
+        if self.timeout.total is not None:
+            remaining = min(self.timeout.total, remaining)
+        return remaining
+
     async def _process_response(
-        self, response: aiohttp.ClientResponse, start_time: float, endpoint: str
+        self,
+        response: TransportResponse,
+        start_time: float,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
     ) -> str:
-        """Process API response with detailed error handling"""
+        """Process API response into display text with detailed error handling"""
+        result = await self._read_response(response, start_time, endpoint, params)
+        return self.format_output(result)
+
+    def format_output(self, result: Dict[str, Any]) -> str:
+        """Display text for a decoded MCP-format payload"""
+        # DEBUG: Log what we actually receive
+        logger.info(f"API Response keys: {list(result.keys())}")
+        logger.info(f"Has formatted_output: {'formatted_output' in result}")
+        if "formatted_output" in result:
+            logger.info(f"formatted_output length: {len(result['formatted_output'])}")
+
+        # Return formatted output if available (MCP format)
+        if "formatted_output" in result:
+            logger.info("Using formatted_output from backend")
+            return str(result["formatted_output"])
+        elif "success" in result and result["success"]:
+            logger.info("Using custom formatting for raw JSON")
+            # Format the raw JSON response for better display
+            with phase("format"):
+                return self._format_health_check_response(result)
+        else:
+            raise ForceWeaverError(
+                f"API Error: {result.get('message', 'Unknown error')}"
+            )
+
+    async def _process_json_response(
+        self,
+        response: TransportResponse,
+        start_time: float,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Process API response into its JSON payload with detailed error handling"""
+        result = await self._read_response(response, start_time, endpoint, params)
+
+        if result.get("success") is False:
+            raise ForceWeaverError(
+                f"API Error: {result.get('message', 'Unknown error')}"
+            )
+        return result
+
+    async def _read_response(
+        self,
+        response: TransportResponse,
+        start_time: float,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Decode a successful response, raising for HTTP error statuses"""
         execution_time = int((time.time() - start_time) * 1000)
         logger.info(
             f"API call to {endpoint} completed in {execution_time}ms "
             f"(HTTP {response.status})"
         )
 
-        if response.status == 200:
-            result = await response.json()
-
-            # DEBUG: Log what we actually receive
-            logger.info(f"API Response keys: {list(result.keys())}")
-            logger.info(f"Has formatted_output: {'formatted_output' in result}")
-            if "formatted_output" in result:
-                logger.info(
-                    f"formatted_output length: {len(result['formatted_output'])}"
-                )
+        profile = current_profile()
+        if profile is not None:
+            profile.status = response.status
 
-            # Return formatted output if available (MCP format)
-            if "formatted_output" in result:
-                logger.info("Using formatted_output from backend")
-                return str(result["formatted_output"])
-            elif "success" in result and result["success"]:
-                logger.info("Using custom formatting for raw JSON")
-                # Format the raw JSON response for better display
-                return self._format_health_check_response(result)
-            else:
-                raise ForceWeaverError(
-                    f"API Error: {result.get('message', 'Unknown error')}"
-                )
+        if response.status == 200:
+            if profile is not None:
+                # Read the body first so download and decode are timed apart
+                with phase("download"):
+                    await response.text()
+            with phase("decode"):
+                result: Dict[str, Any] = await response.json()
+            self._notify_result_listeners(endpoint, params or {}, result)
+            return result
 
         elif response.status == 401:
             raise AuthenticationError(
@@ -157,10 +436,11 @@ class ForceWeaverMCPClient:
             )
 
         elif response.status == 429:
-            raise ForceWeaverError(
+            raise RateLimitError(
                 "❌ Rate Limited\n\n"
                 "You've exceeded your usage limits.\n"
-                "Check your usage at: https://mcp.forceweaver.com/dashboard/usage"
+                "Check your usage at: https://mcp.forceweaver.com/dashboard/usage",
+                retry_after=_retry_after(response),
             )
 
         elif response.status == 404:
@@ -237,58 +517,211 @@ class ForceWeaverMCPClient:
 
     def _get_grade(self, score: Union[int, float]) -> str:
         """Convert numeric score to letter grade"""
-        if score >= 90:
-            return "A+"
-        elif score >= 80:
-            return "A"
-        elif score >= 70:
-            return "B"
-        elif score >= 60:
-            return "C"
-        elif score >= 50:
-            return "D"
-        else:
-            return "F"
+        return grade_for_score(score)
+
+    @property
+    def inflight(self) -> int:
+        """Number of backend calls currently in progress"""
+        return len(self._inflight)
+
+    def add_result_listener(self, listener: ResultListener) -> None:
+        """Register a callback for the decoded payload of each successful call"""
+        self._result_listeners.append(listener)
+
+    def _observe_cost(
+        self, endpoint: str, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> None:
+        """Feed response costs and usage summaries into the cost guard"""
+        self.cost_guard.observe(endpoint, params, result)
+
+    def _notify_result_listeners(
+        self, endpoint: str, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> None:
+        for listener in self._result_listeners:
+            try:
+                listener(endpoint, params, result)
+            except Exception as e:
+                logger.error(f"Result listener {listener!r} failed: {e}")
+
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Register a coroutine function to run after draining, before close"""
+        self._shutdown_hooks.append(hook)
+
+    async def drain(self, timeout: float = SHUTDOWN_TIMEOUT) -> bool:
+        """Wait for in-flight calls to finish; return False if the deadline hit"""
+        if not self._inflight:
+            return True
+
+        _, pending = await asyncio.wait(set(self._inflight), timeout=timeout)
+        if pending:
+            logger.warning(
+                f"Shutdown deadline of {timeout}s reached with "
+                f"{len(pending)} backend call(s) still in flight"
+            )
+            return False
+        return True
+
+    async def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Stop accepting calls, drain in-flight ones, run hooks and close"""
+        self.accepting = False
+        if self._inflight:
+            logger.info(f"Draining {len(self._inflight)} in-flight backend call(s)")
+        await self.drain(timeout)
+
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.error(f"Shutdown hook {hook!r} failed: {e}")
+
+        await self.cost_guard.close()
+        await self.close()
 
     async def close(self) -> None:
         """Close HTTP session"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        await self.transport.close()
+
+
+def _retry_after(response: TransportResponse) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, if the backend sent one"""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _build_transport() -> Transport:
+    """Backend transport from the environment, with optional record/replay"""
+    if REPLAY_PATH:
+        logger.info(f"Replaying backend traffic from {REPLAY_PATH}")
+        return ReplayTransport(REPLAY_PATH, speed=REPLAY_SPEED)
+
+    transport = create_transport(
+        TRANSPORT,
+        aiohttp.ClientTimeout(total=120),
+        USER_AGENT,
+        shared_connector=SHARED_CONNECTOR,
+        trace_configs=[trace_config()] if PROFILE else None,
+    )
+    if RECORD_PATH:
+        logger.info(f"Recording redacted backend traffic to {RECORD_PATH}")
+        transport = RecordingTransport(transport, RECORD_PATH)
+    return transport
 
 
 # Global client instance
-client = ForceWeaverMCPClient()
+client = ForceWeaverMCPClient(
+    transport=_build_transport(),
+    profiler=(
+        Profiler(PROFILE_SLOWEST, PROFILE_SAMPLE_RATE, PROFILER) if PROFILE else None
+    ),
+)
 
 
-@mcp.tool()
-async def revenue_cloud_health_check(
-    forceweaver_api_key: Optional[str] = None,
-    salesforce_org_id: Optional[str] = None,
-    check_types: Optional[List[str]] = None,
-    api_version: Optional[str] = None,
-) -> str:
-    """
-    Perform comprehensive Salesforce Revenue Cloud health check and analysis.
+async def _fetch_usage(api_key: str) -> Dict[str, Any]:
+    """Fetch the raw usage/summary payload for cost guard syncs"""
+    # Syncs run in the background for every caller of the key, so they must
+    # not inherit the deadline of the call whose reservation started them
+    token = _deadline.set(None)
+    try:
+        return await client.call_mcp_api_json(
+            "usage/summary", method="GET", forceweaver_api_key=api_key
+        )
+    finally:
+        _deadline.reset(token)
 
-    Performs advanced analysis of your Salesforce org including:
-    - Organization setup and configuration validation
-    - Sharing model analysis for PCM objects
-    - Bundle hierarchy and dependency analysis
-    - Attribute picklist integrity validation
 
-    Args:
-        forceweaver_api_key: Your ForceWeaver API key (optional if set
-            via environment)
-        salesforce_org_id: Your Salesforce org identifier (optional if set
-            via environment)
-        check_types: Optional list of specific checks to run (default: all
-            basic checks)
-        api_version: Optional Salesforce API version (default: v64.0)
+# Spend budgets per API key, synced periodically with usage/summary
+client.cost_guard = CostGuard(
+    hourly_cents=float(BUDGET_HOURLY_CENTS) if BUDGET_HOURLY_CENTS else None,
+    daily_cents=float(BUDGET_DAILY_CENTS) if BUDGET_DAILY_CENTS else None,
+    mode=BUDGET_MODE,
+    max_wait=BUDGET_MAX_WAIT,
+    fetch_usage=_fetch_usage,
+    sync_interval=USAGE_SYNC_INTERVAL,
+)
 
-    Returns:
-        Comprehensive health report with scores, findings, and recommendations
-    """
+# Catalog of supported inputs, validated locally before any network call
+catalog = ValidationCatalog(
+    check_types=(
+        CHECK_TYPES_OVERRIDE.split(",") if CHECK_TYPES_OVERRIDE else CHECK_TYPES
+    ),
+    api_versions=API_VERSIONS_OVERRIDE.split(",") if API_VERSIONS_OVERRIDE else None,
+)
+
+# Score history of the health checks this client has run, per API key
+trends = TrendStore(max_points=TREND_MAX_POINTS)
+
+
+def _record_trend(
+    endpoint: str, params: Dict[str, Any], result: Dict[str, Any]
+) -> None:
+    """Feed health check scores into the trend store"""
+    api_key = params.get("forceweaver_api_key")
+    if endpoint == "health/check" and api_key:
+        trends.record(
+            tenant_key(api_key),
+            HealthCheckReport.from_response(result),
+            org_id=params.get("org_id"),
+        )
+
+
+client.add_result_listener(_record_trend)
+
+# Latest health check output per org, shared by sweeps and interactive calls
+results = ResultCache(max_entries=RESULT_CACHE_SIZE)
+
+# Background health check jobs, cancelled at process shutdown once in-flight
+# calls have drained
+jobs = JobManager(max_jobs=MAX_JOBS, ttl=JOB_TTL)
+client.add_shutdown_hook(jobs.shutdown)
+
+
+async def _fetch_orgs(api_key: str) -> Dict[str, Any]:
+    """Fetch the raw orgs/list payload for the org index"""
+    # The refresh is shared by every caller waiting on it, so it must not
+    # inherit the deadline of whichever tool call happened to start it
+    token = _deadline.set(None)
+    try:
+        return await client.call_mcp_api_json(
+            "orgs/list", method="GET", forceweaver_api_key=api_key
+        )
+    finally:
+        _deadline.reset(token)
+
+
+# Connected-org index used to resolve names and reject unknown orgs locally
+org_directory = OrgDirectory(_fetch_orgs, refresh_interval=ORG_INDEX_TTL)
+client.add_shutdown_hook(org_directory.close)
+
+
+async def _resolve_org(api_key: str, org_ref: str) -> str:
+    """Resolve an org reference, waiting on orgs/list only until the deadline"""
+    try:
+        return await asyncio.wait_for(
+            org_directory.resolve(api_key, org_ref),
+            ForceWeaverMCPClient.remaining_time(),
+        )
+    except asyncio.TimeoutError:
+        raise ConnectionError("Request timeout - the org list took too long to load")
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Accept calls while a session runs"""
+    # SSE opens one lifespan per connected session, so the client and the
+    # background jobs are only shut down when the process stops (_serve)
+    client.accepting = True
+    yield
+
+
+def _health_check_params(
+    forceweaver_api_key: Optional[str],
+    salesforce_org_id: Optional[str],
+    check_types: Optional[List[str]],
+    api_version: Optional[str],
+) -> Dict[str, Any]:
+    """Resolve health check credentials and defaults into backend parameters"""
     # Use environment variables as fallback
     api_key = forceweaver_api_key or os.environ.get("FORCEWEAVER_API_KEY")
     org_id = salesforce_org_id or os.environ.get("SALESFORCE_ORG_ID")
@@ -334,24 +767,151 @@ async def revenue_cloud_health_check(
             "proceed with the analysis."
         )
 
-    logger.info(f"Starting health check for org: {org_id}")
+    return {
+        "forceweaver_api_key": api_key,
+        # Backend expects 'org_id', not 'salesforce_org_id'
+        "org_id": validate_org_reference(org_id),
+        "check_types": (
+            catalog.normalize_check_types(check_types)
+            if check_types
+            else list(DEFAULT_CHECK_TYPES)
+        ),
+        "api_version": catalog.normalize_api_version(
+            api_version or DEFAULT_API_VERSION
+        ),
+    }
 
-    return await client.call_mcp_api(
-        "health/check",
-        method="POST",
-        forceweaver_api_key=api_key,
-        org_id=org_id,  # Backend expects 'org_id', not 'salesforce_org_id'
-        check_types=check_types
-        or ["basic_org_info", "sharing_model", "bundle_analysis"],
-        api_version=api_version or "v64.0",
+
+# Initialize FastMCP server
+mcp = FastMCP("ForceWeaver MCP Client", lifespan=lifespan)
+
+
+@mcp.tool()
+async def revenue_cloud_health_check(
+    forceweaver_api_key: Optional[str] = None,
+    salesforce_org_id: Optional[str] = None,
+    check_types: Optional[List[str]] = None,
+    api_version: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
+    max_age_seconds: Optional[float] = None,
+) -> str:
+    """
+    Perform comprehensive Salesforce Revenue Cloud health check and analysis.
+
+    Performs advanced analysis of your Salesforce org including:
+    - Organization setup and configuration validation
+    - Sharing model analysis for PCM objects
+    - Bundle hierarchy and dependency analysis
+    - Attribute picklist integrity validation
+
+    Args:
+        forceweaver_api_key: Your ForceWeaver API key (optional if set
+            via environment)
+        salesforce_org_id: Your Salesforce org ID, name, alias or a unique
+            prefix of one (optional if set via environment)
+        check_types: Optional list of specific checks to run (default: all
+            basic checks)
+        api_version: Optional Salesforce API version (default: v64.0)
+        timeout_seconds: Optional time limit in seconds; the backend is told
+            how long it has and the call is abandoned once it passes
+        max_age_seconds: Optional; return the latest result for the same org
+            and checks instead of running a new check if it is at most this
+            many seconds old (e.g. from a scheduled sweep)
+
+    Returns:
+        Comprehensive health report with scores, findings, and recommendations
+    """
+    params = _health_check_params(
+        forceweaver_api_key, salesforce_org_id, check_types, api_version
+    )
+
+    # The deadline also bounds org resolution and any budget wait
+    with ForceWeaverMCPClient.deadline(timeout_seconds):
+        params["org_id"] = await _resolve_org(
+            params["forceweaver_api_key"], params["org_id"]
+        )
+
+        key = cache_key(
+            tenant_key(params["forceweaver_api_key"]),
+            params["org_id"],
+            params["check_types"],
+            params["api_version"],
+        )
+        if max_age_seconds is not None:
+            cached = results.get(key, max_age_seconds)
+            if cached is not None:
+                age = int(time.time() - cached[0])
+                logger.info(
+                    f"Using {age}s old health check for org: {params['org_id']}"
+                )
+                return cached[1]
+
+        logger.info(f"Starting health check for org: {params['org_id']}")
+
+        output = await client.call_mcp_api("health/check", method="POST", **params)
+
+    results.put(key, output)
+    return output
+
+
+@mcp.tool()
+async def revenue_cloud_health_report(
+    forceweaver_api_key: Optional[str] = None,
+    salesforce_org_id: Optional[str] = None,
+    check_types: Optional[List[str]] = None,
+    api_version: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    summary_only: bool = False,
+    timeout_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run a Revenue Cloud health check and return the results as structured data.
+
+    Same checks as revenue_cloud_health_check, but returns a compact JSON
+    object for automation instead of a formatted report.
+
+    Args:
+        forceweaver_api_key: Your ForceWeaver API key (optional if set
+            via environment)
+        salesforce_org_id: Your Salesforce org ID, name, alias or a unique
+            prefix of one (optional if set via environment)
+        check_types: Optional list of specific checks to run (default: all
+            basic checks)
+        api_version: Optional Salesforce API version (default: v64.0)
+        fields: Optional subset of org_id, org_name, timestamp, overall_score,
+            grade, execution_time_ms, cost_cents, checks_performed and checks
+        summary_only: Return per-check status and score without details
+        timeout_seconds: Optional time limit in seconds; the backend is told
+            how long it has and the call is abandoned once it passes
+
+    Returns:
+        Health check scores, grade, cost and per-check status, score and details
+    """
+    # Rejected before the (charged) health check is sent
+    validate_report_fields(fields)
+    params = _health_check_params(
+        forceweaver_api_key, salesforce_org_id, check_types, api_version
     )
 
+    with ForceWeaverMCPClient.deadline(timeout_seconds):
+        params["org_id"] = await _resolve_org(
+            params["forceweaver_api_key"], params["org_id"]
+        )
+
+        logger.info(f"Starting structured health check for org: {params['org_id']}")
+
+        result = await client.call_mcp_api_json("health/check", "POST", **params)
+
+    report = HealthCheckReport.from_response(result)
+    return report.to_dict(fields=fields, summary_only=summary_only)
+
 
 @mcp.tool()
 async def get_detailed_bundle_analysis(
     forceweaver_api_key: Optional[str] = None,
     salesforce_org_id: Optional[str] = None,
     api_version: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
 ) -> str:
     """
     Get detailed Revenue Cloud bundle hierarchy analysis with comprehensive statistics.
@@ -366,9 +926,11 @@ async def get_detailed_bundle_analysis(
     Args:
         forceweaver_api_key: Your ForceWeaver API key (optional if set
             via environment)
-        salesforce_org_id: Your Salesforce org identifier (optional if set
-            via environment)
+        salesforce_org_id: Your Salesforce org ID, name, alias or a unique
+            prefix of one (optional if set via environment)
         api_version: Optional Salesforce API version (default: v64.0)
+        timeout_seconds: Optional time limit in seconds; the backend is told
+            how long it has and the call is abandoned once it passes
 
     Returns:
         Detailed bundle analysis report with comprehensive statistics
@@ -389,25 +951,36 @@ async def get_detailed_bundle_analysis(
             "SALESFORCE_ORG_ID environment variable."
         )
 
-    logger.info(f"Starting detailed bundle analysis for org: {org_id}")
+    org_ref = validate_org_reference(org_id)
+    api_version = catalog.normalize_api_version(api_version or DEFAULT_API_VERSION)
 
-    return await client.call_mcp_api(
-        "health/check",
-        method="POST",
-        forceweaver_api_key=api_key,
-        org_id=org_id,
-        check_types=["bundle_analysis"],
-        api_version=api_version or "v64.0",
-    )
+    with ForceWeaverMCPClient.deadline(timeout_seconds):
+        org_id = await _resolve_org(api_key, org_ref)
+
+        logger.info(f"Starting detailed bundle analysis for org: {org_id}")
+
+        return await client.call_mcp_api(
+            "health/check",
+            method="POST",
+            forceweaver_api_key=api_key,
+            org_id=org_id,
+            check_types=["bundle_analysis"],
+            api_version=api_version,
+        )
 
 
 @mcp.tool()
-async def list_available_orgs(forceweaver_api_key: Optional[str] = None) -> str:
+async def list_available_orgs(
+    forceweaver_api_key: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
+) -> str:
     """
     List all Salesforce organizations connected to your ForceWeaver account.
 
     Args:
         forceweaver_api_key: Your ForceWeaver API key (optional if set via environment)
+        timeout_seconds: Optional time limit in seconds; the backend is told
+            how long it has and the call is abandoned once it passes
 
     Returns:
         List of connected Salesforce organizations
@@ -423,18 +996,24 @@ async def list_available_orgs(forceweaver_api_key: Optional[str] = None) -> str:
 
     logger.info("Listing available orgs")
 
-    return await client.call_mcp_api(
-        "orgs/list", method="GET", forceweaver_api_key=api_key
-    )
+    with ForceWeaverMCPClient.deadline(timeout_seconds):
+        return await client.call_mcp_api(
+            "orgs/list", method="GET", forceweaver_api_key=api_key
+        )
 
 
 @mcp.tool()
-async def get_usage_summary(forceweaver_api_key: Optional[str] = None) -> str:
+async def get_usage_summary(
+    forceweaver_api_key: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
+) -> str:
     """
     Get current usage statistics and subscription status.
 
     Args:
         forceweaver_api_key: Your ForceWeaver API key (optional if set via environment)
+        timeout_seconds: Optional time limit in seconds; the backend is told
+            how long it has and the call is abandoned once it passes
 
     Returns:
         Usage summary and subscription status
@@ -450,20 +1029,316 @@ async def get_usage_summary(forceweaver_api_key: Optional[str] = None) -> str:
 
     logger.info("Getting usage summary")
 
-    return await client.call_mcp_api(
-        "usage/summary", method="GET", forceweaver_api_key=api_key
+    with ForceWeaverMCPClient.deadline(timeout_seconds):
+        return await client.call_mcp_api(
+            "usage/summary", method="GET", forceweaver_api_key=api_key
+        )
+
+
+@mcp.tool()
+async def start_health_check(
+    forceweaver_api_key: Optional[str] = None,
+    salesforce_org_id: Optional[str] = None,
+    check_types: Optional[List[str]] = None,
+    api_version: Optional[str] = None,
+) -> str:
+    """
+    Start a Revenue Cloud health check in the background and return a job ID.
+
+    Use this instead of revenue_cloud_health_check when the check may take
+    longer than your tool-call timeout. Poll with get_health_check_status and
+    fetch the report with get_health_check_result.
+
+    Args:
+        forceweaver_api_key: Your ForceWeaver API key (optional if set
+            via environment)
+        salesforce_org_id: Your Salesforce org ID, name, alias or a unique
+            prefix of one (optional if set via environment)
+        check_types: Optional list of specific checks to run (default: all
+            basic checks)
+        api_version: Optional Salesforce API version (default: v64.0)
+
+    Returns:
+        Job ID to poll for the health check result
+    """
+    params = _health_check_params(
+        forceweaver_api_key, salesforce_org_id, check_types, api_version
+    )
+    org_ref = params["org_id"]
+
+    async def run() -> str:
+        # Resolved in the job, so a slow orgs/list never delays the job ID
+        # and an unknown org shows up as a failed job
+        params["org_id"] = job.org_id = await org_directory.resolve(
+            params["forceweaver_api_key"], org_ref
+        )
+        return await client.call_mcp_api("health/check", method="POST", **params)
+
+    job = jobs.start(run(), org_id=org_ref)
+
+    return (
+        f"🚀 Health check started for org {org_ref}\n\n"
+        f"Job ID: {job.job_id}\n"
+        "Use get_health_check_status to poll it and get_health_check_result "
+        "to fetch the report once it has finished."
+    )
+
+
+@mcp.tool()
+async def get_health_check_status(job_id: str) -> str:
+    """
+    Get the status of a background health check started with start_health_check.
+
+    Args:
+        job_id: Job ID returned by start_health_check
+
+    Returns:
+        Job status (running, succeeded, failed or cancelled) and elapsed time
+    """
+    info = jobs.get(job_id).describe()
+
+    return (
+        f"Job ID: {info['job_id']}\n"
+        f"Org: {info['org_id']}\n"
+        f"Status: {info['status'].upper()}\n"
+        f"Elapsed: {info['elapsed_ms']}ms"
     )
 
 
+@mcp.tool()
+async def get_health_check_result(job_id: str) -> str:
+    """
+    Get the report of a finished background health check.
+
+    Args:
+        job_id: Job ID returned by start_health_check
+
+    Returns:
+        Comprehensive health report, or a note that the job is still running
+    """
+    job = jobs.get(job_id)
+
+    if job.status == RUNNING:
+        return (
+            f"⏳ Health check job {job_id} is still running. "
+            "Check again shortly with get_health_check_status."
+        )
+    if job.status == FAILED and job.error is not None:
+        raise job.error
+    if job.result is None:
+        raise ForceWeaverError(f"Health check job {job_id} was cancelled")
+
+    return job.result
+
+
+@mcp.tool()
+async def cancel_health_check(job_id: str) -> str:
+    """
+    Cancel a running background health check.
+
+    Args:
+        job_id: Job ID returned by start_health_check
+
+    Returns:
+        Confirmation of the cancellation
+    """
+    job = jobs.get(job_id)
+    if job.done:
+        return f"Health check job {job_id} had already finished ({job.status})"
+
+    jobs.cancel(job_id)
+    return f"🛑 Health check job {job_id} cancelled"
+
+
+@mcp.tool()
+async def health_trends(
+    forceweaver_api_key: Optional[str] = None,
+    salesforce_org_id: Optional[str] = None,
+    check_type: Optional[str] = None,
+    window: int = 5,
+    regressions_only: bool = False,
+    timeout_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Show score trends and regressions across previously run health checks.
+
+    Uses the history of checks run through this server, so no new health
+    check is performed and no usage is charged. Each score is compared with
+    the rolling average of the runs before it; a drop of 10+ points or of
+    more than two standard deviations is flagged as an anomaly.
+
+    Args:
+        forceweaver_api_key: Your ForceWeaver API key (optional if set
+            via environment)
+        salesforce_org_id: Optional org ID, name or alias to narrow to
+        check_type: Optional check to narrow to (e.g. sharing_model, or
+            overall for the overall score)
+        window: Number of previous runs in the rolling average (default: 5)
+        regressions_only: Only return checks whose latest score is anomalous
+        timeout_seconds: Optional time limit in seconds for resolving the org
+
+    Returns:
+        Latest score, delta, rolling average and anomaly flag per org and check
+    """
+    api_key = forceweaver_api_key or os.environ.get("FORCEWEAVER_API_KEY")
+
+    if not api_key:
+        raise AuthenticationError(
+            "ForceWeaver API key is required. Provide it as parameter or set "
+            "FORCEWEAVER_API_KEY environment variable."
+        )
+
+    if window < 1:
+        raise ValidationError("❌ Invalid Window\n\nwindow must be at least 1.")
+
+    check = check_type.strip().lower() if check_type else None
+    # An unknown check would otherwise look like one with no history
+    if check and check != OVERALL and check not in catalog.check_types:
+        raise ValidationError(
+            "❌ Invalid Check Type\n\n"
+            f"Unsupported check type: {check}.\n"
+            f"Supported checks: {', '.join(sorted(catalog.check_types | {OVERALL}))}"
+        )
+
+    org_id = None
+    if salesforce_org_id:
+        with ForceWeaverMCPClient.deadline(timeout_seconds):
+            org_id = await _resolve_org(
+                api_key, validate_org_reference(salesforce_org_id)
+            )
+
+    return trends.trends(
+        tenant_key(api_key),
+        org_id=org_id,
+        check_type=check or None,
+        window=window,
+        regressions_only=regressions_only,
+    )
+
+
+@mcp.tool()
+async def get_client_diagnostics(reset: bool = False) -> Dict[str, Any]:
+    """
+    Show where time went in this client's recent backend calls.
+
+    Reports the transport in use, calls in flight and, when profiling is
+    enabled with FORCEWEAVER_PROFILE=1, mean per-phase timings and the
+    slowest calls: budget wait, connection pool queueing, DNS, connect,
+    TLS, time to first byte, body download, JSON decode and formatting.
+    No backend call is made.
+
+    Args:
+        reset: Clear the recorded calls after reporting them
+
+    Returns:
+        Client diagnostics, with timings in milliseconds
+    """
+    diagnostics: Dict[str, Any] = {
+        "transport": client.transport.name,
+        "inflight_calls": client.inflight,
+        "profiling": client.profiler is not None,
+    }
+    if client.profiler is None:
+        diagnostics["hint"] = "Set FORCEWEAVER_PROFILE=1 to record call timings"
+        return diagnostics
+
+    diagnostics.update(client.profiler.diagnostics())
+    if reset:
+        client.profiler.reset()
+    return diagnostics
+
+
+async def _scheduled_check(api_key: str, org_id: str) -> float:
+    """Run one scheduled health check, cache its output and return its cost"""
+    check_types = list(DEFAULT_CHECK_TYPES)
+    # Same MCP payload as interactive checks, so cache hits read the same
+    result = await client.call_mcp_api_json(
+        "health/check",
+        "POST",
+        mcp_format=True,
+        forceweaver_api_key=api_key,
+        org_id=org_id,
+        check_types=check_types,
+        api_version=DEFAULT_API_VERSION,
+    )
+
+    results.put(
+        cache_key(tenant_key(api_key), org_id, check_types, DEFAULT_API_VERSION),
+        client.format_output(result),
+    )
+    return float((result.get("summary") or {}).get("cost_cents", 0))
+
+
+async def _scheduled_orgs(api_key: str) -> List[str]:
+    """Configured orgs, or every org connected to the account"""
+    configured = [org.strip() for org in SCHEDULE_ORGS.split(",") if org.strip()]
+    if configured:
+        org_ids = []
+        for org in configured:
+            # One stale or misspelled entry must not stop the rest being checked
+            try:
+                org_ids.append(await org_directory.resolve(api_key, org))
+            except ValidationError as e:
+                logger.warning(f"Skipping scheduled org '{org}': {e}")
+        return org_ids
+
+    index = await org_directory.refresh(api_key)
+    return [org.org_id for org in index] if index is not None else []
+
+
+def _build_scheduler() -> Optional[SweepScheduler]:
+    """Create the sweep scheduler if FORCEWEAVER_SCHEDULE_INTERVAL is set"""
+    if SCHEDULE_INTERVAL <= 0:
+        return None
+
+    api_key = os.environ.get("FORCEWEAVER_API_KEY")
+    if not api_key:
+        logger.error("Scheduled health checks need FORCEWEAVER_API_KEY; disabled")
+        return None
+
+    return SweepScheduler(
+        run_check=lambda org_id: _scheduled_check(api_key, org_id),
+        list_orgs=lambda: _scheduled_orgs(api_key),
+        interval=SCHEDULE_INTERVAL,
+        jitter=SCHEDULE_JITTER,
+        concurrency=SCHEDULE_CONCURRENCY,
+        budget_cents=float(SCHEDULE_BUDGET_CENTS) if SCHEDULE_BUDGET_CENTS else None,
+        # Each check type costs 1 cent until an org's real cost is known
+        default_cost_cents=float(len(DEFAULT_CHECK_TYPES)),
+    )
+
+
+async def _serve(transport: str, scheduler: Optional[SweepScheduler] = None) -> None:
+    """Run the MCP server, then drain calls and cancel jobs on the same loop"""
+    client.accepting = True
+    if scheduler is not None:
+        scheduler.start()
+    try:
+        if transport == "http":
+            await mcp.run_sse_async()
+        else:
+            await mcp.run_stdio_async()
+    finally:
+        if scheduler is not None:
+            await scheduler.stop()
+        await cleanup()
+
+
 # Cleanup on shutdown
 async def cleanup():
     """Cleanup resources on shutdown"""
     logger.info("Shutting down ForceWeaver MCP Client")
-    await client.close()
+    await client.shutdown()
 
 
 def main():
     """Main entry point supporting both STDIO and HTTP transports"""
+    if sys.argv[1:2] == ["check"]:
+        # Bulk health checks from the command line instead of serving MCP
+        from .cli import main as check_main
+
+        sys.exit(check_main(sys.argv[2:]))
+
     logger.info(f"Starting ForceWeaver MCP Client v{VERSION}")
     logger.info("Connecting to ForceWeaver cloud services...")
     logger.info("Get your API key at: https://mcp.forceweaver.com/dashboard/keys")
@@ -486,17 +1361,16 @@ def main():
             # HTTP transport for remote server hosting
             port = int(os.environ.get("MCP_PORT", "8000"))
             logger.info(f"Starting HTTP server on port {port}")
-            mcp.run(transport="sse")
+            asyncio.run(_serve("http", _build_scheduler()))
         else:
             # STDIO transport for local clients
-            mcp.run(transport="stdio")
+            asyncio.run(_serve("stdio"))
 
     except KeyboardInterrupt:
+        # Resources are released by _serve as the interrupt unwinds its loop
         logger.info("Shutting down...")
     except Exception as e:
         logger.error(f"Server error: {e}")
-    finally:
-        asyncio.run(cleanup())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,389 @@
+"""
+ForceWeaver MCP Client Transports
+HTTP backends for ForceWeaverMCPClient: pooled aiohttp HTTP/1.1 by default,
+or httpx multiplexing concurrent calls over a few HTTP/2 connections.
+"""
+
+import asyncio
+import functools
+import ssl
+import weakref
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+)
+
+import aiohttp
+import certifi
+
+from .exceptions import ForceWeaverError, ValidationError
+from .profiling import current_profile, httpx_trace
+
+# Connections per transport; HTTP/2 multiplexes many calls over each one
+DEFAULT_CONNECTION_LIMIT = 10
+
+
+class TransportError(Exception):
+    """Raised by transports when a request fails below the HTTP layer"""
+
+    pass
+
+
+class TransportResponse(Protocol):
+    """The parts of a response the client reads, as provided by aiohttp"""
+
+    @property
+    def status(self) -> int:
+        """HTTP status code"""
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers, looked up case-insensitively"""
+
+    async def json(self) -> Any:
+        """Read and decode the JSON body"""
+
+    async def text(self) -> str:
+        """Read the body as text"""
+
+
+class Transport(ABC):
+    """Sends backend requests over a connection pool it owns
+
+    Implementations raise asyncio.TimeoutError when the timeout expires and
+    TransportError (or aiohttp.ClientError) when the request cannot be made.
+    """
+
+    name = "transport"
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncContextManager[TransportResponse]:
+        """Async context manager yielding the response to a request"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close pooled connections; the next request reopens them"""
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    # Proper SSL context as per security best practices
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+@functools.lru_cache(maxsize=None)
+def shared_ssl_context() -> ssl.SSLContext:
+    """Process-wide SSL context, built once since parsing the CA bundle is slow"""
+    return _create_ssl_context()
+
+
+@functools.lru_cache(maxsize=None)
+def shared_httpx_ssl_context() -> ssl.SSLContext:
+    """Process-wide SSL context for httpx clients
+
+    httpx sets ALPN protocols on the context it is given, so it gets its own
+    context rather than advertising h2 on aiohttp connections.
+    """
+    return _create_ssl_context()
+
+
+def _create_connector(limit: int) -> aiohttp.TCPConnector:
+    return aiohttp.TCPConnector(
+        ssl=shared_ssl_context(),
+        limit=limit,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+    )
+
+
+class _SharedConnector:
+    __slots__ = ("_connector", "refs")
+
+    def __init__(self, connector: aiohttp.TCPConnector):
+        # Held strongly by the transports using it; a strong reference here
+        # would also keep its event loop alive in the registry below
+        self._connector = weakref.ref(connector)
+        self.refs = 0
+
+    @property
+    def connector(self) -> Optional[aiohttp.TCPConnector]:
+        return self._connector()
+
+
+class SharedConnectors:
+    """Reference-counted aiohttp connectors shared by transports on one loop
+
+    Transports that share a connector reuse each other's open connections,
+    so new clients skip the TCP and TLS handshakes. The first transport on a
+    loop sets the connection limit; the last one to release closes it.
+    """
+
+    def __init__(self) -> None:
+        # Loops are held weakly, so ones whose transports were never released
+        # don't outlive their last reference
+        self._shared: MutableMapping[asyncio.AbstractEventLoop, _SharedConnector] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __len__(self) -> int:
+        return len(self._shared)
+
+    def acquire(self, limit: int = DEFAULT_CONNECTION_LIMIT) -> aiohttp.TCPConnector:
+        """Connector for the running loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        shared = self._shared.get(loop)
+        connector = shared.connector if shared is not None else None
+        if shared is None or connector is None or connector.closed:
+            connector = _create_connector(limit)
+            shared = self._shared[loop] = _SharedConnector(connector)
+        shared.refs += 1
+        return connector
+
+    async def release(self, connector: aiohttp.TCPConnector) -> None:
+        """Drop a reference, closing the connector once none remain"""
+        for loop, shared in list(self._shared.items()):
+            if shared.connector is connector:
+                shared.refs -= 1
+                if shared.refs > 0:
+                    return
+                del self._shared[loop]
+                break
+        await connector.close()
+
+    def refs(self) -> int:
+        """References to the running loop's connector"""
+        shared = self._shared.get(asyncio.get_running_loop())
+        return shared.refs if shared is not None else 0
+
+
+shared_connectors = SharedConnectors()
+
+
+class AiohttpTransport(Transport):
+    """HTTP/1.1 over a pooled aiohttp session"""
+
+    name = "aiohttp"
+
+    def __init__(
+        self,
+        timeout: aiohttp.ClientTimeout,
+        user_agent: str,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        shared: bool = False,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+    ):
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.limit = limit
+        self.shared = shared
+        self.trace_configs = trace_configs
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._shared_connector: Optional[aiohttp.TCPConnector] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get or create HTTP session with proper SSL handling"""
+        if self.session is None or self.session.closed:
+            await self._release_connector()
+            if self.shared:
+                connector = self._shared_connector = shared_connectors.acquire(
+                    self.limit
+                )
+            else:
+                connector = _create_connector(self.limit)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=not self.shared,
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent},
+                trace_configs=self.trace_configs,
+            )
+        return self.session
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[TransportResponse]:
+        session = await self.get_session()
+        async with session.request(
+            method,
+            url,
+            json=json,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            yield response
+
+    async def close(self) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+        await self._release_connector()
+
+    async def _release_connector(self) -> None:
+        if self._shared_connector is not None:
+            connector, self._shared_connector = self._shared_connector, None
+            await shared_connectors.release(connector)
+
+
+class HttpxResponse:
+    """Buffered httpx response with aiohttp's async accessors"""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response: Any):
+        self._response = response
+
+    @property
+    def status(self) -> int:
+        return int(self._response.status_code)
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        headers: Mapping[str, str] = self._response.headers
+        return headers
+
+    @property
+    def http_version(self) -> str:
+        return str(self._response.http_version)
+
+    async def json(self) -> Any:
+        return self._response.json()
+
+    async def text(self) -> str:
+        return str(self._response.text)
+
+
+class HttpxTransport(Transport):
+    """HTTP/2 over httpx, multiplexing concurrent calls per connection
+
+    Requires the optional httpx[http2] dependency. Servers that don't
+    negotiate HTTP/2 via ALPN are spoken to over HTTP/1.1; http1=False
+    forces HTTP/2 with prior knowledge, e.g. for cleartext test servers.
+    """
+
+    name = "http2"
+
+    def __init__(
+        self,
+        timeout: Optional[float],
+        user_agent: str,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        http2: bool = True,
+        http1: bool = True,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise ForceWeaverError(
+                "The HTTP/2 transport requires httpx: "
+                "pip install 'forceweaver-mcp-server[http2]'"
+            )
+        self._httpx = httpx
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.limit = limit
+        self.http2 = http2
+        self.http1 = http1
+        self._client: Optional[Any] = None
+
+    def _get_client(self) -> Any:
+        if self._client is None or self._client.is_closed:
+            httpx = self._httpx
+            try:
+                self._client = httpx.AsyncClient(
+                    http1=self.http1,
+                    http2=self.http2,
+                    verify=shared_httpx_ssl_context(),
+                    limits=httpx.Limits(
+                        max_connections=self.limit,
+                        max_keepalive_connections=self.limit,
+                    ),
+                    timeout=self.timeout,
+                    headers={"User-Agent": self.user_agent},
+                )
+            except ImportError:
+                raise ForceWeaverError(
+                    "The HTTP/2 transport requires the h2 package: "
+                    "pip install 'forceweaver-mcp-server[http2]'"
+                )
+        return self._client
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[TransportResponse]:
+        client = self._get_client()
+        # Time connects and TLS handshakes when the call is being profiled
+        extensions = {"trace": httpx_trace} if current_profile() else None
+        try:
+            response = await client.request(
+                method,
+                url,
+                headers=headers,
+                json=json,
+                timeout=timeout,
+                extensions=extensions,
+            )
+        except self._httpx.TimeoutException as e:
+            raise asyncio.TimeoutError() from e
+        except self._httpx.HTTPError as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+        yield HttpxResponse(response)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_transport(
+    name: str,
+    timeout: aiohttp.ClientTimeout,
+    user_agent: str,
+    shared_connector: bool = False,
+    limit: int = DEFAULT_CONNECTION_LIMIT,
+    trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+) -> Transport:
+    """Build the transport selected by name ("aiohttp" or "http2")
+
+    trace_configs apply to the aiohttp transport; httpx is traced per request.
+    """
+    if name == AiohttpTransport.name:
+        return AiohttpTransport(
+            timeout,
+            user_agent,
+            limit=limit,
+            shared=shared_connector,
+            trace_configs=trace_configs,
+        )
+    if name == HttpxTransport.name:
+        return HttpxTransport(timeout.total, user_agent, limit=limit)
+    raise ValidationError(
+        f"❌ Unknown transport {name!r}\n\n"
+        f"Supported transports: {AiohttpTransport.name}, {HttpxTransport.name}"
+    )
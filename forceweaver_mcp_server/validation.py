@@ -0,0 +1,108 @@
+"""
+ForceWeaver MCP Client Input Validation
+Local validation and normalization of tool inputs, so malformed requests are
+rejected before any network call.
+"""
+
+import re
+from typing import FrozenSet, Iterable, List, Optional
+
+from .exceptions import ValidationError
+
+# Checks offered by the ForceWeaver health check service
+CHECK_TYPES = frozenset(
+    {
+        "basic_org_info",
+        "sharing_model",
+        "bundle_analysis",
+        "attribute_picklist_integrity",
+    }
+)
+DEFAULT_CHECK_TYPES = ["basic_org_info", "sharing_model", "bundle_analysis"]
+DEFAULT_API_VERSION = "v64.0"
+
+# Accepts "v64.0", "64.0", "v64" and "64"
+API_VERSION_PATTERN = re.compile(r"^v?(\d{2,3})(?:\.0)?$", re.IGNORECASE)
+
+# Org references are IDs, names or aliases; anything else is malformed
+MAX_ORG_REFERENCE_LENGTH = 255
+
+
+class ValidationCatalog:
+    """Supported check types and API versions that inputs are checked against"""
+
+    __slots__ = ("check_types", "api_versions")
+
+    def __init__(
+        self,
+        check_types: Iterable[str] = CHECK_TYPES,
+        api_versions: Optional[Iterable[str]] = None,
+    ):
+        self.check_types: FrozenSet[str] = frozenset(
+            check.strip().lower() for check in check_types if check.strip()
+        )
+        # None accepts any well-formed version
+        self.api_versions: Optional[FrozenSet[str]] = None
+        if api_versions is not None:
+            canonical = (_canonical_api_version(v) for v in api_versions)
+            self.api_versions = frozenset(v for v in canonical if v is not None)
+
+    def normalize_check_types(self, check_types: Iterable[str]) -> List[str]:
+        """Lower-case, dedupe and sort check types, rejecting unknown ones"""
+        if isinstance(check_types, str):
+            check_types = [check_types]
+
+        normalized = sorted(
+            {str(check).strip().lower() for check in check_types} - {""}
+        )
+        if not normalized:
+            raise ValidationError(
+                "❌ Invalid Check Types\n\n"
+                "check_types must name at least one check. Supported checks: "
+                f"{', '.join(sorted(self.check_types))}"
+            )
+
+        unknown = [check for check in normalized if check not in self.check_types]
+        if unknown:
+            raise ValidationError(
+                "❌ Invalid Check Types\n\n"
+                f"Unsupported check type(s): {', '.join(unknown)}.\n"
+                f"Supported checks: {', '.join(sorted(self.check_types))}"
+            )
+        return normalized
+
+    def normalize_api_version(self, api_version: str) -> str:
+        """Canonicalize an API version to the 'v64.0' form, rejecting bad ones"""
+        canonical = _canonical_api_version(api_version)
+        if canonical is None:
+            raise ValidationError(
+                "❌ Invalid API Version\n\n"
+                f"'{api_version}' is not a Salesforce API version. "
+                f"Use the form {DEFAULT_API_VERSION}."
+            )
+
+        if self.api_versions is not None and canonical not in self.api_versions:
+            supported = sorted(self.api_versions, key=lambda v: float(v[1:]))
+            raise ValidationError(
+                "❌ Unsupported API Version\n\n"
+                f"{canonical} is not supported. Supported versions: "
+                f"{', '.join(supported)}"
+            )
+        return canonical
+
+
+def _canonical_api_version(api_version: str) -> Optional[str]:
+    match = API_VERSION_PATTERN.match(str(api_version).strip())
+    return f"v{int(match.group(1))}.0" if match else None
+
+
+def validate_org_reference(org: str) -> str:
+    """Strip an org ID/name/alias, rejecting empty or malformed values"""
+    value = str(org).strip()
+    if not value or len(value) > MAX_ORG_REFERENCE_LENGTH or not value.isprintable():
+        raise ValidationError(
+            "❌ Invalid Salesforce Org\n\n"
+            "The Salesforce org must be an org ID, name or alias of at most "
+            f"{MAX_ORG_REFERENCE_LENGTH} printable characters."
+        )
+    return value
@@ -0,0 +1,167 @@
+"""
+Test suite for ForceWeaver score trend analytics
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.analytics import (
+    OVERALL,
+    ScoreSeries,
+    TrendStore,
+    tenant_key,
+)
+from forceweaver_mcp_server.exceptions import ValidationError
+from forceweaver_mcp_server.models import HealthCheckReport
+
+
+def _report(org_id, overall, sharing):
+    return HealthCheckReport.from_response(
+        {
+            "org_id": org_id,
+            "summary": {"overall_score": overall, "checks_performed": 1},
+            "results": {
+                "results": {"sharing_model": {"status": "ok", "score": sharing}}
+            },
+        }
+    )
+
+
+class TestScoreSeries:
+    """Test cases for a single score series"""
+
+    def test_history_is_bounded(self):
+        """Test old points are trimmed once well over capacity"""
+        series = ScoreSeries(max_points=8)
+        for i in range(100):
+            series.append(float(i), float(i))
+
+        assert len(series) <= 10
+        assert series.scores[-1] == 99
+        assert list(series.window(3)) == [97, 98, 99]
+
+    def test_summary_flags_drop(self):
+        """Test a sharp drop against the rolling baseline is an anomaly"""
+        series = ScoreSeries()
+        for i, score in enumerate([90, 92, 91, 90, 70]):
+            series.append(float(i), float(score))
+
+        summary = series.summary(window=4, z_threshold=2.0, drop_threshold=10.0)
+
+        assert summary["latest"] == 70
+        assert summary["delta"] == -20
+        assert summary["rolling_average"] == 90.75
+        assert summary["anomaly"] is True
+
+    def test_summary_stable_scores(self):
+        """Test small fluctuations and single points are not anomalies"""
+        series = ScoreSeries()
+        series.append(0.0, 80.0)
+        assert series.summary(5, 2.0, 10.0)["anomaly"] is False
+
+        for i, score in enumerate([81, 79, 80, 82]):
+            series.append(float(i + 1), float(score))
+        assert series.summary(5, 2.0, 10.0)["anomaly"] is False
+
+
+class TestTrendStore:
+    """Test cases for the per-tenant trend store"""
+
+    def test_trends_per_org_and_check(self):
+        """Test overall and per-check scores are tracked per org"""
+        store = TrendStore()
+        for overall, sharing in [(90, 95), (88, 94), (70, 60)]:
+            store.record("tenant", _report("org_a", overall, sharing))
+        store.record("tenant", _report("org_b", 99, 99))
+
+        trends = store.trends("tenant", regressions_only=True)
+
+        assert list(trends) == ["org_a"]
+        assert set(trends["org_a"]) == {OVERALL, "sharing_model"}
+        assert trends["org_a"]["sharing_model"]["delta"] == -34
+
+    def test_tenants_are_isolated(self):
+        """Test one API key never sees another's history"""
+        store = TrendStore()
+        store.record(tenant_key("fk_a"), _report("org_a", 90, 90))
+
+        assert store.trends(tenant_key("fk_b")) == {}
+        assert "org_a" in store.trends(tenant_key("fk_a"))
+
+    def test_org_id_fallback(self):
+        """Test the requested org ID is used when the response omits it"""
+        store = TrendStore()
+        store.record("tenant", _report(None, 90, 90), org_id="org_a")
+
+        assert "org_a" in store.trends("tenant")
+
+
+class TestTrendRecording:
+    """Test cases for feeding trends from client calls"""
+
+    @pytest.mark.asyncio
+    async def test_result_listener_receives_payload(self):
+        """Test listeners see the request params and decoded response"""
+        client = ForceWeaverMCPClient()
+        seen = []
+        client.add_result_listener(lambda *args: seen.append(args))
+
+        with aioresponses() as m:
+            m.post(
+                "https://mcp.forceweaver.com/api/v1.0/health/check?format=mcp",
+                payload={"formatted_output": "Test health check output"},
+            )
+            await client.call_mcp_api(
+                "health/check", forceweaver_api_key="fk_test_key", org_id="org_a"
+            )
+        await client.close()
+
+        endpoint, params, result = seen[0]
+        assert endpoint == "health/check"
+        assert params["org_id"] == "org_a"
+        assert result == {"formatted_output": "Test health check output"}
+
+    @pytest.mark.asyncio
+    async def test_health_trends_tool(self):
+        """Test the tool reports trends recorded for the caller's key"""
+        from forceweaver_mcp_server.server import _record_trend, health_trends
+
+        store = TrendStore()
+        with patch("forceweaver_mcp_server.server.trends", store):
+            for overall in (90, 91, 60):
+                _record_trend(
+                    "health/check",
+                    {"forceweaver_api_key": "fk_trend_key", "org_id": "org_a"},
+                    {"summary": {"overall_score": overall, "checks_performed": 1}},
+                )
+
+            with patch("forceweaver_mcp_server.server.org_directory") as directory:
+                directory.resolve = AsyncMock(return_value="org_a")
+                result = await health_trends(
+                    forceweaver_api_key="fk_trend_key",
+                    salesforce_org_id="org_a",
+                    check_type="Overall",
+                )
+
+        assert result["org_a"]["overall"]["latest"] == 60
+        assert result["org_a"]["overall"]["anomaly"] is True
+
+    @pytest.mark.asyncio
+    async def test_health_trends_rejects_unknown_check_type(self):
+        """Test a misspelled check type is rejected rather than returning {}"""
+        from forceweaver_mcp_server.server import health_trends
+
+        with pytest.raises(ValidationError) as exc_info:
+            await health_trends(
+                forceweaver_api_key="fk_trend_key", check_type="sharing"
+            )
+
+        assert "sharing_model" in str(exc_info.value)
+        with patch("forceweaver_mcp_server.server.trends", TrendStore()):
+            result = await health_trends(
+                forceweaver_api_key="fk_trend_key", check_type=" Sharing_Model "
+            )
+        assert result == {}
@@ -0,0 +1,224 @@
+"""
+Test suite for the ForceWeaver cost guard
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.budget import DAY, HOUR, CostGuard
+from forceweaver_mcp_server.exceptions import RateLimitError
+
+HEALTH_URL = "https://mcp.forceweaver.com/api/v1.0/health/check"
+API_KEY = "fk_test_key"
+
+
+class TestCostGuard:
+    """Test cases for local budget enforcement"""
+
+    @pytest.mark.asyncio
+    async def test_charges_actual_cost(self):
+        """Test a settled call is charged its reported cost, not the estimate"""
+        guard = CostGuard(daily_cents=10)
+
+        reservation = await guard.reserve(API_KEY, 4)
+        assert guard.ledger(API_KEY).reserved == 4
+        guard.observe("health/check", {}, {"summary": {"cost_cents": 2}})
+        guard.settle(reservation, charged=True)
+
+        assert guard.spent(API_KEY) == 2
+        assert guard.ledger(API_KEY).reserved == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_call_not_charged(self):
+        """Test a failed call releases its reservation without a charge"""
+        guard = CostGuard(daily_cents=10)
+
+        guard.settle(await guard.reserve(API_KEY, 4), charged=False)
+
+        assert guard.spent(API_KEY) == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_over_budget(self):
+        """Test calls that would exceed a budget are rejected before dispatch"""
+        guard = CostGuard(hourly_cents=5)
+        guard.ledger(API_KEY).add(4, time.time())
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await guard.reserve(API_KEY, 2)
+
+        assert "Budget Exceeded" in str(exc_info.value)
+        assert exc_info.value.retry_after == pytest.approx(HOUR, abs=5)
+        # Other API keys have their own budget
+        await guard.reserve("fk_other_key", 2)
+
+    @pytest.mark.asyncio
+    async def test_queue_mode_waits_for_window(self):
+        """Test queue mode holds a call until old spend leaves the window"""
+        guard = CostGuard(hourly_cents=5, mode="queue", max_wait=1)
+        guard.ledger(API_KEY).add(4, time.time() - HOUR + 0.05)
+
+        started = time.monotonic()
+        await guard.reserve(API_KEY, 2)
+
+        assert time.monotonic() - started >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_estimate_larger_than_budget(self):
+        """Test a call that can never fit is rejected even in queue mode"""
+        guard = CostGuard(daily_cents=3, mode="queue")
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await guard.reserve(API_KEY, 4)
+
+        assert exc_info.value.retry_after is None
+
+    @pytest.mark.asyncio
+    async def test_queue_mode_waits_for_inflight_reservations(self):
+        """Test queued calls proceed once in-flight reservations settle"""
+        guard = CostGuard(daily_cents=5, mode="queue", max_wait=1)
+        first = await guard.reserve(API_KEY, 3)
+
+        second = asyncio.create_task(guard.reserve(API_KEY, 3))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        guard.settle(first, charged=False)
+
+        await asyncio.wait_for(second, 0.5)
+        assert guard.ledger(API_KEY).reserved == 3
+
+    @pytest.mark.asyncio
+    async def test_inflight_reservations_reject_with_retry_hint(self):
+        """Test in-flight reservations are not reported as a budget too small"""
+        guard = CostGuard(daily_cents=5)
+        await guard.reserve(API_KEY, 3)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await guard.reserve(API_KEY, 3)
+
+        assert "in-flight" in str(exc_info.value)
+        assert "Raise your budget" not in str(exc_info.value)
+
+        queued = CostGuard(daily_cents=5, mode="queue", max_wait=0.05)
+        await queued.reserve(API_KEY, 3)
+        with pytest.raises(RateLimitError):
+            await queued.reserve(API_KEY, 3)
+
+    @pytest.mark.asyncio
+    async def test_block_rejects_until_cooldown(self):
+        """Test a 429 cooldown rejects calls locally even without budgets"""
+        guard = CostGuard()
+        guard.block(API_KEY, 30)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await guard.reserve(API_KEY, 1)
+
+        assert "rate limit" in str(exc_info.value)
+
+    def test_apply_usage_adds_missing_spend(self):
+        """Test spend reported by usage/summary tops up the local ledger"""
+        guard = CostGuard(daily_cents=100)
+        guard.ledger(API_KEY).add(5, time.time())
+
+        guard.observe(
+            "usage/summary",
+            {"forceweaver_api_key": API_KEY},
+            {"usage": {"cost_cents_today": 12, "cost_cents_last_hour": 3}},
+        )
+
+        assert guard.spent(API_KEY, DAY) == 12
+        # Reported hourly spend below local spend never lowers it
+        assert guard.spent(API_KEY, HOUR) == 12
+
+    @pytest.mark.asyncio
+    async def test_syncs_usage_in_background(self):
+        """Test a stale ledger triggers a usage/summary sync"""
+        fetch_usage = AsyncMock(return_value={"daily_cost_cents": 7})
+        guard = CostGuard(daily_cents=100, fetch_usage=fetch_usage)
+
+        await guard.reserve(API_KEY, 1)
+        await asyncio.sleep(0.01)
+        await guard.reserve(API_KEY, 1)
+
+        fetch_usage.assert_awaited_once_with(API_KEY)
+        assert guard.spent(API_KEY) == 7
+
+    @pytest.mark.asyncio
+    async def test_usage_sync_ignores_caller_deadline(self):
+        """Test the shared usage/summary sync is not bounded by one call's timeout"""
+        from forceweaver_mcp_server.server import _fetch_usage
+
+        remaining = []
+
+        async def call_mcp_api_json(*args, **kwargs):
+            remaining.append(ForceWeaverMCPClient.remaining_time())
+            return {"daily_cost_cents": 7}
+
+        guard = CostGuard(daily_cents=100, fetch_usage=_fetch_usage)
+        with patch("forceweaver_mcp_server.server.client") as mock_client:
+            mock_client.call_mcp_api_json = call_mcp_api_json
+            with ForceWeaverMCPClient.deadline(2):
+                await guard.reserve(API_KEY, 1)
+            await asyncio.sleep(0.01)
+
+        assert remaining == [None]
+        assert guard.spent(API_KEY) == 7
+
+
+class TestClientCostGuard:
+    """Test cases for the cost guard wired into the client"""
+
+    @pytest.fixture
+    async def client(self):
+        """Create a test client with a small daily budget"""
+        client = ForceWeaverMCPClient(cost_guard=CostGuard(daily_cents=3))
+        yield client
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_budget_rejects_before_request(self, client):
+        """Test an over-budget health check never reaches the backend"""
+        with aioresponses() as m:
+            m.post(
+                f"{HEALTH_URL}?format=mcp",
+                payload={"formatted_output": "ok", "summary": {"cost_cents": 2}},
+            )
+            await client.call_mcp_api(
+                "health/check", forceweaver_api_key=API_KEY, check_types=["a"]
+            )
+
+            with pytest.raises(RateLimitError):
+                await client.call_mcp_api(
+                    "health/check", forceweaver_api_key=API_KEY, check_types=["a", "b"]
+                )
+
+            assert len(m.requests) == 1
+            assert client.cost_guard.spent(API_KEY) == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_blocks_follow_up_calls(self, client):
+        """Test a 429 with Retry-After stops further calls locally"""
+        with aioresponses() as m:
+            m.post(
+                f"{HEALTH_URL}?format=mcp",
+                status=429,
+                headers={"Retry-After": "120"},
+                repeat=True,
+            )
+
+            with pytest.raises(RateLimitError) as exc_info:
+                await client.call_mcp_api(
+                    "health/check", forceweaver_api_key=API_KEY, check_types=["a"]
+                )
+            assert exc_info.value.retry_after == 120
+
+            with pytest.raises(RateLimitError):
+                await client.call_mcp_api(
+                    "health/check", forceweaver_api_key=API_KEY, check_types=["a"]
+                )
+
+            assert len(next(iter(m.requests.values()))) == 1
@@ -0,0 +1,235 @@
+"""
+Test suite for ForceWeaver traffic recording and replay
+"""
+
+import json
+import time
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.cassette import (
+    REDACTED,
+    RecordingTransport,
+    ReplayTransport,
+    load_cassette,
+    redact,
+)
+from forceweaver_mcp_server.exceptions import ConnectionError, RateLimitError
+from forceweaver_mcp_server.transport import AiohttpTransport
+
+API = "https://mcp.forceweaver.com/api/v1.0"
+API_KEY = "fk_secret_key_123"
+
+
+def write_cassette(path, entries):
+    """Write cassette entries as JSON lines"""
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+
+def entry(target, body, status=200, elapsed=0.0, request=None, headers=None):
+    """A cassette entry for a recorded exchange"""
+    return {
+        "method": "POST",
+        "target": target,
+        "request": request,
+        "status": status,
+        "headers": headers or {"content-type": "application/json"},
+        "body": json.dumps(body),
+        "offset": 0.0,
+        "elapsed": elapsed,
+    }
+
+
+class TestRedaction:
+    """Test cases for cassette redaction"""
+
+    def test_redact_nested(self):
+        """Test sensitive keys are redacted at any depth"""
+        value = {"org_id": "00D1", "auth": [{"Access_Token": "t", "n": 1}]}
+
+        assert redact(value) == {
+            "org_id": "00D1",
+            "auth": [{"Access_Token": REDACTED, "n": 1}],
+        }
+
+    def test_redact_matches_name_fragments(self):
+        """Test credential-like names are redacted even without exact matches"""
+        value = {
+            "org_id": "00D1",
+            "connection": {
+                "sf_access_token": "a",
+                "salesforce_refresh_token": "b",
+                "session_id": "c",
+                "credentials": [{"apiKey": "d", "clientSecret": "e"}],
+            },
+            "check_types": ["sharing_model"],
+        }
+
+        redacted = redact(value)
+
+        assert redacted["org_id"] == "00D1"
+        assert redacted["check_types"] == ["sharing_model"]
+        assert redacted["connection"] == {
+            "sf_access_token": REDACTED,
+            "salesforce_refresh_token": REDACTED,
+            "session_id": REDACTED,
+            "credentials": REDACTED,
+        }
+        assert redact({"nested": [{"apiKey": "d", "X-Session": "f"}]}) == {
+            "nested": [{"apiKey": REDACTED, "X-Session": REDACTED}]
+        }
+
+    def test_redact_keeps_shape_bearing_fields(self):
+        """Test names merely containing key, token or session are kept intact"""
+        value = {
+            "keys": ["sharing_model", "bundle_analysis"],
+            "key_findings": [{"check": "sharing_model", "severity": "high"}],
+            "primary_key": "Id",
+            "tokens_used": 1200,
+            "sessions_active": 3,
+            "monkey": {"nested": True},
+            "results": {"sharing_model": {"details": {"apiKey": "d"}}},
+        }
+
+        redacted = redact(value)
+
+        assert {key: redacted[key] for key in value if key != "results"} == {
+            key: item for key, item in value.items() if key != "results"
+        }
+        assert redacted["results"] == {
+            "sharing_model": {"details": {"apiKey": REDACTED}}
+        }
+
+
+class TestRecordingTransport:
+    """Test cases for recording traffic"""
+
+    @pytest.mark.parametrize("name", ["calls.jsonl", "calls.jsonl.gz"])
+    @pytest.mark.asyncio
+    async def test_records_redacted_exchanges(self, tmp_path, name):
+        """Test exchanges are recorded without credentials"""
+        path = tmp_path / name
+        transport = RecordingTransport(
+            AiohttpTransport(aiohttp.ClientTimeout(total=30), "ua"), str(path)
+        )
+        client = ForceWeaverMCPClient(transport=transport)
+
+        with aioresponses() as m:
+            m.post(
+                f"{API}/health/check?format=mcp",
+                payload={"formatted_output": "Report", "session_token": "abc"},
+            )
+            output = await client.call_mcp_api(
+                "health/check", forceweaver_api_key=API_KEY, org_id="00D123"
+            )
+        await client.close()
+
+        assert output == "Report"
+        [recorded] = load_cassette(str(path))
+        assert recorded["target"] == "/api/v1.0/health/check?format=mcp"
+        assert recorded["request"] == {"org_id": "00D123"}
+        assert recorded["status"] == 200
+        assert json.loads(recorded["body"])["formatted_output"] == "Report"
+        assert recorded["elapsed"] >= 0
+        assert API_KEY not in json.dumps(recorded)
+
+    @pytest.mark.asyncio
+    async def test_sensitive_response_fields_redacted(self, tmp_path):
+        """Test tokens in response bodies don't reach the cassette"""
+        path = tmp_path / "calls.jsonl"
+        client = ForceWeaverMCPClient(
+            transport=RecordingTransport(
+                AiohttpTransport(aiohttp.ClientTimeout(total=30), "ua"), str(path)
+            )
+        )
+
+        with aioresponses() as m:
+            m.get(f"{API}/orgs/list", payload={"orgs": [], "token": "sekrit"})
+            await client.call_mcp_api_json(
+                "orgs/list", method="GET", forceweaver_api_key=API_KEY
+            )
+        await client.close()
+
+        assert "sekrit" not in path.read_text()
+
+
+class TestReplayTransport:
+    """Test cases for replaying traffic"""
+
+    @pytest.mark.asyncio
+    async def test_replays_matching_requests(self, tmp_path):
+        """Test requests are answered from the matching recording"""
+        path = tmp_path / "calls.jsonl"
+        target = "/api/v1.0/health/check?format=mcp"
+        write_cassette(
+            path,
+            [
+                entry(target, {"formatted_output": "A"}, request={"org_id": "00DA"}),
+                entry(target, {"formatted_output": "B"}, request={"org_id": "00DB"}),
+            ],
+        )
+        client = ForceWeaverMCPClient(transport=ReplayTransport(str(path), speed=0))
+
+        second = await client.call_mcp_api(
+            "health/check", forceweaver_api_key=API_KEY, org_id="00DB"
+        )
+        first = await client.call_mcp_api(
+            "health/check", forceweaver_api_key=API_KEY, org_id="00DA"
+        )
+
+        assert (first, second) == ("A", "B")
+        with pytest.raises(ConnectionError) as exc_info:
+            await client.call_mcp_api_json("usage/summary", forceweaver_api_key=API_KEY)
+        assert "No recorded response" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_replay_speed(self, tmp_path):
+        """Test recorded timings are replayed scaled by speed"""
+        path = tmp_path / "calls.jsonl"
+        target = "/api/v1.0/health/check?format=mcp"
+        write_cassette(path, [entry(target, {"formatted_output": "A"}, elapsed=1.0)])
+        client = ForceWeaverMCPClient(transport=ReplayTransport(str(path), speed=20))
+
+        started = time.monotonic()
+        await client.call_mcp_api("health/check", forceweaver_api_key=API_KEY)
+
+        assert 0.04 <= time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_replay_respects_deadline(self, tmp_path):
+        """Test a recording slower than the deadline times out"""
+        path = tmp_path / "calls.jsonl"
+        target = "/api/v1.0/health/check?format=mcp"
+        write_cassette(path, [entry(target, {"formatted_output": "A"}, elapsed=5)])
+        client = ForceWeaverMCPClient(transport=ReplayTransport(str(path)))
+
+        with pytest.raises(ConnectionError) as exc_info:
+            with ForceWeaverMCPClient.deadline(0.05):
+                await client.call_mcp_api("health/check", forceweaver_api_key=API_KEY)
+
+        assert "Request timeout" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_replays_error_statuses(self, tmp_path):
+        """Test recorded error statuses and headers are handled as live ones"""
+        path = tmp_path / "calls.jsonl"
+        write_cassette(
+            path,
+            [
+                entry(
+                    "/api/v1.0/health/check?format=mcp",
+                    {},
+                    status=429,
+                    headers={"retry-after": "7"},
+                )
+            ],
+        )
+        client = ForceWeaverMCPClient(transport=ReplayTransport(str(path), speed=0))
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await client.call_mcp_api("health/check", forceweaver_api_key=API_KEY)
+
+        assert exc_info.value.retry_after == 7
@@ -0,0 +1,140 @@
+"""
+Test suite for the ForceWeaver bulk check CLI
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server.cli import completed_orgs, main, read_orgs
+
+API = "https://mcp.forceweaver.com/api/v1.0"
+PROD_ID = "00D000000000001EAA"
+DEV_ID = "00D000000000002EAA"
+
+
+def report_for(org_id):
+    """Raw health/check payload for an org"""
+    return {
+        "success": True,
+        "org_id": org_id,
+        "summary": {"overall_score": 80, "checks_performed": 1},
+        "results": {"sharing_model": {"status": "ok", "score": 80}},
+    }
+
+
+@pytest.fixture
+def backend():
+    """Mocked ForceWeaver API with no connected-org index"""
+    with aioresponses() as m:
+        m.get(f"{API}/orgs/list", status=503, repeat=True)
+        yield m
+
+
+class TestOrgInput:
+    """Test cases for reading orgs and earlier output"""
+
+    def test_read_orgs(self):
+        """Test blanks, comments and repeats are skipped"""
+        lines = ["# production\n", f"{PROD_ID}\n", "\n", "Acme Dev  # sandbox\n"]
+
+        assert read_orgs(lines + [f"{PROD_ID}\n"]) == [PROD_ID, "Acme Dev"]
+
+    def test_completed_orgs(self):
+        """Test only successful, complete lines count as done"""
+        lines = [
+            json.dumps({"org": PROD_ID, "ok": True}),
+            json.dumps({"org": DEV_ID, "ok": False, "error": "boom"}),
+            '{"org": "Acme Dev", "ok": tr',
+        ]
+
+        assert completed_orgs(lines) == {PROD_ID}
+
+
+class TestCheckCommand:
+    """Test cases for `forceweaver-mcp check`"""
+
+    def test_streams_ndjson(self, backend, capsys, monkeypatch):
+        """Test one JSON line is written per org"""
+        monkeypatch.setenv("FORCEWEAVER_API_KEY", "fk_test_key")
+        backend.post(f"{API}/health/check", payload=report_for(PROD_ID))
+        backend.post(f"{API}/health/check", status=404)
+
+        status = main([PROD_ID, DEV_ID, "--parallel", "1"])
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert status == 1
+        assert [record["ok"] for record in records] == [True, False]
+        assert records[0]["report"]["grade"] == "A"
+        assert records[1]["org"] == DEV_ID
+        assert "Org Not Found" in records[1]["error"]
+
+    def test_resume_skips_completed_orgs(self, backend, tmp_path, monkeypatch):
+        """Test --resume only checks orgs without a successful result"""
+        monkeypatch.setenv("FORCEWEAVER_API_KEY", "fk_test_key")
+        orgs_file = tmp_path / "orgs.txt"
+        orgs_file.write_text(f"{PROD_ID}\n{DEV_ID}\n")
+        output = tmp_path / "results.ndjson"
+        # An interrupted run left a complete line and half of another
+        output.write_text(
+            json.dumps({"org": PROD_ID, "ok": True}) + '\n{"org": "00D0000'
+        )
+        backend.post(f"{API}/health/check", payload=report_for(DEV_ID))
+
+        status = main(["--orgs", str(orgs_file), "--output", str(output), "--resume"])
+
+        lines = output.read_text().splitlines()
+        assert status == 0
+        posts = [key for key in backend.requests if key[0] == "POST"]
+        assert sum(len(backend.requests[key]) for key in posts) == 1
+        assert json.loads(lines[-1])["org"] == DEV_ID
+        assert completed_orgs(lines) == {PROD_ID, DEV_ID}
+
+    def test_text_format(self, backend, capsys, monkeypatch):
+        """Test the text format prints one summary line per org"""
+        monkeypatch.setenv("FORCEWEAVER_API_KEY", "fk_test_key")
+        backend.post(f"{API}/health/check", payload=report_for(PROD_ID))
+
+        assert main([PROD_ID, "--format", "text"]) == 0
+
+        assert capsys.readouterr().out == f"✅ {PROD_ID}: 80/100 (A)\n"
+
+    def test_missing_api_key(self, capsys, monkeypatch):
+        """Test a missing API key fails before any check runs"""
+        monkeypatch.delenv("FORCEWEAVER_API_KEY", raising=False)
+
+        assert main([PROD_ID]) == 2
+        assert "API key is required" in capsys.readouterr().err
+
+    def test_usage_errors(self):
+        """Test invalid arguments exit with a usage error"""
+        with pytest.raises(SystemExit):
+            main([])
+        with pytest.raises(SystemExit):
+            main([PROD_ID, "--resume"])
+
+    def test_resume_requires_ndjson(self, tmp_path, capsys):
+        """Test --resume is rejected for text output it can't read back"""
+        output = tmp_path / "results.txt"
+        output.write_text(f"✅ {PROD_ID}: 80/100 (A)\n")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main([PROD_ID, "--format", "text", "--output", str(output), "--resume"])
+
+        assert exc_info.value.code == 2
+        assert "--format ndjson" in capsys.readouterr().err
+        assert output.read_text() == f"✅ {PROD_ID}: 80/100 (A)\n"
+
+    def test_server_dispatches_check(self):
+        """Test `forceweaver-mcp check` runs the CLI instead of a server"""
+        from forceweaver_mcp_server.server import main as server_main
+
+        with patch("sys.argv", ["forceweaver-mcp", "check", PROD_ID]):
+            with patch("forceweaver_mcp_server.cli.main", return_value=0) as check:
+                with pytest.raises(SystemExit) as exc_info:
+                    server_main()
+
+        check.assert_called_once_with([PROD_ID])
+        assert exc_info.value.code == 0
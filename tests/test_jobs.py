@@ -0,0 +1,215 @@
+"""
+Test suite for ForceWeaver background health check jobs
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from forceweaver_mcp_server.exceptions import (
+    AuthenticationError,
+    RateLimitError,
+    ValidationError,
+)
+from forceweaver_mcp_server.jobs import (
+    CANCELLED,
+    FAILED,
+    RUNNING,
+    SUCCEEDED,
+    JobManager,
+)
+
+
+async def _result(value, delay=0.0):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail(error):
+    raise error
+
+
+class TestJobManager:
+    """Test cases for the background job table"""
+
+    @pytest.mark.asyncio
+    async def test_job_lifecycle(self):
+        """Test a job runs to completion and keeps its result"""
+        jobs = JobManager()
+        job = jobs.start(_result("report", delay=0.01), org_id="test_org")
+
+        assert job.status == RUNNING
+        await job.task
+
+        assert jobs.get(job.job_id).status == SUCCEEDED
+        assert job.result == "report"
+        assert job.describe()["org_id"] == "test_org"
+
+    @pytest.mark.asyncio
+    async def test_failed_job_keeps_error(self):
+        """Test a failing job records its exception"""
+        jobs = JobManager()
+        job = jobs.start(_fail(AuthenticationError("bad key")))
+        await asyncio.gather(job.task, return_exceptions=True)
+
+        assert job.status == FAILED
+        assert isinstance(job.error, AuthenticationError)
+
+    @pytest.mark.asyncio
+    async def test_cancel_job(self):
+        """Test running jobs can be cancelled"""
+        jobs = JobManager()
+        job = jobs.start(_result("report", delay=10))
+
+        jobs.cancel(job.job_id)
+        await asyncio.gather(job.task, return_exceptions=True)
+
+        assert job.status == CANCELLED
+        assert job.result is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self):
+        """Test looking up a missing job raises ValidationError"""
+        with pytest.raises(ValidationError):
+            JobManager().get("missing")
+
+    @pytest.mark.asyncio
+    async def test_ttl_eviction(self):
+        """Test finished jobs expire after the TTL"""
+        jobs = JobManager(ttl=0)
+        job = jobs.start(_result("report"))
+        await job.task
+        job.finished_at -= 1
+
+        with pytest.raises(ValidationError):
+            jobs.get(job.job_id)
+
+    @pytest.mark.asyncio
+    async def test_table_is_bounded(self):
+        """Test finished jobs make room and running jobs are never evicted"""
+        jobs = JobManager(max_jobs=2)
+        first = jobs.start(_result("first"))
+        await first.task
+        second = jobs.start(_result("second", delay=10))
+        third = jobs.start(_result("third", delay=10))
+
+        assert len(jobs) == 2
+        with pytest.raises(ValidationError):
+            jobs.get(first.job_id)
+
+        with pytest.raises(RateLimitError):
+            jobs.start(_result("fourth"))
+
+        await jobs.shutdown()
+        assert second.status == CANCELLED
+        assert third.status == CANCELLED
+        assert len(jobs) == 0
+
+
+class TestJobTools:
+    """Test cases for the background job MCP tools"""
+
+    @pytest.mark.asyncio
+    async def test_start_and_fetch_health_check(self):
+        """Test a health check can be started and its result fetched"""
+        from forceweaver_mcp_server.server import (
+            get_health_check_result,
+            get_health_check_status,
+            jobs,
+            start_health_check,
+        )
+
+        with patch("forceweaver_mcp_server.server.client") as mock_client:
+            mock_client.call_mcp_api = AsyncMock(return_value="Health check result")
+
+            started = await start_health_check(
+                forceweaver_api_key="fk_test_key", salesforce_org_id="test_org"
+            )
+            job_id = started.split("Job ID: ")[1].split("\n")[0]
+            await jobs.get(job_id).task
+
+            assert "SUCCEEDED" in await get_health_check_status(job_id)
+            assert await get_health_check_result(job_id) == "Health check result"
+            mock_client.call_mcp_api.assert_called_once_with(
+                "health/check",
+                method="POST",
+                forceweaver_api_key="fk_test_key",
+                org_id="test_org",
+                check_types=["basic_org_info", "sharing_model", "bundle_analysis"],
+                api_version="v64.0",
+            )
+
+    @pytest.mark.asyncio
+    async def test_failed_job_result_raises(self):
+        """Test fetching a failed job re-raises the backend error"""
+        from forceweaver_mcp_server.server import (
+            get_health_check_result,
+            jobs,
+            start_health_check,
+        )
+
+        with patch("forceweaver_mcp_server.server.client") as mock_client:
+            mock_client.call_mcp_api = AsyncMock(
+                side_effect=AuthenticationError("Authentication Failed")
+            )
+
+            started = await start_health_check(
+                forceweaver_api_key="fk_test_key", salesforce_org_id="test_org"
+            )
+            job_id = started.split("Job ID: ")[1].split("\n")[0]
+            await asyncio.gather(jobs.get(job_id).task, return_exceptions=True)
+
+            with pytest.raises(AuthenticationError):
+                await get_health_check_result(job_id)
+
+    @pytest.mark.asyncio
+    async def test_org_resolved_inside_job(self):
+        """Test a slow orgs/list doesn't delay the job ID and bad orgs fail the job"""
+        from forceweaver_mcp_server.orgs import OrgDirectory
+        from forceweaver_mcp_server.server import jobs, start_health_check
+
+        async def slow_fetch(api_key):
+            await asyncio.sleep(0.2)
+            return {"orgs": [{"id": "00D000000000001EAA", "name": "Acme"}]}
+
+        directory = OrgDirectory(slow_fetch)
+        with (
+            patch("forceweaver_mcp_server.server.client") as mock_client,
+            patch("forceweaver_mcp_server.server.org_directory", directory),
+        ):
+            mock_client.call_mcp_api = AsyncMock(return_value="Health check result")
+
+            started = time.monotonic()
+            acme = await start_health_check(
+                forceweaver_api_key="fk_test_key", salesforce_org_id="Acme"
+            )
+            assert time.monotonic() - started < 0.1
+            unknown = await start_health_check(
+                forceweaver_api_key="fk_test_key", salesforce_org_id="Globex"
+            )
+
+            acme_job = jobs.get(acme.split("Job ID: ")[1].split("\n")[0])
+            unknown_job = jobs.get(unknown.split("Job ID: ")[1].split("\n")[0])
+            assert acme_job.status == RUNNING
+            await asyncio.gather(
+                acme_job.task, unknown_job.task, return_exceptions=True
+            )
+
+            assert acme_job.status == SUCCEEDED
+            assert acme_job.org_id == "00D000000000001EAA"
+            assert unknown_job.status == FAILED
+            assert isinstance(unknown_job.error, ValidationError)
+            mock_client.call_mcp_api.assert_awaited_once()
+        await directory.close()
+
+    @pytest.mark.asyncio
+    async def test_start_health_check_missing_credentials(self):
+        """Test credential errors surface immediately, not in the job"""
+        from forceweaver_mcp_server.server import start_health_check
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            await start_health_check()
+
+        assert "API key is missing" in str(exc_info.value)
@@ -0,0 +1,150 @@
+"""
+Test suite for ForceWeaver structured result models
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from forceweaver_mcp_server.exceptions import ValidationError
+from forceweaver_mcp_server.models import HealthCheckReport
+
+SAMPLE_RESPONSE = {
+    "success": True,
+    "org_id": "00D5g000004ABCDEAA",
+    "org_name": "Acme Production",
+    "timestamp": "2025-01-05T10:00:00Z",
+    "formatted_output": "A long markdown report " * 100,
+    "summary": {
+        "overall_score": 88,
+        "execution_time_ms": 1200,
+        "cost_cents": 3,
+        "checks_performed": 2,
+    },
+    "results": {
+        "results": {
+            "bundle_analysis": {
+                "status": "healthy",
+                "score": 100,
+                "details": ["No issues found"],
+            },
+            "sharing_model": {"status": "warning", "score": 76},
+        }
+    },
+}
+
+
+class TestHealthCheckReport:
+    """Test cases for the structured health check report"""
+
+    def test_from_response(self):
+        """Test scores, grade and checks are extracted from the response"""
+        report = HealthCheckReport.from_response(SAMPLE_RESPONSE)
+
+        assert report.overall_score == 88
+        assert report.grade == "A"
+        assert [check.check_type for check in report.checks] == [
+            "bundle_analysis",
+            "sharing_model",
+        ]
+        assert report.checks[0].details == ("No issues found",)
+
+    def test_to_dict_is_compact(self):
+        """Test the rendered report drops backend formatting"""
+        data = HealthCheckReport.from_response(SAMPLE_RESPONSE).to_dict()
+
+        assert "formatted_output" not in data
+        assert data["cost_cents"] == 3
+        assert data["checks"]["bundle_analysis"] == {
+            "status": "healthy",
+            "score": 100,
+            "details": ["No issues found"],
+        }
+
+    def test_summary_only_and_fields(self):
+        """Test summary and field projections"""
+        report = HealthCheckReport.from_response(SAMPLE_RESPONSE)
+
+        summary = report.to_dict(summary_only=True)
+        assert summary["checks"]["bundle_analysis"] == {
+            "status": "healthy",
+            "score": 100,
+        }
+        assert report.to_dict(fields=["overall_score", "grade"]) == {
+            "overall_score": 88,
+            "grade": "A",
+        }
+
+    def test_unknown_field(self):
+        """Test unknown projection fields are rejected"""
+        report = HealthCheckReport.from_response(SAMPLE_RESPONSE)
+
+        with pytest.raises(ValidationError):
+            report.to_dict(fields=["formatted_output"])
+
+    def test_missing_sections(self):
+        """Test sparse responses still produce a report"""
+        data = HealthCheckReport.from_response({"success": True}).to_dict()
+
+        assert data == {"overall_score": 0, "grade": "F", "checks": {}}
+
+
+class TestHealthReportTool:
+    """Test cases for the structured health report tool"""
+
+    @pytest.mark.asyncio
+    async def test_health_report_tool(self):
+        """Test the tool fetches raw JSON and returns the compact report"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_report
+
+        with (
+            patch("forceweaver_mcp_server.server.client") as mock_client,
+            patch("forceweaver_mcp_server.server.org_directory") as mock_directory,
+        ):
+            mock_client.call_mcp_api_json = AsyncMock(return_value=SAMPLE_RESPONSE)
+            mock_directory.resolve = AsyncMock(side_effect=lambda key, org: org)
+
+            result = await revenue_cloud_health_report(
+                forceweaver_api_key="fk_test_key",
+                salesforce_org_id="test_org",
+                fields=["overall_score", "checks"],
+                summary_only=True,
+            )
+
+            assert result == {
+                "overall_score": 88,
+                "checks": {
+                    "bundle_analysis": {"status": "healthy", "score": 100},
+                    "sharing_model": {"status": "warning", "score": 76},
+                },
+            }
+            mock_client.call_mcp_api_json.assert_called_once_with(
+                "health/check",
+                "POST",
+                forceweaver_api_key="fk_test_key",
+                org_id="test_org",
+                check_types=["basic_org_info", "sharing_model", "bundle_analysis"],
+                api_version="v64.0",
+            )
+
+    @pytest.mark.asyncio
+    async def test_unknown_fields_rejected_before_call(self):
+        """Test bad field names fail before the health check is sent"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_report
+
+        with (
+            patch("forceweaver_mcp_server.server.client") as mock_client,
+            patch("forceweaver_mcp_server.server.org_directory") as mock_directory,
+        ):
+            mock_client.call_mcp_api_json = AsyncMock(return_value=SAMPLE_RESPONSE)
+            mock_directory.resolve = AsyncMock(side_effect=lambda key, org: org)
+
+            with pytest.raises(ValidationError):
+                await revenue_cloud_health_report(
+                    forceweaver_api_key="fk_test_key",
+                    salesforce_org_id="test_org",
+                    fields=["bogus"],
+                )
+
+            mock_client.call_mcp_api_json.assert_not_called()
+            mock_directory.resolve.assert_not_called()
@@ -0,0 +1,217 @@
+"""
+Test suite for the ForceWeaver connected-org index
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.exceptions import ConnectionError, ValidationError
+from forceweaver_mcp_server.orgs import (
+    OrgDirectory,
+    OrgIndex,
+    looks_like_org_id,
+    parse_orgs,
+)
+
+PROD_ID = "00D5g000004ABCDEAA"
+SANDBOX_ID = "00D5g000004XYZ1EAA"
+ORGS_PAYLOAD = {
+    "success": True,
+    "orgs": [
+        {"org_id": PROD_ID, "org_name": "Acme Production", "aliases": ["prod"]},
+        {"org_id": SANDBOX_ID, "org_name": "Acme Sandbox", "alias": "uat"},
+        {"org_name": "Missing ID"},
+    ],
+}
+
+
+class TestOrgIndex:
+    """Test cases for org resolution"""
+
+    @pytest.fixture
+    def index(self):
+        return OrgIndex(parse_orgs(ORGS_PAYLOAD))
+
+    def test_parse_skips_records_without_id(self, index):
+        """Test records without an org ID are ignored"""
+        assert len(index) == 2
+
+    def test_resolve_by_id(self, index):
+        """Test 18-char, case-insensitive and 15-char ID lookups"""
+        assert index.resolve(PROD_ID).org_id == PROD_ID
+        assert index.resolve(PROD_ID.lower()).org_id == PROD_ID
+        assert index.resolve(PROD_ID[:15]).org_id == PROD_ID
+        assert PROD_ID[:15] in index
+
+    def test_resolve_by_name_and_alias(self, index):
+        """Test names and aliases resolve case-insensitively"""
+        assert index.resolve("acme production").org_id == PROD_ID
+        assert index.resolve("PROD").org_id == PROD_ID
+        assert index.resolve("uat").org_id == SANDBOX_ID
+
+    def test_resolve_by_prefix(self, index):
+        """Test unique prefixes resolve and shared ones are ambiguous"""
+        assert index.resolve("Acme S").org_id == SANDBOX_ID
+        assert index.resolve("00D5g000004X").org_id == SANDBOX_ID
+
+        with pytest.raises(ValidationError) as exc_info:
+            index.resolve("acme")
+        assert "Ambiguous" in str(exc_info.value)
+
+    def test_resolve_unknown(self, index):
+        """Test unknown orgs are rejected locally"""
+        with pytest.raises(ValidationError) as exc_info:
+            index.resolve("globex")
+        assert "Salesforce Org Not Found" in str(exc_info.value)
+
+    def test_looks_like_org_id(self):
+        """Test org ID shape detection"""
+        assert looks_like_org_id(PROD_ID)
+        assert looks_like_org_id(PROD_ID[:15])
+        assert not looks_like_org_id("test_org")
+
+
+class TestOrgDirectory:
+    """Test cases for the per-key org index cache"""
+
+    @pytest.mark.asyncio
+    async def test_name_lookup_loads_index_once(self):
+        """Test names load orgs/list once and then resolve locally"""
+        fetch = AsyncMock(return_value=ORGS_PAYLOAD)
+        directory = OrgDirectory(fetch)
+
+        assert await directory.resolve("fk_key", "prod") == PROD_ID
+        assert await directory.resolve("fk_key", "uat") == SANDBOX_ID
+        fetch.assert_awaited_once_with("fk_key")
+
+    @pytest.mark.asyncio
+    async def test_fresh_index_rejects_unknown_ids(self):
+        """Test well-formed but unknown IDs are rejected without a fetch"""
+        fetch = AsyncMock(return_value=ORGS_PAYLOAD)
+        directory = OrgDirectory(fetch)
+        await directory.refresh("fk_key")
+
+        with pytest.raises(ValidationError):
+            await directory.resolve("fk_key", "00D000000000001")
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_org_id_does_not_wait_for_index(self):
+        """Test IDs pass straight through while the index loads in background"""
+        release = asyncio.Event()
+
+        async def slow_fetch(api_key):
+            await release.wait()
+            return ORGS_PAYLOAD
+
+        directory = OrgDirectory(slow_fetch)
+        assert await directory.resolve("fk_key", "00D000000000001") == (
+            "00D000000000001"
+        )
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert directory.is_fresh("fk_key")
+        await directory.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_passes_through(self):
+        """Test lookups fall back to the backend when orgs/list fails"""
+        fetch = AsyncMock(side_effect=RuntimeError("boom"))
+        directory = OrgDirectory(fetch)
+
+        assert await directory.resolve("fk_key", "prod") == "prod"
+        assert await directory.resolve("fk_key", "prod") == "prod"
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_client_fetches_raw_org_list(self):
+        """Test the client fetches orgs/list without the MCP format"""
+        client = ForceWeaverMCPClient()
+        with aioresponses() as m:
+            m.get(
+                "https://mcp.forceweaver.com/api/v1.0/orgs/list",
+                payload=ORGS_PAYLOAD,
+            )
+
+            result = await client.call_mcp_api_json(
+                "orgs/list", forceweaver_api_key="fk_test_key"
+            )
+
+        assert result == ORGS_PAYLOAD
+        await client.close()
+
+
+class TestOrgResolutionTools:
+    """Test cases for org resolution in MCP tools"""
+
+    @pytest.mark.asyncio
+    async def test_health_check_resolves_org_name(self):
+        """Test the health check tool sends the resolved org ID"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_check
+
+        directory = OrgDirectory(AsyncMock(return_value=ORGS_PAYLOAD))
+        with (
+            patch("forceweaver_mcp_server.server.client") as mock_client,
+            patch("forceweaver_mcp_server.server.org_directory", directory),
+        ):
+            mock_client.call_mcp_api = AsyncMock(return_value="Health check result")
+
+            await revenue_cloud_health_check(
+                forceweaver_api_key="fk_test_key", salesforce_org_id="Acme Prod"
+            )
+
+            assert mock_client.call_mcp_api.call_args.kwargs["org_id"] == PROD_ID
+
+    @pytest.mark.asyncio
+    async def test_health_check_rejects_unknown_org_locally(self):
+        """Test unknown orgs never reach the backend"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_check
+
+        directory = OrgDirectory(AsyncMock(return_value=ORGS_PAYLOAD))
+        with (
+            patch("forceweaver_mcp_server.server.client") as mock_client,
+            patch("forceweaver_mcp_server.server.org_directory", directory),
+        ):
+            mock_client.call_mcp_api = AsyncMock()
+
+            with pytest.raises(ValidationError):
+                await revenue_cloud_health_check(
+                    forceweaver_api_key="fk_test_key", salesforce_org_id="globex"
+                )
+
+            mock_client.call_mcp_api.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_name_resolution(self):
+        """Test timeout_seconds also bounds waiting on orgs/list for a name"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_check
+
+        async def slow_fetch(api_key):
+            await asyncio.sleep(5)
+            return ORGS_PAYLOAD
+
+        directory = OrgDirectory(slow_fetch)
+        with (
+            patch("forceweaver_mcp_server.server.client") as mock_client,
+            patch("forceweaver_mcp_server.server.org_directory", directory),
+        ):
+            mock_client.call_mcp_api = AsyncMock()
+
+            started = time.monotonic()
+            with pytest.raises(ConnectionError) as exc_info:
+                await revenue_cloud_health_check(
+                    forceweaver_api_key="fk_test_key",
+                    salesforce_org_id="Acme",
+                    timeout_seconds=0.2,
+                )
+
+            assert time.monotonic() - started < 1
+            assert "Request timeout" in str(exc_info.value)
+            mock_client.call_mcp_api.assert_not_called()
+        await directory.close()
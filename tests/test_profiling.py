@@ -0,0 +1,189 @@
+"""
+Test suite for ForceWeaver call profiling
+"""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.exceptions import ForceWeaverError, ValidationError
+from forceweaver_mcp_server.profiling import Profiler, current_profile, trace_config
+from forceweaver_mcp_server.transport import AiohttpTransport
+
+API = "https://mcp.forceweaver.com/api/v1.0"
+
+
+@pytest.fixture
+async def backend():
+    """Local stand-in for the ForceWeaver API"""
+
+    async def health_check(request):
+        return web.json_response({"success": True, "org_id": "00D123"})
+
+    app = web.Application()
+    app.router.add_post("/api/v1.0/health/check", health_check)
+    server = TestServer(app, host="localhost")
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+class TestProfiler:
+    """Test cases for the profiler"""
+
+    def test_invalid_settings(self):
+        """Test unknown profilers and sample rates are rejected"""
+        with pytest.raises(ValidationError):
+            Profiler(profiler="perf")
+        with pytest.raises(ValidationError):
+            Profiler(sample_rate=1.5)
+
+    def test_pyinstrument_required_for_its_captures(self):
+        """Test pyinstrument captures fail fast when it isn't installed"""
+        with patch.dict(sys.modules, {"pyinstrument": None}):
+            with pytest.raises(ForceWeaverError) as exc_info:
+                Profiler(sample_rate=0.1, profiler="pyinstrument")
+            Profiler(profiler="pyinstrument")
+
+        assert "pip install" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_keeps_slowest_calls(self):
+        """Test only the slowest calls are kept, slowest first"""
+        profiler = Profiler(slowest=2)
+
+        for delay in (0.03, 0.0, 0.05, 0.01):
+            async with profiler.profile(f"call/{delay}", "GET"):
+                await asyncio.sleep(delay)
+
+        diagnostics = profiler.diagnostics()
+        assert diagnostics["calls"] == 4
+        assert [call["endpoint"] for call in diagnostics["slowest"]] == [
+            "call/0.05",
+            "call/0.03",
+        ]
+        profiler.reset()
+        assert profiler.diagnostics()["slowest"] == []
+
+    @pytest.mark.asyncio
+    async def test_records_errors(self):
+        """Test failed calls are recorded with their error type"""
+        profiler = Profiler()
+
+        with pytest.raises(ForceWeaverError):
+            async with profiler.profile("health/check", "POST"):
+                assert current_profile() is not None
+                raise ForceWeaverError("boom")
+
+        assert current_profile() is None
+        assert profiler.diagnostics()["slowest"][0]["error"] == "ForceWeaverError"
+
+    @pytest.mark.asyncio
+    async def test_sampled_capture(self):
+        """Test sampled calls carry a cProfile capture"""
+        profiler = Profiler(sample_rate=1)
+
+        async with profiler.profile("health/check", "POST"):
+            sorted(range(1000))
+
+        [call] = profiler.diagnostics()["slowest"]
+        assert "function calls" in call["capture"]
+        assert profiler.captures == 1
+
+
+class TestClientProfiling:
+    """Test cases for profiling client calls"""
+
+    @pytest.mark.asyncio
+    async def test_records_call_phases(self):
+        """Test a health check records its phases and status"""
+        profiler = Profiler()
+        client = ForceWeaverMCPClient(profiler=profiler)
+
+        with aioresponses() as m:
+            m.post(
+                f"{API}/health/check?format=mcp",
+                payload={"success": True, "org_id": "00D123", "summary": {}},
+            )
+            await client.call_mcp_api("health/check", forceweaver_api_key="fk_test")
+        await client.close()
+
+        [call] = profiler.diagnostics()["slowest"]
+        assert call["endpoint"] == "health/check"
+        assert call["method"] == "POST"
+        assert call["status"] == 200
+        assert set(call["phases_ms"]) == {
+            "budget",
+            "ttfb",
+            "download",
+            "decode",
+            "format",
+        }
+        assert call["total_ms"] >= call["phases_ms"]["ttfb"]
+
+    @pytest.mark.asyncio
+    async def test_trace_config_times_connections(self, backend):
+        """Test aiohttp traces record DNS and connect for a new connection"""
+        profiler = Profiler()
+        client = ForceWeaverMCPClient(
+            api_base_url=str(backend.make_url("")),
+            transport=AiohttpTransport(
+                aiohttp.ClientTimeout(total=30), "ua", trace_configs=[trace_config()]
+            ),
+            profiler=profiler,
+        )
+
+        for _ in range(2):
+            await client.call_mcp_api_json(
+                "health/check", method="POST", forceweaver_api_key="fk_test"
+            )
+        await client.close()
+
+        # Only the first call opens a connection; the second reuses it
+        connected = [
+            call
+            for call in profiler.diagnostics()["slowest"]
+            if "connect" in call["phases_ms"]
+        ]
+        assert len(connected) == 1
+        assert "dns" in connected[0]["phases_ms"]
+
+
+class TestDiagnosticsTool:
+    """Test cases for the get_client_diagnostics tool"""
+
+    @pytest.mark.asyncio
+    async def test_profiling_disabled(self):
+        """Test the tool explains how to enable profiling"""
+        from forceweaver_mcp_server.server import get_client_diagnostics
+
+        with patch("forceweaver_mcp_server.server.client.profiler", None):
+            diagnostics = await get_client_diagnostics()
+
+        assert diagnostics["profiling"] is False
+        assert diagnostics["inflight_calls"] == 0
+        assert "FORCEWEAVER_PROFILE" in diagnostics["hint"]
+
+    @pytest.mark.asyncio
+    async def test_reports_and_resets(self):
+        """Test the tool reports recorded calls and can clear them"""
+        from forceweaver_mcp_server.server import get_client_diagnostics
+
+        profiler = Profiler()
+        async with profiler.profile("orgs/list", "GET"):
+            pass
+
+        with patch("forceweaver_mcp_server.server.client.profiler", profiler):
+            diagnostics = await get_client_diagnostics(reset=True)
+
+        assert diagnostics["profiling"] is True
+        assert diagnostics["calls"] == 1
+        assert diagnostics["slowest"][0]["endpoint"] == "orgs/list"
+        assert profiler.calls == 0
@@ -0,0 +1,259 @@
+"""
+Test suite for ForceWeaver scheduled sweeps and the result cache
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server.cache import ResultCache, cache_key
+from forceweaver_mcp_server.scheduler import SweepScheduler
+
+HEALTH_URL = "https://mcp.forceweaver.com/api/v1.0/health/check"
+
+
+class TestSweepScheduler:
+    """Test cases for background sweeps"""
+
+    @pytest.mark.asyncio
+    async def test_sweep_respects_concurrency(self):
+        """Test every org is checked with bounded concurrency"""
+        active = 0
+        peak = 0
+        checked = []
+
+        async def run_check(org_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            checked.append(org_id)
+            return 1.0
+
+        orgs = [f"org_{i}" for i in range(10)]
+        scheduler = SweepScheduler(
+            run_check, AsyncMock(return_value=orgs), interval=0.01, concurrency=3
+        )
+
+        stats = await scheduler.sweep()
+
+        assert sorted(checked) == sorted(orgs)
+        assert peak <= 3
+        assert stats.succeeded == 10
+        assert stats.cost_cents == 10.0
+
+    @pytest.mark.asyncio
+    async def test_sweep_respects_budget(self):
+        """Test no checks start once the cost budget would be exceeded"""
+        run_check = AsyncMock(return_value=3.0)
+        scheduler = SweepScheduler(
+            run_check,
+            AsyncMock(return_value=["a", "b", "c", "d"]),
+            interval=0,
+            concurrency=1,
+            budget_cents=7,
+            default_cost_cents=3,
+        )
+
+        stats = await scheduler.sweep()
+
+        assert stats.succeeded == 2
+        assert stats.skipped == 2
+        assert stats.cost_cents == 6.0
+        assert run_check.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sweep_counts_failures(self):
+        """Test a failing org does not stop the rest of the sweep"""
+
+        async def run_check(org_id):
+            if org_id == "bad":
+                raise RuntimeError("boom")
+            return 1.0
+
+        scheduler = SweepScheduler(
+            run_check, AsyncMock(return_value=["bad", "good"]), interval=0
+        )
+
+        stats = await scheduler.sweep()
+
+        assert stats.succeeded == 1
+        assert stats.failed == 1
+        assert stats.cost_cents == 1.0
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        """Test the loop sweeps repeatedly until stopped"""
+        run_check = AsyncMock(return_value=0.0)
+        scheduler = SweepScheduler(
+            run_check, AsyncMock(return_value=["a"]), interval=0.01, jitter=0
+        )
+
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+        assert not scheduler.running
+        assert run_check.await_count >= 2
+
+
+class TestResultCache:
+    """Test cases for the latest-result cache"""
+
+    def test_key_ignores_check_order(self):
+        """Test check type order does not change the key"""
+        assert cache_key("t", "org", ["b", "a"], "v64.0") == cache_key(
+            "t", "org", ["a", "b"], "v64.0"
+        )
+
+    def test_max_age_and_eviction(self):
+        """Test stale entries are ignored and the cache is bounded"""
+        cache = ResultCache(max_entries=2)
+        cache.put(cache_key("t", "a", [], "v64.0"), "report a")
+        cache.put(cache_key("t", "b", [], "v64.0"), "report b")
+        cache.put(cache_key("t", "c", [], "v64.0"), "report c")
+
+        assert len(cache) == 2
+        assert cache.get(cache_key("t", "a", [], "v64.0"), 60) is None
+        assert cache.get(cache_key("t", "c", [], "v64.0"), 60)[1] == "report c"
+        assert cache.get(cache_key("t", "c", [], "v64.0"), -1) is None
+
+
+class TestScheduledServer:
+    """Test cases for wiring sweeps into the server"""
+
+    @pytest.mark.asyncio
+    async def test_health_check_serves_fresh_result(self):
+        """Test max_age_seconds returns a cached result without a call"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_check
+
+        with (
+            patch("forceweaver_mcp_server.server.client") as mock_client,
+            patch("forceweaver_mcp_server.server.results", ResultCache()),
+        ):
+            mock_client.call_mcp_api = AsyncMock(return_value="Fresh result")
+            kwargs = {
+                "forceweaver_api_key": "fk_test_key",
+                "salesforce_org_id": "00D000000000001",
+            }
+
+            assert await revenue_cloud_health_check(**kwargs) == "Fresh result"
+            mock_client.call_mcp_api.return_value = "Newer result"
+
+            assert (
+                await revenue_cloud_health_check(**kwargs, max_age_seconds=60)
+                == "Fresh result"
+            )
+            assert await revenue_cloud_health_check(**kwargs) == "Newer result"
+            assert mock_client.call_mcp_api.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scheduled_check_caches_output(self):
+        """Test sweeps cache the same report interactive checks return"""
+        from forceweaver_mcp_server import ForceWeaverMCPClient
+        from forceweaver_mcp_server.analytics import tenant_key
+        from forceweaver_mcp_server.orgs import OrgDirectory
+        from forceweaver_mcp_server.server import (
+            _scheduled_check,
+            revenue_cloud_health_check,
+        )
+
+        org_id = "00D000000000001EAA"
+        payload = {
+            "success": True,
+            "org_id": org_id,
+            "summary": {"overall_score": 90, "cost_cents": 3},
+        }
+        cache = ResultCache()
+        client = ForceWeaverMCPClient()
+        directory = OrgDirectory(AsyncMock(return_value={"orgs": [{"id": org_id}]}))
+        with (
+            aioresponses() as m,
+            patch("forceweaver_mcp_server.server.client", client),
+            patch("forceweaver_mcp_server.server.results", cache),
+            patch("forceweaver_mcp_server.server.org_directory", directory),
+        ):
+            # Only the MCP format is mocked, so both calls must request it
+            m.post(f"{HEALTH_URL}?format=mcp", payload=payload, repeat=True)
+
+            cost = await _scheduled_check("fk_test_key", org_id)
+            key = cache_key(
+                tenant_key("fk_test_key"),
+                org_id,
+                ["basic_org_info", "sharing_model", "bundle_analysis"],
+                "v64.0",
+            )
+            scheduled = cache.get(key, 60)[1]
+            interactive = await revenue_cloud_health_check(
+                forceweaver_api_key="fk_test_key", salesforce_org_id=org_id
+            )
+        await client.close()
+        await directory.close()
+
+        assert cost == 3.0
+        assert scheduled == interactive
+
+    @pytest.mark.asyncio
+    @patch(
+        "forceweaver_mcp_server.server.SCHEDULE_ORGS",
+        "00D000000000001EAA, Nonexistent, Acme",
+    )
+    async def test_scheduled_orgs_skip_unknown(self):
+        """Test an unknown configured org is skipped, not fatal to the sweep"""
+        from forceweaver_mcp_server.orgs import OrgDirectory
+        from forceweaver_mcp_server.server import _scheduled_orgs
+
+        orgs = [
+            {"id": "00D000000000001EAA", "name": "Prod"},
+            {"id": "00D000000000002EAA", "name": "Acme"},
+        ]
+        directory = OrgDirectory(AsyncMock(return_value={"orgs": orgs}))
+        with patch("forceweaver_mcp_server.server.org_directory", directory):
+            org_ids = await _scheduled_orgs("fk_test_key")
+        await directory.close()
+
+        assert org_ids == ["00D000000000001EAA", "00D000000000002EAA"]
+
+    def test_scheduler_disabled_by_default(self):
+        """Test no scheduler is built without an interval"""
+        from forceweaver_mcp_server.server import _build_scheduler
+
+        assert _build_scheduler() is None
+
+    @patch.dict(os.environ, {"FORCEWEAVER_API_KEY": "fk_env_key"})
+    @patch("forceweaver_mcp_server.server.SCHEDULE_INTERVAL", 600)
+    def test_scheduler_built_from_config(self):
+        """Test the interval and API key enable the scheduler"""
+        from forceweaver_mcp_server.server import _build_scheduler
+
+        scheduler = _build_scheduler()
+
+        assert scheduler is not None
+        assert scheduler.interval == 600
+        assert scheduler.budget_cents is None
+
+    @patch("forceweaver_mcp_server.server.mcp")
+    @patch("forceweaver_mcp_server.server.sys.argv", ["server.py", "--http"])
+    def test_main_http_with_scheduler(self, mock_mcp):
+        """Test HTTP mode runs sweeps alongside the SSE server"""
+        from forceweaver_mcp_server.server import main
+
+        scheduler = SweepScheduler(AsyncMock(), AsyncMock(), interval=600)
+        scheduler.start = lambda: None
+        mock_mcp.run_sse_async = AsyncMock()
+
+        with (
+            patch(
+                "forceweaver_mcp_server.server._build_scheduler",
+                return_value=scheduler,
+            ),
+            patch("forceweaver_mcp_server.server.cleanup", AsyncMock()),
+        ):
+            main()
+
+        mock_mcp.run_sse_async.assert_awaited_once()
+        mock_mcp.run.assert_not_called()
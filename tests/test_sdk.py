@@ -0,0 +1,165 @@
+"""
+Test suite for the ForceWeaver Python SDK
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from forceweaver_mcp_server import (
+    AsyncForceWeaver,
+    ForceWeaver,
+    ForceWeaverMCPClient,
+    HealthCheckReport,
+)
+from forceweaver_mcp_server.exceptions import (
+    AuthenticationError,
+    ConnectionError,
+    ForceWeaverError,
+)
+
+API = "https://mcp.forceweaver.com/api/v1.0"
+PROD_ID = "00D000000000001EAA"
+DEV_ID = "00D000000000002EAA"
+ORGS = {
+    "orgs": [
+        {"org_id": PROD_ID, "org_name": "Acme Production"},
+        {"org_id": DEV_ID, "org_name": "Acme Dev"},
+    ]
+}
+
+
+def report_for(org_id, score=85):
+    """Raw health/check payload for an org"""
+    return {
+        "success": True,
+        "org_id": org_id,
+        "summary": {"overall_score": score, "checks_performed": 1, "cost_cents": 1},
+        "results": {"sharing_model": {"status": "ok", "score": score}},
+    }
+
+
+class TestAsyncForceWeaver:
+    """Test cases for the async SDK"""
+
+    @pytest.fixture
+    async def sdk(self):
+        """Create an SDK instance with a test key"""
+        sdk = AsyncForceWeaver(api_key="fk_test_key")
+        yield sdk
+        await sdk.close()
+
+    def test_requires_api_key(self, monkeypatch):
+        """Test a missing API key is rejected up front"""
+        monkeypatch.delenv("FORCEWEAVER_API_KEY", raising=False)
+
+        with pytest.raises(AuthenticationError):
+            AsyncForceWeaver()
+
+    @pytest.mark.asyncio
+    async def test_health_check_returns_report(self, sdk):
+        """Test health checks resolve org names and return typed reports"""
+        with aioresponses() as m:
+            m.get(f"{API}/orgs/list", payload=ORGS)
+            m.post(f"{API}/health/check", payload=report_for(PROD_ID, 92))
+
+            report = await sdk.health_check("Acme Production", ["Sharing_Model"])
+
+            body = next(
+                call
+                for (method, _), calls in m.requests.items()
+                if method == "POST"
+                for call in calls
+            ).kwargs["json"]
+
+        assert isinstance(report, HealthCheckReport)
+        assert report.grade == "A+"
+        assert report.checks[0].check_type == "sharing_model"
+        assert body["org_id"] == PROD_ID
+        assert body["check_types"] == ["sharing_model"]
+
+    @pytest.mark.asyncio
+    async def test_health_check_many_yields_failures(self, sdk):
+        """Test bulk checks yield every org, including failures"""
+        with aioresponses() as m:
+            m.get(f"{API}/orgs/list", payload=ORGS)
+            m.post(f"{API}/health/check", payload=report_for(PROD_ID))
+            m.post(f"{API}/health/check", status=404)
+
+            results = [
+                result async for result in sdk.health_check_many([PROD_ID, DEV_ID])
+            ]
+
+        assert len(results) == 2
+        assert sum(result.ok for result in results) == 1
+        failed = next(result for result in results if not result.ok)
+        assert isinstance(failed.error, ForceWeaverError)
+        assert failed.report is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_bounds_name_resolution(self, sdk):
+        """Test timeout also bounds a slow orgs/list, which keeps no deadline"""
+        remaining = []
+
+        async def slow_orgs(endpoint, **kwargs):
+            remaining.append(ForceWeaverMCPClient.remaining_time())
+            await asyncio.sleep(1)
+            return ORGS
+
+        sdk.client.call_mcp_api_json = slow_orgs
+
+        started = time.monotonic()
+        with pytest.raises(ConnectionError) as exc_info:
+            await sdk.health_check("Acme Production", timeout=0.1)
+
+        assert time.monotonic() - started < 0.5
+        assert "Request timeout" in str(exc_info.value)
+        assert remaining == [None]
+
+
+class TestForceWeaver:
+    """Test cases for the blocking SDK"""
+
+    def test_calls_run_on_background_loop(self):
+        """Test blocking calls reuse one loop thread and stop it on close"""
+        with aioresponses() as m:
+            m.get(f"{API}/orgs/list", payload=ORGS, repeat=True)
+            m.post(f"{API}/health/check", payload=report_for(PROD_ID), repeat=True)
+
+            with ForceWeaver(api_key="fk_test_key") as sdk:
+                thread = sdk._thread
+                assert thread.is_alive()
+                assert thread is not threading.current_thread()
+
+                assert sdk.health_check(PROD_ID).overall_score == 85
+                assert [org.org_id for org in sdk.list_orgs()] == [PROD_ID, DEV_ID]
+                results = list(sdk.health_check_many([PROD_ID, DEV_ID]))
+
+        assert [result.ok for result in results] == [True, True]
+        assert not thread.is_alive()
+
+    def test_health_check_many_stops_early(self):
+        """Test leaving the iterator early doesn't hang or leak the loop"""
+        with aioresponses() as m:
+            m.get(f"{API}/orgs/list", payload=ORGS, repeat=True)
+            m.post(f"{API}/health/check", payload=report_for(PROD_ID), repeat=True)
+
+            with ForceWeaver(api_key="fk_test_key", concurrency=1) as sdk:
+                for result in sdk.health_check_many([PROD_ID] * 10):
+                    assert result.ok
+                    break
+
+                assert sdk.health_check(PROD_ID).org_id == PROD_ID
+
+    def test_errors_raise_in_caller(self):
+        """Test backend errors surface in the calling thread"""
+        with aioresponses() as m:
+            m.get(f"{API}/orgs/list", payload=ORGS)
+            m.post(f"{API}/health/check", status=401)
+
+            with ForceWeaver(api_key="fk_test_key") as sdk:
+                with pytest.raises(AuthenticationError):
+                    sdk.health_check(PROD_ID)
@@ -8,12 +8,15 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from aioresponses import aioresponses
+from yarl import URL
 
 from forceweaver_mcp_server import ForceWeaverMCPClient
 from forceweaver_mcp_server.exceptions import (
     AuthenticationError,
     ConnectionError,
     ForceWeaverError,
+    ServiceUnavailableError,
+    ValidationError,
 )
 
 
@@ -252,6 +255,148 @@ class TestForceWeaverMCPClient:
         # Session should be None after cleanup
         assert client.session is None
 
+    @pytest.mark.asyncio
+    async def test_deadline_forwarded_to_backend(self, client):
+        """Test the remaining budget bounds the request and is sent as a header"""
+        url = "https://mcp.forceweaver.com/api/v1.0/health/check?format=mcp"
+        with aioresponses() as m:
+            m.post(url, payload={"formatted_output": "Test health check output"})
+
+            with client.deadline(5):
+                await client.call_mcp_api(
+                    "health/check", forceweaver_api_key="fk_test_key"
+                )
+
+            request = m.requests[("POST", URL(url))][0]
+            budget_ms = int(request.kwargs["headers"]["X-ForceWeaver-Timeout-Ms"])
+            assert 0 < budget_ms <= 5000
+            assert request.kwargs["timeout"].total <= 5
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_uses_default_timeout(self, client):
+        """Test calls without a deadline keep the client timeout"""
+        url = "https://mcp.forceweaver.com/api/v1.0/health/check?format=mcp"
+        with aioresponses() as m:
+            m.post(url, payload={"formatted_output": "Test health check output"})
+
+            await client.call_mcp_api("health/check", forceweaver_api_key="fk_key")
+
+            request = m.requests[("POST", URL(url))][0]
+            assert "X-ForceWeaver-Timeout-Ms" not in request.kwargs["headers"]
+            assert request.kwargs["timeout"] == client.timeout
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_skips_request(self, client):
+        """Test an exhausted budget fails without contacting the backend"""
+        with aioresponses() as m:
+            with client.deadline(0.001):
+                await asyncio.sleep(0.01)
+                with pytest.raises(ConnectionError) as exc_info:
+                    await client.call_mcp_api(
+                        "health/check", forceweaver_api_key="fk_test_key"
+                    )
+
+            assert "Request timeout" in str(exc_info.value)
+            assert not m.requests
+
+    def test_nested_deadline_only_shortens(self, client):
+        """Test inner deadlines cannot extend the outer budget"""
+        assert client.remaining_time() is None
+        with client.deadline(1):
+            with client.deadline(60):
+                assert client.remaining_time() <= 1
+        assert client.remaining_time() is None
+
+        with pytest.raises(ValidationError):
+            with client.deadline(0):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_shutdown_rejects_new_calls(self, client):
+        """Test calls are refused once shutdown has started"""
+        await client.shutdown(timeout=1)
+
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            await client.call_mcp_api("health/check", forceweaver_api_key="fk_key")
+
+        assert "shutting down" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_inflight_calls(self, client):
+        """Test shutdown waits for in-flight calls before closing"""
+        release = asyncio.Event()
+        hook = AsyncMock()
+        client.add_shutdown_hook(hook)
+
+        async def slow_call(*args):
+            await release.wait()
+            return "done"
+
+        with patch.object(client, "_call_mcp_api", side_effect=slow_call):
+            call = asyncio.create_task(
+                client.call_mcp_api("health/check", forceweaver_api_key="fk_key")
+            )
+            await asyncio.sleep(0)
+            assert client.inflight == 1
+
+            shutdown = asyncio.create_task(client.shutdown(timeout=5))
+            await asyncio.sleep(0)
+            assert not shutdown.done()
+            hook.assert_not_awaited()
+
+            release.set()
+            assert await call == "done"
+            await shutdown
+
+        assert client.inflight == 0
+        hook.assert_awaited_once()
+        assert client.session is None
+
+    @pytest.mark.asyncio
+    async def test_drain_deadline(self, client):
+        """Test drain gives up once the deadline passes"""
+        never = asyncio.Event()
+
+        async def stuck_call(*args):
+            await never.wait()
+
+        with patch.object(client, "_call_mcp_api", side_effect=stuck_call):
+            call = asyncio.create_task(
+                client.call_mcp_api("health/check", forceweaver_api_key="fk_key")
+            )
+            await asyncio.sleep(0)
+
+            assert await client.drain(timeout=0.01) is False
+
+            call.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await call
+
+        assert await client.drain(timeout=0.01) is True
+
+    @pytest.mark.asyncio
+    async def test_jobs_outlive_sessions(self):
+        """Test jobs keep running between sessions until the server exits"""
+        from forceweaver_mcp_server.server import _serve, client, jobs, lifespan, mcp
+
+        job = jobs.start(asyncio.sleep(10, result="report"))
+        try:
+            async with lifespan(mcp):
+                assert client.accepting is True
+            await asyncio.sleep(0)
+            assert not job.done
+
+            with patch("forceweaver_mcp_server.server.mcp") as mock_mcp:
+                mock_mcp.run_sse_async = AsyncMock()
+                await _serve("http")
+
+            mock_mcp.run_sse_async.assert_awaited_once()
+            assert job.task.cancelled()
+            assert len(jobs) == 0
+        finally:
+            job.task.cancel()
+            client.accepting = True
+
     @pytest.mark.asyncio
     @patch.dict(
         os.environ,
@@ -325,8 +470,11 @@ class TestMain:
         """Test main with stdio transport"""
         from forceweaver_mcp_server.server import main
 
-        main()
-        mock_mcp.run.assert_called_once_with(transport="stdio")
+        mock_mcp.run_stdio_async = AsyncMock()
+        with patch("forceweaver_mcp_server.server.cleanup", AsyncMock()) as cleanup:
+            main()
+        mock_mcp.run_stdio_async.assert_awaited_once()
+        cleanup.assert_awaited_once()
 
     @patch("forceweaver_mcp_server.server.mcp")
     @patch("forceweaver_mcp_server.server.sys.argv", ["server.py", "--http"])
@@ -334,8 +482,11 @@ class TestMain:
         """Test main with http transport"""
         from forceweaver_mcp_server.server import main
 
-        main()
-        mock_mcp.run.assert_called_once_with(transport="sse")
+        mock_mcp.run_sse_async = AsyncMock()
+        with patch("forceweaver_mcp_server.server.cleanup", AsyncMock()) as cleanup:
+            main()
+        mock_mcp.run_sse_async.assert_awaited_once()
+        cleanup.assert_awaited_once()
 
     @patch("forceweaver_mcp_server.server.mcp")
     @patch.dict(os.environ, {"MCP_TRANSPORT": "http", "MCP_PORT": "9000"})
@@ -344,8 +495,11 @@ class TestMain:
         """Test main with http transport from environment variables"""
         from forceweaver_mcp_server.server import main
 
-        main()
-        mock_mcp.run.assert_called_once_with(transport="sse")
+        mock_mcp.run_sse_async = AsyncMock()
+        with patch("forceweaver_mcp_server.server.cleanup", AsyncMock()) as cleanup:
+            main()
+        mock_mcp.run_sse_async.assert_awaited_once()
+        cleanup.assert_awaited_once()
 
     """Test cases for MCP tools"""
 
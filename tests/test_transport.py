@@ -0,0 +1,327 @@
+"""
+Test suite for ForceWeaver backend transports
+"""
+
+import asyncio
+import gc
+import json
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from forceweaver_mcp_server import ForceWeaverMCPClient
+from forceweaver_mcp_server.exceptions import (
+    AuthenticationError,
+    ConnectionError,
+    RateLimitError,
+    ValidationError,
+)
+from forceweaver_mcp_server.transport import (
+    AiohttpTransport,
+    HttpxTransport,
+    create_transport,
+    shared_connectors,
+    shared_httpx_ssl_context,
+    shared_ssl_context,
+)
+
+pytest.importorskip("httpx")
+
+
+@pytest.fixture
+async def backend():
+    """Local stand-in for the ForceWeaver API recording each request"""
+    seen = []
+    peers = set()
+
+    async def health_check(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        seen.append((request.headers.get("Authorization"), await request.json()))
+        org_id = (await request.json()).get("org_id")
+        if org_id == "slow":
+            await asyncio.sleep(1)
+        if org_id == "limited":
+            return web.json_response({}, status=429, headers={"Retry-After": "5"})
+        if request.headers["Authorization"] != "Bearer fk_test_key":
+            return web.json_response({}, status=401)
+        return web.json_response({"formatted_output": f"Report for {org_id}"})
+
+    app = web.Application()
+    app.router.add_post("/api/v1.0/health/check", health_check)
+    server = TestServer(app)
+    await server.start_server()
+    server.seen = seen
+    server.peers = peers
+    yield server
+    await server.close()
+
+
+class H2StandIn(asyncio.Protocol):
+    """Cleartext HTTP/2 server answering each request after a short delay"""
+
+    def __init__(self, server):
+        import h2.config
+        import h2.connection
+
+        self.server = server
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        self.bodies = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.peers.add(transport.get_extra_info("peername"))
+        self.conn.initiate_connection()
+        transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        import h2.events
+
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self.bodies[event.stream_id] = b""
+            elif isinstance(event, h2.events.DataReceived):
+                self.bodies[event.stream_id] += event.data
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                self.server.streams += 1
+                asyncio.get_running_loop().call_later(
+                    0.05, self.respond, event.stream_id
+                )
+        self.transport.write(self.conn.data_to_send())
+
+    def respond(self, stream_id):
+        org_id = json.loads(self.bodies.pop(stream_id))["org_id"]
+        body = json.dumps({"formatted_output": f"Report for {org_id}"}).encode()
+        self.conn.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(body))),
+            ],
+        )
+        self.conn.send_data(stream_id, body, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+@pytest.fixture
+async def h2_backend():
+    """Local HTTP/2-only stand-in counting connections and streams"""
+    pytest.importorskip("h2")
+    server = SimpleNamespace(peers=set(), streams=0)
+    listener = await asyncio.get_running_loop().create_server(
+        lambda: H2StandIn(server), "127.0.0.1", 0
+    )
+    port = listener.sockets[0].getsockname()[1]
+    server.url = f"http://127.0.0.1:{port}"
+    yield server
+    listener.close()
+    await listener.wait_closed()
+
+
+@pytest.fixture
+async def client(backend):
+    """Client calling the stand-in over the httpx transport"""
+    client = ForceWeaverMCPClient(
+        api_base_url=str(backend.make_url("")),
+        transport=HttpxTransport(timeout=120, user_agent="test", http2=False),
+    )
+    yield client
+    await client.close()
+
+
+class TestTransports:
+    """Test cases for transport selection and the httpx transport"""
+
+    def test_create_transport(self):
+        """Test transports are selected by name"""
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        assert isinstance(create_transport("aiohttp", timeout, "ua"), AiohttpTransport)
+        transport = create_transport("http2", timeout, "ua")
+        assert isinstance(transport, HttpxTransport)
+        assert transport.timeout == 30
+        with pytest.raises(ValidationError):
+            create_transport("carrier-pigeon", timeout, "ua")
+
+    @pytest.mark.asyncio
+    async def test_call_over_httpx(self, client, backend):
+        """Test a call goes through the httpx transport with key and body"""
+        output = await client.call_mcp_api(
+            "health/check", forceweaver_api_key="fk_test_key", org_id="00D123"
+        )
+
+        assert output == "Report for 00D123"
+        assert backend.seen == [("Bearer fk_test_key", {"org_id": "00D123"})]
+        assert client.session is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_client(self, client, backend):
+        """Test concurrent calls reuse one pooled httpx client"""
+        outputs = await asyncio.gather(
+            *(
+                client.call_mcp_api(
+                    "health/check", forceweaver_api_key="fk_test_key", org_id=str(i)
+                )
+                for i in range(20)
+            )
+        )
+
+        assert sorted(outputs) == sorted(f"Report for {i}" for i in range(20))
+        assert len(backend.seen) == 20
+
+    @pytest.mark.asyncio
+    async def test_http2_multiplexes_one_connection(self, h2_backend):
+        """Test concurrent calls share a single HTTP/2 connection"""
+        # Prior knowledge, since cleartext servers can't negotiate via ALPN
+        client = ForceWeaverMCPClient(
+            api_base_url=h2_backend.url,
+            transport=HttpxTransport(timeout=30, user_agent="test", http1=False),
+        )
+        try:
+            outputs = await asyncio.gather(
+                *(
+                    client.call_mcp_api(
+                        "health/check", forceweaver_api_key="fk_test_key", org_id=str(i)
+                    )
+                    for i in range(10)
+                )
+            )
+        finally:
+            await client.close()
+
+        assert sorted(outputs) == sorted(f"Report for {i}" for i in range(10))
+        assert h2_backend.streams == 10
+        assert len(h2_backend.peers) == 1
+
+    @pytest.mark.asyncio
+    async def test_status_errors(self, client):
+        """Test HTTP error statuses map to the same exceptions as aiohttp"""
+        with pytest.raises(AuthenticationError):
+            await client.call_mcp_api(
+                "health/check", forceweaver_api_key="fk_bad_key", org_id="00D123"
+            )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await client.call_mcp_api(
+                "health/check", forceweaver_api_key="fk_test_key", org_id="limited"
+            )
+        assert exc_info.value.retry_after == 5
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, client):
+        """Test httpx timeouts surface as request timeouts"""
+        with pytest.raises(ConnectionError) as exc_info:
+            with ForceWeaverMCPClient.deadline(0.1):
+                await client.call_mcp_api(
+                    "health/check", forceweaver_api_key="fk_test_key", org_id="slow"
+                )
+
+        assert "Request timeout" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_connection_refused(self, client, backend):
+        """Test transport failures surface as connection errors"""
+        await backend.close()
+
+        with pytest.raises(ConnectionError) as exc_info:
+            await client.call_mcp_api(
+                "health/check", forceweaver_api_key="fk_test_key", org_id="00D123"
+            )
+
+        assert "Connection error" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_close_reopens(self, client):
+        """Test the transport reopens its pool after close"""
+        await client.call_mcp_api(
+            "health/check", forceweaver_api_key="fk_test_key", org_id="1"
+        )
+        await client.close()
+
+        output = await client.call_mcp_api(
+            "health/check", forceweaver_api_key="fk_test_key", org_id="2"
+        )
+
+        assert output == "Report for 2"
+
+
+class TestSharedConnections:
+    """Test cases for the shared SSL context and connector"""
+
+    def test_ssl_context_cached(self):
+        """Test the CA bundle is loaded once per kind of context"""
+        assert shared_ssl_context() is shared_ssl_context()
+        assert shared_httpx_ssl_context() is shared_httpx_ssl_context()
+        # httpx mutates ALPN settings, so HTTP/2 gets its own context
+        assert shared_httpx_ssl_context() is not shared_ssl_context()
+
+    @pytest.mark.asyncio
+    async def test_connector_refcounted(self):
+        """Test shared transports use one connector closed by the last user"""
+        timeout = aiohttp.ClientTimeout(total=30)
+        first = AiohttpTransport(timeout, "ua", shared=True)
+        second = AiohttpTransport(timeout, "ua", shared=True)
+
+        connector = (await first.get_session()).connector
+        assert (await second.get_session()).connector is connector
+        assert shared_connectors.refs() == 2
+
+        await first.close()
+        assert not connector.closed
+        assert shared_connectors.refs() == 1
+
+        await second.close()
+        assert connector.closed
+        assert shared_connectors.refs() == 0
+
+    def test_abandoned_loops_not_kept(self):
+        """Test a loop whose transports were never closed is not kept alive"""
+        registered = len(shared_connectors)
+        loop = asyncio.new_event_loop()
+        transport = AiohttpTransport(aiohttp.ClientTimeout(total=30), "ua", shared=True)
+
+        loop.run_until_complete(transport.get_session())
+        assert len(shared_connectors) == registered + 1
+
+        loop.close()
+        del loop, transport
+        gc.collect()
+
+        assert len(shared_connectors) == registered
+
+    @pytest.mark.asyncio
+    async def test_clients_reuse_connections(self, backend):
+        """Test a new client reuses a shared connection instead of reconnecting"""
+        url = str(backend.make_url(""))
+        clients = [
+            ForceWeaverMCPClient(
+                api_base_url=url,
+                transport=create_transport(
+                    "aiohttp",
+                    aiohttp.ClientTimeout(total=30),
+                    "ua",
+                    shared_connector=True,
+                ),
+            )
+            for _ in range(3)
+        ]
+
+        try:
+            for i, client in enumerate(clients):
+                await client.call_mcp_api(
+                    "health/check", forceweaver_api_key="fk_test_key", org_id=str(i)
+                )
+        finally:
+            for client in clients:
+                await client.close()
+
+        assert len(backend.seen) == 3
+        assert len(backend.peers) == 1
@@ -0,0 +1,108 @@
+"""
+Test suite for ForceWeaver tool input validation
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from forceweaver_mcp_server.exceptions import ValidationError
+from forceweaver_mcp_server.validation import (
+    ValidationCatalog,
+    validate_org_reference,
+)
+
+
+class TestValidationCatalog:
+    """Test cases for check type and API version validation"""
+
+    @pytest.fixture
+    def catalog(self):
+        return ValidationCatalog()
+
+    def test_check_types_are_canonicalized(self, catalog):
+        """Test check types are lower-cased, deduplicated and sorted"""
+        assert catalog.normalize_check_types(
+            ["Sharing_Model", "bundle_analysis ", "sharing_model"]
+        ) == ["bundle_analysis", "sharing_model"]
+
+    def test_unknown_check_type(self, catalog):
+        """Test unsupported check types are rejected"""
+        with pytest.raises(ValidationError) as exc_info:
+            catalog.normalize_check_types(["bundle_analysis", "everything"])
+
+        assert "Unsupported check type(s): everything." in str(exc_info.value)
+
+    def test_empty_check_types(self, catalog):
+        """Test blank check type lists are rejected"""
+        with pytest.raises(ValidationError):
+            catalog.normalize_check_types([" "])
+
+    @pytest.mark.parametrize("version", ["v64.0", "64.0", "V64", "64"])
+    def test_api_version_forms(self, catalog, version):
+        """Test accepted API version spellings normalize to vNN.0"""
+        assert catalog.normalize_api_version(version) == "v64.0"
+
+    @pytest.mark.parametrize("version", ["latest", "v64.1", "6", ""])
+    def test_malformed_api_version(self, catalog, version):
+        """Test malformed API versions are rejected"""
+        with pytest.raises(ValidationError):
+            catalog.normalize_api_version(version)
+
+    def test_pinned_api_versions(self):
+        """Test a catalog can restrict the accepted API versions"""
+        catalog = ValidationCatalog(api_versions=["63.0", "v64.0", "bogus"])
+
+        assert catalog.normalize_api_version("63") == "v63.0"
+        with pytest.raises(ValidationError) as exc_info:
+            catalog.normalize_api_version("v62.0")
+        assert "v63.0, v64.0" in str(exc_info.value)
+
+    def test_org_reference(self):
+        """Test org references are stripped and malformed ones rejected"""
+        assert validate_org_reference("  Acme Prod ") == "Acme Prod"
+
+        for bad in ["   ", "a" * 256, "org\nid"]:
+            with pytest.raises(ValidationError):
+                validate_org_reference(bad)
+
+
+class TestToolValidation:
+    """Test cases for validation in MCP tools"""
+
+    @pytest.mark.asyncio
+    async def test_invalid_check_type_never_reaches_backend(self):
+        """Test bad check types fail before any network call"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_check
+
+        with patch("forceweaver_mcp_server.server.client") as mock_client:
+            mock_client.call_mcp_api = AsyncMock()
+
+            with pytest.raises(ValidationError):
+                await revenue_cloud_health_check(
+                    forceweaver_api_key="fk_test_key",
+                    salesforce_org_id="00D000000000001",
+                    check_types=["not_a_check"],
+                )
+
+            mock_client.call_mcp_api.assert_not_called()
+            mock_client.call_mcp_api_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_health_check_sends_canonical_inputs(self):
+        """Test the backend receives canonical check types and API version"""
+        from forceweaver_mcp_server.server import revenue_cloud_health_check
+
+        with patch("forceweaver_mcp_server.server.client") as mock_client:
+            mock_client.call_mcp_api = AsyncMock(return_value="Health check result")
+
+            await revenue_cloud_health_check(
+                forceweaver_api_key="fk_test_key",
+                salesforce_org_id="test_org",
+                check_types=["sharing_model", "Bundle_Analysis", "sharing_model"],
+                api_version="63",
+            )
+
+            kwargs = mock_client.call_mcp_api.call_args.kwargs
+            assert kwargs["check_types"] == ["bundle_analysis", "sharing_model"]
+            assert kwargs["api_version"] == "v63.0"